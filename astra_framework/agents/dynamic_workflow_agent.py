@@ -1,5 +1,6 @@
 from loguru import logger
-from typing import List, Callable, Dict, Any, Optional, Type
+from typing import List, Callable, Dict, Any, Optional, Type, Union
+import importlib
 import inspect
 import json
 from pydantic import BaseModel, ValidationError
@@ -8,12 +9,9 @@ from astra_framework.core.agent import BaseAgent
 from astra_framework.core.state import SessionState, ChatMessage
 from astra_framework.core.models import AgentResponse
 from astra_framework.services.ollama_client import OllamaClient
-from astra_framework.core.tool import ToolManager
+from astra_framework.core.tool import ToolManager, unpack_tool_call
 
 from astra_framework.agents.llm_agent import LLMAgent
-from astra_framework.agents.sequential_agent import SequentialAgent
-from astra_framework.agents.parallel_agent import ParallelAgent
-from astra_framework.agents.loop_agent import LoopAgent
 
 from astra_framework.core.workflow_models import AgentConfig, WorkflowPlan
 
@@ -23,16 +21,21 @@ class DynamicWorkflowAgent(LLMAgent):
     It takes a high-level user prompt, generates a structured workflow plan,
     and then instantiates and runs the agents defined in that plan.
     """
+    # The plan schema never changes, so generate it once for all instances.
+    _WORKFLOW_PLAN_SCHEMA = WorkflowPlan.model_json_schema()
+
     def __init__(self, agent_name: str, llm_client: OllamaClient, 
                  tools: List[Callable], instruction: str, 
                  output_structure: Optional[Type[BaseModel]] = WorkflowPlan,
                  keep_alive_state: bool = False):
         super().__init__(agent_name, llm_client, tools, instruction, output_structure, keep_alive_state)
-        self.available_agents = {
+        # Composite agent classes are given as "module:Class" paths and only
+        # imported when a plan first uses them.
+        self.available_agents: Dict[str, Union[str, Type[BaseAgent]]] = {
             "LLMAgent": LLMAgent,
-            "SequentialAgent": SequentialAgent,
-            "ParallelAgent": ParallelAgent,
-            "LoopAgent": LoopAgent,
+            "SequentialAgent": "astra_framework.agents.sequential_agent:SequentialAgent",
+            "ParallelAgent": "astra_framework.agents.parallel_agent:ParallelAgent",
+            "LoopAgent": "astra_framework.agents.loop_agent:LoopAgent",
         }
         self.available_tools = {tool.__name__: tool for tool in tools}
         self.available_output_structures = {}
@@ -52,18 +55,24 @@ class DynamicWorkflowAgent(LLMAgent):
             "function": {
                 "name": "create_workflow_plan",
                 "description": "Create a structured workflow plan to achieve the user's goal.",
-                "parameters": WorkflowPlan.model_json_schema(),
+                "parameters": self._WORKFLOW_PLAN_SCHEMA,
             },
         })
         return definitions
 
+    def _build_system_message(self) -> ChatMessage:
+        return ChatMessage(role="system", content=self.instruction)
+
+    def _build_tool_definitions(self) -> List[Dict[str, Any]]:
+        # The plan is returned through create_workflow_plan, not structured_output
+        return self._get_tool_definitions()
+
     async def execute(self, state: SessionState) -> AgentResponse:
         logger.info(f"--- Executing DynamicWorkflowAgent: {self.agent_name} ---")
 
-        instruction = self.instruction
-        tool_definitions = self._get_tool_definitions()
+        tool_definitions = self._tool_definitions
 
-        llm_history = [ChatMessage(role="system", content=instruction)] + state.history
+        llm_history = [*state.static_prefix, self._system_message, *state.history]
 
         logger.debug(f"[{self.agent_name}] Calling LLM to generate workflow plan...")
         llm_response = await self.llm.generate(
@@ -77,8 +86,7 @@ class DynamicWorkflowAgent(LLMAgent):
 
         try:
             tool_call = llm_response["message"]["tool_calls"][0]
-            func_name = tool_call.get("function", {}).get("name")
-            func_args = tool_call.get("function", {}).get("arguments", {})
+            func_name, func_args = unpack_tool_call(tool_call)
 
             if func_name != "create_workflow_plan":
                 logger.error(f"[{self.agent_name}] LLM called unexpected tool: {func_name}")
@@ -105,9 +113,18 @@ class DynamicWorkflowAgent(LLMAgent):
             logger.error(f"Error building or executing dynamic workflow: {e}")
             return AgentResponse(status="error", final_content=f"Failed to build or execute dynamic workflow: {e}")
 
+    def _resolve_agent_class(self, agent_type: str) -> Optional[Type[BaseAgent]]:
+        """Returns the agent class for a type, importing it on first use."""
+        agent_class = self.available_agents.get(agent_type)
+        if isinstance(agent_class, str):
+            module_path, class_name = agent_class.split(":")
+            agent_class = getattr(importlib.import_module(module_path), class_name)
+            self.available_agents[agent_type] = agent_class
+        return agent_class
+
     def _build_agent_from_config(self, agent_config: AgentConfig) -> BaseAgent:
         """Recursively builds an agent instance from its configuration."""
-        agent_class = self.available_agents.get(agent_config.agent_type)
+        agent_class = self._resolve_agent_class(agent_config.agent_type)
         if not agent_class:
             raise ValueError(f"Unknown agent type: {agent_config.agent_type}")
 
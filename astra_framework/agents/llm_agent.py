@@ -1,114 +1,107 @@
 from loguru import logger
 from typing import List, Callable, Dict, Any, Optional, Type
-import inspect
-import json
+import time
+import orjson
 from pydantic import BaseModel
 from astra_framework.core.agent import BaseAgent
-from astra_framework.core.state import SessionState, ChatMessage
+from astra_framework.core.state import SessionState, ChatMessage, LOG_PREVIEW_CHARS
 from astra_framework.core.models import AgentResponse
 from astra_framework.services.ollama_client import OllamaClient
-from astra_framework.core.tool import ToolManager
+from astra_framework.core.tool import ToolManager, unpack_tool_call
+
+# Key in SessionState.data holding results of @cacheable tools for the session
+TOOL_CACHE_KEY = "_tool_cache"
 
 class LLMAgent(BaseAgent):
     """The main 'thinking' agent, implementing the ReACT loop."""
     
     def __init__(self, agent_name: str, llm_client: OllamaClient, 
                  tools: List[Callable], instruction: str, 
-                 output_structure: Optional[Type[BaseModel]] = None, keep_alive_state: bool = False):
+                 output_structure: Optional[Type[BaseModel]] = None, keep_alive_state: bool = False,
+                 tool_cache_ttl: Optional[float] = None):
         super().__init__(agent_name, output_structure, keep_alive_state=keep_alive_state)
         self.llm = llm_client
         self.instruction = instruction
+        # Seconds a cached @cacheable tool result stays valid; None never expires
+        self.tool_cache_ttl = tool_cache_ttl
         
         self.tool_manager = ToolManager()
         for tool_func in tools:
             self.tool_manager.register(tool_func)
+
+        # Tools and output_structure are fixed after init, so the definitions
+        # sent to the LLM are built once instead of on every turn.
+        self._tool_definitions = self._build_tool_definitions()
+        # The system prompt is frozen too, so every turn sends a byte-identical
+        # prefix that provider-side prompt caches can reuse.
+        self._system_message = self._build_system_message()
             
         logger.debug(f"LLMAgent '{agent_name}' initialized with tools: {[t.__name__ for t in tools]}")
 
+    def register_tool(self, tool_func: Callable):
+        """Registers an additional tool and rebuilds the cached tool definitions."""
+        self.tool_manager.register(tool_func)
+        self._tool_definitions = self._build_tool_definitions()
+
+    def _build_system_message(self) -> ChatMessage:
+        """Builds the system message, including the structured output 
+        instruction when an output_structure is set.
+        """
+        instruction = self.instruction
+        if self.output_structure:
+            instruction += "\n\nYour final answer MUST be in the format of the 'structured_output' tool."
+        return ChatMessage(role="system", content=instruction)
+
+    def _build_tool_definitions(self) -> List[Dict[str, Any]]:
+        """Builds the full list of tool definitions, including the 
+        structured_output tool when an output_structure is set.
+        """
+        tool_definitions = self._get_tool_definitions()
+        if self.output_structure:
+            tool_definitions.append(self._get_structured_output_tool())
+        return tool_definitions
+
     def _get_tool_definitions(self) -> List[Dict[str, Any]]:
         """
-        Generates JSON Schema definitions for the agent's tools.
+        Returns JSON Schema definitions for the agent's tools.
         This is used to inform the LLM about the available tools and their parameters.
         """
-        definitions = []
-        for tool_name, tool_func in self.tool_manager.tools.items():
-            definitions.append(self._create_tool_definition(tool_name, tool_func))
-        return definitions
-
-    def _create_tool_definition(self, tool_name: str, tool_func: Callable) -> Dict[str, Any]:
-        """Creates a JSON Schema definition for a single tool."""
-        sig = inspect.signature(tool_func)
-        docstring = inspect.getdoc(tool_func)
-        
-        description = ""
-        if docstring:
-            description = docstring.split('\n')[0]
-
-        parameters = self._create_tool_parameters(sig)
-
-        return {
-            "type": "function",
-            "function": {
-                "name": tool_name,
-                "description": description,
-                "parameters": parameters,
-            },
-        }
-
-    def _create_tool_parameters(self, sig: inspect.Signature) -> Dict[str, Any]:
-        """Creates the JSON Schema parameters for a tool's signature."""
-        parameters = {
-            "type": "object",
-            "properties": {},
-            "required": [],
-        }
-        
-        for name, param in sig.parameters.items():
-            param_type = self._get_param_type(param)
-            
-            parameters["properties"][name] = {
-                "type": param_type,
-                "description": f"Parameter '{name}' for the tool.",
-            }
-            if param.default == inspect.Parameter.empty:
-                parameters["required"].append(name)
-        
-        return parameters
-
-    def _get_param_type(self, param: inspect.Parameter) -> str:
-        """Returns the JSON schema type for a given parameter."""
-        if param.annotation is int:
-            return "integer"
-        if param.annotation is float:
-            return "number"
-        if param.annotation is bool:
-            return "boolean"
-        return "string"
+        # A copy, as the manager's list is shared and subclasses append to it
+        return list(self.tool_manager.get_tool_definitions())
 
     async def execute(self, state: SessionState) -> AgentResponse:
         """Executes the agent's logic."""
         logger.info(f"--- Executing LLMAgent: {self.agent_name} ---")
         
-        instruction = self.instruction
-        tool_definitions = self._get_tool_definitions()
-
-        if self.output_structure:
-            instruction, tool_definitions = self._add_structured_output_tool(instruction, tool_definitions)
-
-        llm_history = [ChatMessage(role="system", content=instruction)] + state.history
-
-        logger.debug(f"[{self.agent_name}] Calling LLM with tools...")
-        llm_response = await self.llm.generate(
-            llm_history, 
-            tool_definitions
-        )
+        tool_definitions = self._tool_definitions
+        # Built once per execute and grown in place as tool rounds add messages
+        llm_history = [*state.static_prefix, self._system_message]
+        llm_history.extend(state.history)
+
+        while True:
+            synced_len = len(state.history)
+
+            logger.debug(f"[{self.agent_name}] Calling LLM with tools...")
+            llm_response = await self.llm.generate(
+                llm_history, 
+                tool_definitions
+            )
+
+            if isinstance(llm_response, dict) and "tool_calls" in llm_response:
+                response = await self._handle_tool_calls(state, llm_response)
+                if response:
+                    return response
+                # Mirror the messages the tool calls added to the state
+                llm_history.extend(state.history[synced_len:])
+                logger.debug(f"[{self.agent_name}] Re-running after tool call(s)...")
+                continue
 
-        return await self._handle_llm_response(state, llm_response)
+            return self._handle_llm_response(state, llm_response)
 
-    def _add_structured_output_tool(self, instruction: str, tool_definitions: List[Dict[str, Any]]) -> (str, List[Dict[str, Any]]):
-        """Adds the structured_output tool to the list of tool definitions."""
+    def _get_structured_output_tool(self) -> Dict[str, Any]:
+        """Returns the structured_output tool definition for the output_structure."""
         schema = self.output_structure.model_json_schema()
-        structured_output_tool = {
+        return {
             "type": "function",
             "function": {
                 "name": "structured_output",
@@ -116,28 +109,25 @@ class LLMAgent(BaseAgent):
                 "parameters": schema,
             },
         }
-        tool_definitions.append(structured_output_tool)
-        instruction += "\n\nYour final answer MUST be in the format of the 'structured_output' tool."
-        return instruction, tool_definitions
-
-    async def _handle_llm_response(self, state: SessionState, llm_response: Any) -> AgentResponse:
-        """Handles the response from the LLM."""
-        if isinstance(llm_response, dict) and "tool_calls" in llm_response:
-            return await self._handle_tool_calls(state, llm_response)
-        
+
+    def _handle_llm_response(self, state: SessionState, llm_response: Any) -> AgentResponse:
+        """Handles a final (non tool call) response from the LLM."""
         if isinstance(llm_response, str):
             return self._handle_string_response(state, llm_response)
         
         logger.error(f"[{self.agent_name}] Received invalid response from LLM: {llm_response}")
         return AgentResponse(status="error", final_content="Invalid LLM response.")
 
-    async def _handle_tool_calls(self, state: SessionState, llm_response: Dict[str, Any]) -> AgentResponse:
-        """Handles tool calls from the LLM."""
+    async def _handle_tool_calls(self, state: SessionState, llm_response: Dict[str, Any]) -> Optional[AgentResponse]:
+        """
+        Handles tool calls from the LLM. Returns the final response if the
+        LLM produced structured output, otherwise None so the caller can
+        run the next turn.
+        """
         logger.debug(f"[{self.agent_name}] Received tool_calls: {llm_response}")
         
         for tool_call in llm_response["tool_calls"]:
-            func_name = tool_call.get("function", {}).get("name")
-            func_args = tool_call.get("function", {}).get("arguments", {})
+            func_name, func_args = unpack_tool_call(tool_call)
 
             if not func_name:
                 logger.warning("LLM response contained empty tool call. Skipping.")
@@ -147,28 +137,50 @@ class LLMAgent(BaseAgent):
                 return self._handle_structured_output(state, func_args)
 
             await self._execute_tool(state, func_name, func_args)
-        
-        logger.debug(f"[{self.agent_name}] Re-running after tool call(s)...")
-        return await self.execute(state)
+
+        return None
 
     def _handle_structured_output(self, state: SessionState, func_args: Dict[str, Any]) -> AgentResponse:
         """Handles the structured_output tool call."""
         logger.success(f"[{self.agent_name}] Received structured output.")
-        structured_data = self.output_structure(**func_args)
+        structured_data = self._validate_python(func_args)
         state.add_message(role="agent", content=f"Structured output generated: {structured_data.model_dump_json()}")
         state.data["last_agent_response"] = structured_data
         return AgentResponse(status="success", final_content=structured_data)
 
     async def _execute_tool(self, state: SessionState, func_name: str, func_args: Dict[str, Any]):
         """Executes a tool and updates the state."""
-        logger.info(f"[{self.agent_name}] Parsed tool call. Name: {func_name}, Args: {func_args}")
-        state.add_message(role="agent", content=f"Calling tool: {func_name}({json.dumps(func_args)})")
+        logger.opt(lazy=True).info(
+            "[{}] Parsed tool call. Name: {}, Args: {}",
+            lambda: self.agent_name, lambda: func_name, lambda: str(func_args)[:LOG_PREVIEW_CHARS]
+        )
+        state.add_message(role="agent", content=f"Calling tool: {func_name}({orjson.dumps(func_args).decode()})")
         
-        tool_result = await self.tool_manager.execute_tool(func_name, **func_args)
+        tool_result = await self._run_tool(state, func_name, func_args)
         
         state.add_message(role="tool", content=str(tool_result))
         state.data["last_tool_result"] = tool_result
 
+    async def _run_tool(self, state: SessionState, func_name: str, func_args: Dict[str, Any]) -> Any:
+        """
+        Runs a tool. Results of tools marked @cacheable are stored per session
+        and reused when the same tool is called again with the same arguments.
+        """
+        tool_func = self.tool_manager.tools.get(func_name)
+        if not getattr(tool_func, "cacheable", False):
+            return await self.tool_manager.execute_tool(func_name, func_args)
+
+        cache = state.data.setdefault(TOOL_CACHE_KEY, {})
+        cache_key = f"{func_name}:{orjson.dumps(func_args, option=orjson.OPT_SORT_KEYS).decode()}"
+        cached = cache.get(cache_key)
+        if cached and (self.tool_cache_ttl is None or time.monotonic() - cached[0] < self.tool_cache_ttl):
+            logger.debug(f"[{self.agent_name}] Reusing cached result for tool '{func_name}'.")
+            return cached[1]
+
+        tool_result = await self.tool_manager.execute_tool(func_name, func_args)
+        cache[cache_key] = (time.monotonic(), tool_result)
+        return tool_result
+
     def _handle_string_response(self, state: SessionState, llm_response: str) -> AgentResponse:
         """Handles a string response from the LLM."""
         logger.success(f"[{self.agent_name}] Received final response.")
@@ -31,8 +31,11 @@ class LoopAgent(BaseAgent):
         if not state.history:
             return AgentResponse(status="error", final_content="LoopAgent requires an initial prompt.")
         original_prompt = state.history[0].content
+        feedback_prefix = (f"Original request: {original_prompt}\n\n"
+                           "Please revise your work based on the following feedback: ")
         
         final_response = None
+        last_feedback = None
         loop_state = state
 
         for i in range(self.max_loops):
@@ -42,33 +45,41 @@ class LoopAgent(BaseAgent):
             response = await self.child.execute(loop_state)
             final_response = response
 
+            if response.status == "error":
+                logger.error(f"[{self.agent_name}] Child returned an error. Exiting loop.")
+                return final_response
+
             # The exit condition is checked on the state *after* the child has run
             if self.exit_condition and self.exit_condition(loop_state):
                 logger.success(f"[{self.agent_name}] Exit condition met. Exiting loop.")
                 return final_response # Return the successful response from the child
+
+            feedback = self._get_feedback(final_response)
+            if feedback == last_feedback:
+                logger.warning(f"[{self.agent_name}] Child output unchanged since last loop. Exiting without approval.")
+                break
+            last_feedback = feedback
             
             if i < self.max_loops - 1:
-                self._prepare_for_next_loop(loop_state, original_prompt, final_response)
+                self._prepare_for_next_loop(loop_state, feedback_prefix, feedback)
             else:
                 logger.warning(f"[{self.agent_name}] Max loops reached ({self.max_loops}). Exiting without approval.")
 
         logger.success(f"LoopAgent '{self.agent_name}' finished.")
         return final_response
 
-    def _prepare_for_next_loop(self, loop_state: SessionState, original_prompt: str, final_response: AgentResponse):
-        """Prepares the state for the next loop iteration."""
+    def _get_feedback(self, final_response: AgentResponse) -> str:
+        """Serializes the child's output for use as feedback."""
         last_agent_output = final_response.final_content
-        feedback = str(last_agent_output)
         if isinstance(last_agent_output, BaseModel):
-            feedback = last_agent_output.model_dump_json()
-        
+            return last_agent_output.model_dump_json()
+        return str(last_agent_output)
+
+    def _prepare_for_next_loop(self, loop_state: SessionState, feedback_prefix: str, feedback: str):
+        """Prepares the state for the next loop iteration."""
         logger.warning(f"[{self.agent_name}] Loop did not exit. Incorporating feedback for next iteration.")
         
         if not self.keep_alive_state:
-            # Clear history and add new prompt for the next iteration
+            # Clear history so the new prompt starts the next iteration
             loop_state.history.clear()
-            new_prompt = f"Original request: {original_prompt}\n\nPlease revise your work based on the following feedback: {feedback}"
-            loop_state.add_message(role="user", content=new_prompt)
-        else:
-            new_prompt = f"Original request: {original_prompt}\n\nPlease revise your work based on the following feedback: {feedback}"
-            loop_state.add_message(role="user", content=new_prompt)
+        loop_state.add_message(role="user", content=feedback_prefix + feedback)
@@ -1,31 +1,53 @@
 import asyncio
 from loguru import logger
-from typing import List, Any
-from copy import deepcopy
-from astra_framework.core.agent import BaseAgent
+from typing import List, Any, Optional
+from astra_framework.core.agent import BaseAgent, CompositeAgent
 from astra_framework.core.state import SessionState
 from astra_framework.core.models import AgentResponse
 
-class ParallelAgent(BaseAgent):
+class ParallelAgent(CompositeAgent):
     """
     (Composite Pattern)
     Executes a list of child agents in parallel and aggregates their responses.
-    Each child agent receives a deep copy of the state to ensure isolation
+    Each child agent receives a clone of the state to ensure isolation
     and prevent race conditions.
     """
-    def __init__(self, agent_name: str, children: List[BaseAgent], keep_alive_state: bool = False):
+    def __init__(self, agent_name: str, children: List[BaseAgent], keep_alive_state: bool = False,
+                 max_concurrency: Optional[int] = None):
+        """
+        Args:
+            max_concurrency: Optional cap on how many children run at once,
+                e.g. the LLM client's connection pool size. Unbounded if None.
+        """
         super().__init__(agent_name, keep_alive_state=keep_alive_state)
         self.children = children
+        self.max_concurrency = max_concurrency
         logger.debug(f"ParallelAgent '{agent_name}' initialized with {len(children)} children.")
 
     async def execute(self, state: SessionState) -> AgentResponse:
         """Executes the agent's logic."""
         logger.info(f"--- Executing ParallelAgent: {self.agent_name} ---")
 
-        # Create deep copies of the state for each child to run in isolation
-        tasks = [child.execute(deepcopy(state)) for child in self.children]
+        # A cap at or above the number of children never blocks, so skip the semaphore
+        max_concurrency = self.max_concurrency
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency and max_concurrency < len(self.children) else None
+
+        async def run_child(child: BaseAgent, child_state: SessionState) -> Any:
+            # Failures are returned rather than raised so one failing child
+            # doesn't cancel its siblings in the task group.
+            try:
+                if semaphore:
+                    async with semaphore:
+                        return await child.execute(child_state)
+                return await child.execute(child_state)
+            except Exception as e:
+                return e
+
+        # Clone the state for each child to run in isolation
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_child(child, state.clone())) for child in self.children]
         
-        child_responses = await asyncio.gather(*tasks, return_exceptions=True)
+        child_responses = [task.result() for task in tasks]
 
         aggregated_content = self._aggregate_responses(child_responses)
 
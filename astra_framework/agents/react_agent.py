@@ -1,18 +1,36 @@
 import asyncio
 import json
+import orjson
 from loguru import logger
 from typing import List, Callable, Optional, Type, Union, Dict, Any
 from pydantic import BaseModel
 
 from astra_framework.core.agent import BaseAgent
-from astra_framework.core.state import SessionState, ChatMessage
+from astra_framework.core.state import SessionState, ChatMessage, LOG_PREVIEW_CHARS
 from astra_framework.core.models import AgentResponse
 from astra_framework.services.base_client import BaseLLMClient
-from astra_framework.core.tool import ToolManager
+from astra_framework.core.tool import ToolManager, unpack_tool_call
 
 import re
 from typing import Tuple
 
+# Heuristics for final answer detection, each set matched in a single
+# case-insensitive pass
+_FINAL_ANSWER_RE = re.compile("|".join(map(re.escape, [
+    "final answer",
+    "in conclusion",
+    "to summarize",
+    "here is the",
+    "here's the"
+])), re.IGNORECASE)
+
+_NEEDS_TOOL_RE = re.compile("|".join(map(re.escape, [
+    "i need to",
+    "let me check",
+    "i should call",
+    "i'll use the"
+])), re.IGNORECASE)
+
 class ReActAgent(BaseAgent):
     """ReAct agent with support for extended thinking."""
     
@@ -24,13 +42,24 @@ class ReActAgent(BaseAgent):
                  max_iterations: int = 10,
                  output_structure: Optional[Type[BaseModel]] = None,
                  strip_thinking: bool = True,  # NEW
-                 thinking_tags: List[str] = None):  # NEW
+                 thinking_tags: List[str] = None,  # NEW
+                 parallel_tools: bool = True,
+                 speculative_tools: bool = False):
         super().__init__(agent_name, output_structure)
         self.llm = llm_client
         self.tool_manager = ToolManager(tools)
+        # Identical on every iteration, which keeps the prompt prefix stable
+        self._tool_defs = self.tool_manager.get_tool_definitions()
         self.instruction = instruction
+        self._system_message = ChatMessage(role="system", content=instruction)
         self.max_iterations = max_iterations
         self.strip_thinking = strip_thinking
+        # Run the tool calls of one LLM turn concurrently. Disable for tools
+        # that must run in the order the LLM requested them.
+        self.parallel_tools = parallel_tools
+        # Stream the LLM response and start each tool as soon as its call is
+        # complete, overlapping tool execution with the rest of the decode.
+        self.speculative_tools = speculative_tools
         # Support multiple thinking tag formats
         self.thinking_tags = thinking_tags or [
             ('think', 'think'),
@@ -38,6 +67,11 @@ class ReActAgent(BaseAgent):
             ('reasoning', 'reasoning'),
             ('internal', 'internal')
         ]
+        # Compiled once; _extract_thinking runs on every LLM response
+        self._thinking_patterns = [
+            re.compile(rf'<{open_tag}>(.*?)</{close_tag}>', re.DOTALL | re.IGNORECASE)
+            for open_tag, close_tag in self.thinking_tags
+        ]
     
     def _extract_thinking(self, content: str) -> Tuple[Optional[str], str]:
         """
@@ -48,21 +82,23 @@ class ReActAgent(BaseAgent):
         """
         if not self.strip_thinking or not content:
             return None, content
+
+        # Fast path: no tag can be present without a '<'
+        if '<' not in content:
+            return None, content.strip()
         
         thinking_content = None
         cleaned_content = content
         
-        # Try each thinking tag format
-        for open_tag, close_tag in self.thinking_tags:
-            # Match tags (case-insensitive, handle variations)
-            pattern = rf'<{open_tag}>(.*?)</{close_tag}>'
-            matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
+        # Try each thinking tag format (case-insensitive)
+        for pattern in self._thinking_patterns:
+            matches = pattern.findall(content)
             
             if matches:
                 # Extract all thinking blocks
                 thinking_content = '\n'.join(matches)
                 # Remove thinking tags from content
-                cleaned_content = re.sub(pattern, '', content, flags=re.DOTALL | re.IGNORECASE)
+                cleaned_content = pattern.sub('', content)
                 break
         
         # Clean up extra whitespace
@@ -79,18 +115,20 @@ class ReActAgent(BaseAgent):
         """Executes the ReAct loop with thinking support."""
         logger.info(f"--- Executing ReActAgent: {self.agent_name} ---")
 
-        system_message = ChatMessage(role="system", content=self.instruction)
-        initial_history_len = len(state.history)
-        execution_history = [system_message] + state.history.copy()
+        # Built in a single allocation; new turns are appended after the
+        # static prefix, the system message and the existing history.
+        execution_history = [*state.static_prefix, self._system_message, *state.history]
+        new_turns_start = len(execution_history)
 
         for iteration in range(self.max_iterations):
             logger.info(f"[{self.agent_name}] Iteration {iteration+1}/{self.max_iterations}")
 
             # 1. REASON: Get LLM decision
-            llm_response = await self.llm.generate(
-                execution_history,
-                tools=self.tool_manager.get_tool_definitions()
-            )
+            pending_tools = None
+            if self.speculative_tools:
+                llm_response, pending_tools = await self._generate_with_speculative_tools(execution_history)
+            else:
+                llm_response = await self.llm.generate(execution_history, self._tool_defs)
 
             # Parse response
             tool_calls = None
@@ -125,7 +163,7 @@ class ReActAgent(BaseAgent):
                         final_content = self._validate_structured_output(final_content)
                     
                     # Sync history (WITHOUT thinking tags)
-                    self._sync_history_to_state(state, execution_history, initial_history_len)
+                    self._sync_history_to_state(state, execution_history, new_turns_start)
                     state.add_message(role="assistant", content=final_content)
                     
                     logger.success(f"[{self.agent_name}] Task completed")
@@ -152,9 +190,18 @@ class ReActAgent(BaseAgent):
                     tool_calls=tool_calls
                 ))
 
-                # Execute each tool
-                for tool_call in tool_calls:
-                    await self._execute_single_tool(tool_call, execution_history)
+                # Execute the tools, keeping results in the requested order
+                if pending_tools:
+                    # Already started while the response was streaming
+                    execution_history.extend(await asyncio.gather(*pending_tools))
+                elif self.parallel_tools and len(tool_calls) > 1 and self._has_async_tool(tool_calls):
+                    tool_messages = await asyncio.gather(
+                        *(self._execute_single_tool(tool_call) for tool_call in tool_calls)
+                    )
+                    execution_history.extend(tool_messages)
+                else:
+                    for tool_call in tool_calls:
+                        execution_history.append(await self._execute_single_tool(tool_call))
 
         # Max iterations reached
         logger.warning(f"[{self.agent_name}] Max iterations reached")
@@ -164,7 +211,7 @@ class ReActAgent(BaseAgent):
         thinking, cleaned_final = self._extract_thinking(final_content)
         self._log_thinking(thinking)
         
-        self._sync_history_to_state(state, execution_history, initial_history_len)
+        self._sync_history_to_state(state, execution_history, new_turns_start)
         state.add_message(role="assistant", content=cleaned_final)
         
         return AgentResponse(
@@ -173,61 +220,96 @@ class ReActAgent(BaseAgent):
             metadata={"thinking": thinking} if thinking else None
         )
     
-    async def _execute_single_tool(self, tool_call: Dict, history: List[ChatMessage]):
-        """Execute a single tool and add result to history."""
-        function_name = tool_call.get("function", {}).get("name")
-        function_args = tool_call.get("function", {}).get("arguments", {})
+    async def _generate_with_speculative_tools(self, history: List[ChatMessage]) -> Tuple[Union[str, Dict[str, Any]], Optional[List[asyncio.Task]]]:
+        """
+        Streams the LLM response, dispatching each tool call as soon as it 
+        arrives. Returns the assembled response (in the same shape as 
+        `generate`) and the in-flight tool tasks, if any. Without 
+        `parallel_tools`, each call starts only after the previous one has 
+        finished, so the calls still run one at a time, in order.
+        """
+        content_parts = []
+        tool_calls = []
+        pending_tools = []
+        try:
+            async for event in self.llm.generate_stream(history, self._tool_defs):
+                if event["type"] == "tool_call":
+                    tool_calls.append(event["tool_call"])
+                    previous = pending_tools[-1] if pending_tools and not self.parallel_tools else None
+                    pending_tools.append(asyncio.create_task(self._execute_tool_after(previous, event["tool_call"])))
+                else:
+                    content_parts.append(event["content"])
+        except BaseException:
+            for task in pending_tools:
+                task.cancel()
+            raise
+
+        content = "".join(content_parts)
+        if tool_calls:
+            return {"content": content, "tool_calls": tool_calls}, pending_tools
+        return content, None
+
+    async def _execute_tool_after(self, previous: Optional[asyncio.Task], tool_call: Dict) -> ChatMessage:
+        """Executes a tool once the previous speculative call, if any, is done."""
+        if previous is not None:
+            await asyncio.wait((previous,))
+        return await self._execute_single_tool(tool_call)
+
+    def _has_async_tool(self, tool_calls: List[Dict]) -> bool:
+        """
+        Returns True if any of the calls is to an async tool. Sync tools 
+        block the event loop anyway, so gathering only those would add task 
+        overhead without any overlap.
+        """
+        return any(self.tool_manager.is_async_tool(unpack_tool_call(tool_call)[0]) for tool_call in tool_calls)
+
+    async def _execute_single_tool(self, tool_call: Dict) -> ChatMessage:
+        """Execute a single tool and return its result as a tool message."""
+        function_name, function_args = unpack_tool_call(tool_call)
         tool_call_id = tool_call.get("id", f"call_{function_name}")
         
-        logger.info(f"[{self.agent_name}] Calling: {function_name}({function_args})")
+        logger.opt(lazy=True).info(
+            "[{}] Calling: {}({})",
+            lambda: self.agent_name, lambda: function_name, lambda: str(function_args)[:LOG_PREVIEW_CHARS]
+        )
         
         try:
             result = await self.tool_manager.execute_tool(function_name, function_args)
-            content = json.dumps(result) if not isinstance(result, str) else result
+            if not isinstance(result, str):
+                try:
+                    result = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+                except orjson.JSONEncodeError:
+                    # e.g. ints beyond 64 bits, which the stdlib encoder handles
+                    result = json.dumps(result)
+            content = result
             logger.info(f"[{self.agent_name}] Tool succeeded: {function_name}")
         except Exception as e:
             content = f"Error: {str(e)}"
             logger.error(f"[{self.agent_name}] Tool failed: {function_name} - {e}")
         
-        history.append(ChatMessage(
+        return ChatMessage(
             role="tool",
             tool_call_id=tool_call_id,
             name=function_name,
             content=content
-        ))
+        )
     
     def _is_final_answer(self, content: str) -> bool:
         """Check if content is a final answer."""
-        if not content or len(content.strip()) < 10:
+        # Indicators are matched case-insensitively, so no lowered copy is made
+        length = len(content.strip()) if content else 0
+        if length < 10:
             return False
         
-        # Heuristics for final answer detection
-        final_indicators = [
-            "final answer",
-            "in conclusion",
-            "to summarize",
-            "here is the",
-            "here's the"
-        ]
-        
-        needs_tool_indicators = [
-            "i need to",
-            "let me check",
-            "i should call",
-            "i'll use the"
-        ]
-        
-        content_lower = content.lower()
-        
         # Likely needs more tools
-        if any(indicator in content_lower for indicator in needs_tool_indicators):
+        if _NEEDS_TOOL_RE.search(content):
             return False
         
         # Strong final answer indicators
-        if any(indicator in content_lower for indicator in final_indicators):
+        if _FINAL_ANSWER_RE.search(content):
             return True
         
         # Default: if it's substantial content without tool indicators
-        return len(content.strip()) > 50
+        return length > 50
 
 
@@ -1,23 +1,37 @@
+import asyncio
 from loguru import logger
 from typing import List
 from pydantic import BaseModel
-from astra_framework.core.agent import BaseAgent
+from astra_framework.core.agent import BaseAgent, CompositeAgent
 from astra_framework.core.state import SessionState, ChatMessage
 from astra_framework.core.models import AgentResponse
 
-class SequentialAgent(BaseAgent):
+class SequentialAgent(CompositeAgent):
     """
     (Composite & Chain of Responsibility Pattern)
     Executes a list of child agents in order, passing and modifying the state.
     """
-    def __init__(self, agent_name: str, children: List[BaseAgent], keep_alive_state: bool = False):
+    def __init__(self, agent_name: str, children: List[BaseAgent], keep_alive_state: bool = False,
+                 concurrent: bool = False):
+        """
+        Args:
+            concurrent: For children that don't depend on each other's output.
+                They run at the same time on clones of the state, and their
+                responses are then applied to the state in order, as in a
+                sequential run. Messages a child adds to its own clone are not
+                kept.
+        """
         super().__init__(agent_name, keep_alive_state=keep_alive_state)
         self.children = children
+        self.concurrent = concurrent
         logger.debug(f"SequentialAgent '{agent_name}' initialized with {len(children)} children.")
 
     async def execute(self, state: SessionState) -> AgentResponse:
         """Executes the agent's logic."""
         logger.info(f"--- Executing SequentialAgent: {self.agent_name} ---")
+        if self.concurrent:
+            return await self._execute_concurrently(state)
+
         final_response = None
         for i, agent in enumerate(self.children):
             logger.info(f"[{self.agent_name}] Running child {i+1}/{len(self.children)}: {agent.agent_name}")
@@ -32,6 +46,20 @@ class SequentialAgent(BaseAgent):
         logger.success(f"SequentialAgent '{self.agent_name}' finished.")
         return final_response
 
+    async def _execute_concurrently(self, state: SessionState) -> AgentResponse:
+        """Runs independent children together, then applies their responses in order."""
+        logger.info(f"[{self.agent_name}] Running {len(self.children)} independent children concurrently")
+        responses = await asyncio.gather(*(agent.execute(state.clone()) for agent in self.children))
+
+        final_response = None
+        for agent, response in zip(self.children, responses):
+            final_response = response
+            self._handle_child_response(agent, response, state)
+            logger.success(f"[{self.agent_name}] Child {agent.agent_name} finished.")
+
+        logger.success(f"SequentialAgent '{self.agent_name}' finished.")
+        return final_response
+
     def _handle_child_response(self, agent: BaseAgent, response: AgentResponse, state: SessionState):
         """Handles the response from a child agent."""
         if isinstance(response.final_content, BaseModel):
@@ -43,6 +71,7 @@ class SequentialAgent(BaseAgent):
 
         if not self.keep_alive_state:
             logger.debug(f"Child {agent.agent_name} returned a response. Pruning context for next agent.")
+            # Only the dynamic turns; state.static_prefix stays in place
             state.history.clear()
             state.add_message(role=role_to_add, content=content_to_add)
         else:
@@ -1,7 +1,7 @@
 from typing import List, Callable, Optional, Type
 from pydantic import BaseModel
 
-from astra_framework.core.agent import BaseAgent
+from astra_framework.core.agent import BaseAgent, CompositeAgent
 from astra_framework.agents.react_agent import ReActAgent
 from astra_framework.agents.sequential_agent import SequentialAgent
 from astra_framework.agents.parallel_agent import ParallelAgent
@@ -15,7 +15,7 @@ class WorkflowBuilder:
     def __init__(self, workflow_name: str):
         self.workflow_name = workflow_name
         self.root_agent: Optional[BaseAgent] = None
-        self.current_composite: Optional[BaseAgent] = None
+        self.current_composite: Optional[CompositeAgent] = None
 
     def start_with_react_agent(self, 
                                agent_name: str, 
@@ -50,8 +50,7 @@ class WorkflowBuilder:
         """Adds an agent to the current composite agent (e.g., a 
         SequentialAgent).
         """
-        if not self.current_composite or \
-           not hasattr(self.current_composite, 'children'):
+        if not isinstance(self.current_composite, CompositeAgent):
             raise ValueError("No composite agent (like Sequential or Parallel) "
                              "to add to.")
         self.current_composite.children.append(agent)
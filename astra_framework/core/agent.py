@@ -5,12 +5,20 @@ from astra_framework.core.state import SessionState, ChatMessage
 from astra_framework.core.models import AgentResponse
 import json
 
+# Upper-cased labels for the common roles, used when summarizing history
+_ROLE_LABELS = {role: role.upper() for role in ("system", "user", "assistant", "agent", "tool")}
+
 class BaseAgent(ABC):
     """The abstract base class for all agents."""
     def __init__(self, agent_name: str, output_structure: Optional[Type[BaseModel]] = None, keep_alive_state: bool = False):
         self.agent_name = agent_name
         self.output_structure = output_structure
         self.keep_alive_state = keep_alive_state
+        # Bound validator entry points of the output structure, skipping the
+        # classmethod dispatch of model_validate_json/model_validate per response
+        validator = output_structure.__pydantic_validator__ if output_structure else None
+        self._validate_json = validator.validate_json if validator else None
+        self._validate_python = validator.validate_python if validator else None
 
     @abstractmethod
     async def execute(self, state: SessionState) -> AgentResponse:
@@ -18,15 +26,17 @@ class BaseAgent(ABC):
 
     def _sync_history_to_state(self, state: SessionState, execution_history: List[ChatMessage], initial_history_len: int):
         """Synchronizes the agent's execution history back to the main session state."""
-        for msg in execution_history[initial_history_len:]:
-            state.add_message(role=msg.role, content=msg.content, tool_calls=msg.tool_calls, tool_call_id=msg.tool_call_id, name=msg.name)
+        state.extend_messages(execution_history[initial_history_len:])
 
     def _validate_structured_output(self, content: str) -> str:
         """Validates content against the agent's output_structure."""
-        if not self.output_structure:
+        if not self._validate_json:
             return content # No validation needed if no structure defined
         try:
-            validated_model = self.output_structure.model_validate_json(content)
+            # Pydantic builds the validator once per model class. The dump is
+            # kept on purpose: it fills defaults, drops ignored extra fields
+            # and applies coercions, so the result may differ from the input.
+            validated_model = self._validate_json(content)
             return validated_model.model_dump_json()
         except Exception as e:
             raise ValueError(f"Failed to validate structured output: {e}. Content: {content}")
@@ -37,8 +47,12 @@ class BaseAgent(ABC):
         if not history:
             return "No history available."
         
-        summary_content = []
-        for msg in history[-5:]:
-            summary_content.append(f"{msg.role.upper()}: {msg.content}")
-        
-        return "Summary of last 5 messages:\n" + "\n".join(summary_content)
\ No newline at end of file
+        # A slice of the list tail is already O(5), whatever the history length
+        summary_content = "\n".join(
+            f"{_ROLE_LABELS.get(msg.role) or msg.role.upper()}: {msg.content}" for msg in history[-5:]
+        )
+        return "Summary of last 5 messages:\n" + summary_content
+
+class CompositeAgent(BaseAgent):
+    """Base class for agents that run a list of child agents."""
+    children: List[BaseAgent]
@@ -1,15 +1,32 @@
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
     """(Command Pattern) Encapsulates a request to call a tool."""
     name: str
     args: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Standard response from any agent execution."""
     status: str
     final_content: str
-    metadata: Optional[Dict[str, Any]] = None
\ No newline at end of file
+    metadata: Optional[Dict[str, Any]] = None
+
+class JSONText(str):
+    """
+    A text response that the client has already parsed as JSON. It behaves
+    as the raw string; `parsed` holds the decoded value so callers don't
+    parse it a second time.
+    """
+    __slots__ = ("parsed",)
+
+    def __new__(cls, text: str, parsed: Any):
+        instance = super().__new__(cls, text)
+        instance.parsed = parsed
+        return instance
+
+    def __reduce__(self):
+        # The default protocol would call __new__ without `parsed`
+        return (JSONText, (str(self), self.parsed))
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from loguru import logger
+from astra_framework.core.state import SessionState
+
+class SessionStore(ABC):
+    """
+    (Repository Pattern) Abstract storage for session state.
+
+    Keeping sessions behind this interface lets several server processes
+    share them, keyed by the session_id that callers already pass around.
+    """
+
+    @abstractmethod
+    async def load(self, session_id: str) -> Optional[SessionState]:
+        """
+        Loads the state for a session.
+
+        Args:
+            session_id: The ID of the session to load.
+
+        Returns:
+            The SessionState, or None if the session is not stored.
+        """
+        pass
+
+    @abstractmethod
+    async def save(self, session_id: str, state: SessionState) -> None:
+        """
+        Saves the state for a session.
+
+        Args:
+            session_id: The ID of the session to save.
+            state: The SessionState to store.
+        """
+        pass
+
+class InMemorySessionStore(SessionStore):
+    """Stores sessions in a dictionary local to the current process."""
+
+    def __init__(self):
+        self.sessions: Dict[str, SessionState] = {}
+        logger.debug("InMemorySessionStore initialized.")
+
+    async def load(self, session_id: str) -> Optional[SessionState]:
+        return self.sessions.get(session_id)
+
+    async def save(self, session_id: str, state: SessionState) -> None:
+        self.sessions[session_id] = state
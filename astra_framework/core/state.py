@@ -1,8 +1,22 @@
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Callable, Optional
+import asyncio
+import inspect
+import sys
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Callable, Optional, Set
 from loguru import logger
 
-@dataclass
+# Messages (LLM output especially) can be very large; logs show only the start
+LOG_PREVIEW_CHARS = 200
+
+# The session of the workflow run in the current task, set by
+# WorkflowManager.run so tools and nested agents can reach it directly
+current_session: ContextVar[Optional["SessionState"]] = ContextVar("astra_current_session", default=None)
+
+# Strong references to in-flight async observer notifications
+_pending_notifications: Set[asyncio.Task] = set()
+
+@dataclass(slots=True)
 class ChatMessage:
     role: str  # "user", "agent", "tool"
     content: str
@@ -10,6 +24,19 @@ class ChatMessage:
     tool_call_id: Optional[str] = None
     name: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the message as a dict for serialization. Unlike 
+        `dataclasses.asdict`, tool calls are not deep-copied.
+        """
+        return {
+            "role": self.role,
+            "content": self.content,
+            "tool_calls": self.tool_calls,
+            "tool_call_id": self.tool_call_id,
+            "name": self.name,
+        }
+
 @dataclass
 class SessionState:
     """
@@ -19,42 +46,100 @@ class SessionState:
     session_id: str
     history: List[ChatMessage] = field(default_factory=list)
     data: Dict[str, Any] = field(default_factory=dict)
+    # Stable messages sent ahead of every agent's prompt. Unlike history it
+    # is never pruned between agents, so the prompt prefix stays identical
+    # and provider-side prompt caches can hit.
+    static_prefix: List[ChatMessage] = field(default_factory=list)
     
     # For the Observer pattern
     _observers: List[Callable] = field(default_factory=list, repr=False)
+    # Coroutine observers, detected once at subscription
+    _async_observers: Set[Callable] = field(default_factory=set, repr=False)
 
     def __post_init__(self):
         logger.debug(f"SessionState {self.session_id} initialized.")
 
+    def clone(self) -> "SessionState":
+        """
+        Returns an independent copy of the state for isolated execution.
+        Messages and the history/data containers are copied; stored data
+        values and the static prefix messages are shared, which is much 
+        cheaper than a deepcopy.
+        """
+        return SessionState(
+            session_id=self.session_id,
+            history=[replace(msg) for msg in self.history],
+            data=dict(self.data),
+            static_prefix=list(self.static_prefix),
+            _observers=list(self._observers),
+            _async_observers=set(self._async_observers),
+        )
+
     def subscribe(self, observer: Callable):
         """Subscribes an observer to state changes."""
         if observer not in self._observers:
             self._observers.append(observer)
+            # Classified once here, so _notify doesn't inspect every observer per change
+            if inspect.iscoroutinefunction(observer):
+                self._async_observers.add(observer)
             logger.debug(f"Observer {observer.__name__} subscribed to "
                          f"SessionState {self.session_id}")
 
     def unsubscribe(self, observer: Callable):
         """Unsubscribes an observer from state changes."""
         self._observers.remove(observer)
+        self._async_observers.discard(observer)
         logger.debug(f"Observer {observer.__name__} unsubscribed from "
                          f"SessionState {self.session_id}")
 
     def _notify(self):
-        """Notifies all subscribed observers of a state change."""
-        logger.debug(f"Notifying {len(self._observers)} observers of "
-                     "state change.")
+        """
+        Notifies all subscribed observers of a state change. Coroutine 
+        observers are scheduled on the running event loop instead of being 
+        awaited, so they don't hold up the change that triggered them.
+        Without a running loop (a change made from sync code) they are 
+        skipped.
+        """
+        logger.debug("Notifying {} observers of state change.", len(self._observers))
+        loop = None
+        if self._async_observers:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.warning("No running event loop; skipping {} async observers of {}.",
+                               len(self._async_observers), self.session_id)
         for observer in self._observers:
-            observer(self)
+            if observer in self._async_observers:
+                if loop is None:
+                    continue
+                task = loop.create_task(observer(self))
+                _pending_notifications.add(task)
+                task.add_done_callback(_pending_notifications.discard)
+            else:
+                observer(self)
 
     def add_message(self, role: str, content: str, tool_calls: Optional[List[Any]] = None, tool_call_id: Optional[str] = None, name: Optional[str] = None):
         """Adds a message to the history and notifies observers."""
-        logger.info(f"Adding message to {self.session_id}: "
-                    f"{role.upper()}: {content}")
-        self.history.append(ChatMessage(role=role, content=content, tool_calls=tool_calls, tool_call_id=tool_call_id, name=name))
-        self._notify()
+        # Lazy: runs for every message, so skip the formatting unless DEBUG is on
+        logger.opt(lazy=True).debug(
+            "Adding message to {}: {}: {}",
+            lambda: self.session_id, lambda: role.upper(), lambda: str(content)[:LOG_PREVIEW_CHARS]
+        )
+        # Roles come from a small set; interning shares one string per role
+        self.history.append(ChatMessage(role=sys.intern(role), content=content, tool_calls=tool_calls, tool_call_id=tool_call_id, name=name))
+        if self._observers:
+            self._notify()
+
+    def extend_messages(self, messages: List[ChatMessage]):
+        """Appends existing messages to the history and notifies observers once."""
+        logger.debug("Adding {} messages to {}", len(messages), self.session_id)
+        self.history.extend(messages)
+        if self._observers:
+            self._notify()
 
     def update_data(self, key: str, value: Any):
         """Updates the data dictionary and notifies observers."""
-        logger.info(f"Updating data in {self.session_id}: setting '{key}'")
+        logger.info("Updating data in {}: setting '{}'", self.session_id, key)
         self.data[key] = value
-        self._notify()
\ No newline at end of file
+        if self._observers:
+            self._notify()
\ No newline at end of file
@@ -1,8 +1,60 @@
 import inspect
 import json
+import re
+import weakref
 from loguru import logger
-from typing import Callable, Dict, Any, List, get_type_hints
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple, Type, get_type_hints
 from pydantic import BaseModel
+from astra_framework.core.state import LOG_PREVIEW_CHARS
+
+# Shared default for missing tool call fields; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Matches ":param name: description" lines in tool docstrings
+_PARAM_RE = re.compile(r'^[ \t]*:param[ \t]+(\w+)[ \t]*:(.*)$', re.MULTILINE)
+
+# Definitions are shared by every ToolManager registering the same function,
+# so concurrent sessions with their own managers reuse one object per tool.
+# Weak keys let tools defined inside functions be garbage collected.
+_DEFINITION_CACHE: "weakref.WeakKeyDictionary[Callable, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+# Resolved annotations per tool function, weakly keyed like the definitions
+_TYPE_HINTS_CACHE: "weakref.WeakKeyDictionary[Callable, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+# JSON schema types for the basic Python types tools are annotated with
+_JSON_SCHEMA_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+def _cached_type_hints(func: Callable) -> Dict[str, Any]:
+    """Returns get_type_hints(func), resolving forward references only once per function."""
+    try:
+        hints = _TYPE_HINTS_CACHE.get(func)
+    except TypeError: # Callable doesn't support weak references
+        return get_type_hints(func)
+
+    if hints is None:
+        hints = get_type_hints(func)
+        _TYPE_HINTS_CACHE[func] = hints
+    return hints
+
+def cacheable(func: Callable) -> Callable:
+    """
+    Marks a tool as idempotent, so agents may reuse its result for identical
+    arguments within the same session instead of calling it again.
+    """
+    func.cacheable = True
+    return func
+
+def unpack_tool_call(tool_call: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Returns the function name and arguments of a tool call from the LLM."""
+    function = tool_call.get("function") or _EMPTY
+    return function.get("name"), function.get("arguments") or _EMPTY
 
 class ToolManager:
     """
@@ -13,6 +65,14 @@ class ToolManager:
         tools.
         """
         self.tools: Dict[str, Callable] = {}
+        # Names of coroutine tools, detected once at registration
+        self._async_tools: Set[str] = set()
+        # Per-tool functions converting dict arguments into Pydantic models,
+        # only for tools that have any; all other tools skip hydration
+        self._hydrators: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        # Generated once per tool at registration, in registration order
+        self._definitions: List[Dict[str, Any]] = []
+        self._definition_index: Dict[str, int] = {}
         if tools:
             for tool in tools:
                 self.register(tool)
@@ -23,37 +83,64 @@ class ToolManager:
         Decorator or method to register a function as a tool.
         """
         tool_name = func.__name__
-        logger.debug(f"Registering tool: {tool_name}")
+        logger.debug("Registering tool: {}", tool_name)
         self.tools[tool_name] = func
+        model_params = self._get_model_params(func)
+        if model_params:
+            self._hydrators[tool_name] = self._build_hydrator(model_params)
+        else:
+            self._hydrators.pop(tool_name, None)
+        definition = self._get_tool_definition(func)
+        if tool_name in self._definition_index:
+            self._definitions[self._definition_index[tool_name]] = definition
+        else:
+            self._definition_index[tool_name] = len(self._definitions)
+            self._definitions.append(definition)
+        if inspect.iscoroutinefunction(func):
+            self._async_tools.add(tool_name)
+        else:
+            self._async_tools.discard(tool_name)
         return func
 
+    def is_async_tool(self, name: str) -> bool:
+        """Returns True if the named tool is a coroutine function."""
+        return name in self._async_tools
+
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
-        """Generates JSON Schema definitions for all registered tools."""
-        definitions = []
-        for name, func in self.tools.items():
-            definitions.append(self._generate_tool_definition(func))
-        return definitions
+        """Returns the JSON Schema definitions of all registered tools.
+
+        The list is built at registration and updated in place when tools
+        are registered later, and each definition is shared with other 
+        managers using the same tool, so callers must not mutate them.
+        """
+        return self._definitions
+
+    def _get_tool_definition(self, func: Callable) -> Dict[str, Any]:
+        """Returns the shared definition of func, generating it on first use."""
+        try:
+            definition = _DEFINITION_CACHE.get(func)
+        except TypeError: # Callable doesn't support weak references
+            return self._generate_tool_definition(func)
+
+        if definition is None:
+            definition = self._generate_tool_definition(func)
+            _DEFINITION_CACHE[func] = definition
+        return definition
 
     def _generate_tool_definition(self, func: Callable) -> Dict[str, Any]:
         """Generates the JSON schema for a single function."""
-        sig = inspect.signature(func)
-        type_hints = get_type_hints(func)
+        type_hints = _cached_type_hints(func)
         docstring = inspect.getdoc(func) or ""
         
         # Parse the docstring for a main description and param descriptions
-        lines = docstring.strip().split('\n')
-        main_description = lines[0] if lines else ""
-        param_descriptions = {}
-        for line in lines:
-            if line.strip().startswith(":param"):
-                parts = line.strip().split(":", 2)
-                param_name = parts[1].replace("param", "").strip()
-                param_desc = parts[2].strip()
-                param_descriptions[param_name] = param_desc
+        main_description = docstring.strip().split('\n', 1)[0]
+        param_descriptions = {
+            name: desc.strip() for name, desc in _PARAM_RE.findall(docstring)
+        }
 
         parameters = {"type": "object", "properties": {}, "required": []}
         
-        for name, param in sig.parameters.items():
+        for name, is_required in self._get_parameters(func):
             param_type = type_hints.get(name, Any)
             
             # Handle Pydantic models
@@ -67,7 +154,7 @@ class ToolManager:
                     "description": param_descriptions.get(name, "")
                 }
 
-            if param.default is inspect.Parameter.empty:
+            if is_required:
                 parameters["required"].append(name)
 
         return {
@@ -79,58 +166,142 @@ class ToolManager:
             }
         }
 
+    @staticmethod
+    def _get_parameters(func: Callable) -> List[Tuple[str, bool]]:
+        """Returns (name, is_required) for each parameter of func."""
+        # Plain functions without defaults or special parameters: the names
+        # can be read straight off the code object
+        if inspect.isfunction(func) and not func.__defaults__ and not func.__kwdefaults__:
+            code = func.__code__
+            if not code.co_kwonlyargcount and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+                return [(name, True) for name in code.co_varnames[:code.co_argcount]]
+
+        return [
+            (name, param.default is inspect.Parameter.empty)
+            for name, param in inspect.signature(func).parameters.items()
+        ]
+
     def _map_type_to_json_schema(self, py_type: Any) -> str:
         """Maps Python types to JSON schema types."""
-        if py_type is str: return "string"
-        if py_type is int: return "integer"
-        if py_type is float: return "number"
-        if py_type is bool: return "boolean"
-        if py_type is list: return "array"
-        if py_type is dict: return "object"
-        return "string" # Default for Any or unknown
-
-    async def execute_tool(self, name: str, args: Dict[str, Any]) -> Any:
+        try:
+            return _JSON_SCHEMA_TYPES.get(py_type, "string") # Default for Any or unknown
+        except TypeError: # Unhashable annotations
+            return "string"
+
+    async def execute_tool(self, name: str, args: Optional[Dict[str, Any]] = None, /, **kwargs) -> Any:
         """
-        Executes a tool by name with a dictionary of arguments.
+        Executes a tool by name. Arguments can be given as a dictionary,
+        as keyword arguments, or both. `name` and `args` are positional-only,
+        so tools may have parameters with those names.
         """
-        if name not in self.tools:
-            logger.error(f"Attempted to call unknown tool: {name}")
+        func = self.tools.get(name)
+        if func is None:
+            logger.error("Attempted to call unknown tool: {}", name)
             return f"Error: Tool '{name}' not found."
         
-        logger.info(f"Executing tool '{name}' with args: {args}")
-        func = self.tools[name]
+        args = {**args, **kwargs} if args else kwargs
+        logger.opt(lazy=True).info(
+            "Executing tool '{}' with args: {}", lambda: name, lambda: str(args)[:LOG_PREVIEW_CHARS]
+        )
+
+        # Sync tools are called directly, without an extra coroutine hop
+        if name not in self._async_tools:
+            return self._execute_sync_function(func, **args)
         
         # Unpack the dictionary of arguments into keyword arguments
         return await self._execute_function(func, **args)
 
-    async def _execute_function(self, func: Callable, **kwargs) -> Any:
+    def execute_tool_sync(self, name: str, args: Optional[Dict[str, Any]] = None, /, **kwargs) -> Any:
+        """
+        Executes a synchronous tool by name without going through the event 
+        loop. Async tools must be run with `execute_tool`.
+        """
+        func = self.tools.get(name)
+        if func is None:
+            logger.error("Attempted to call unknown tool: {}", name)
+            return f"Error: Tool '{name}' not found."
+        if name in self._async_tools:
+            raise TypeError(f"Tool '{name}' is async; use execute_tool instead.")
+
+        args = {**args, **kwargs} if args else kwargs
+        logger.opt(lazy=True).info(
+            "Executing tool '{}' with args: {}", lambda: name, lambda: str(args)[:LOG_PREVIEW_CHARS]
+        )
+        return self._execute_sync_function(func, **args)
+
+    @staticmethod
+    def _get_model_params(func: Callable) -> Dict[str, Type[BaseModel]]:
+        """Returns the parameters of func that are annotated with a Pydantic model."""
+        return {
+            name: param_type for name, param_type in _cached_type_hints(func).items()
+            if name != 'return' and isinstance(param_type, type) and issubclass(param_type, BaseModel)
+        }
+
+    @staticmethod
+    def _build_hydrator(model_params: Dict[str, Type[BaseModel]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Builds a function that converts dict arguments into Pydantic models 
+        where the tool expects one. The usual single-model case gets a 
+        specialized version with the parameter and validator bound up front.
+        """
+        if len(model_params) == 1:
+            (param_name, model), = model_params.items()
+            validate = model.model_validate
+
+            def hydrate_one(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+                arg_val = kwargs.get(param_name)
+                if isinstance(arg_val, dict):
+                    return {**kwargs, param_name: validate(arg_val)}
+                return kwargs
+            return hydrate_one
+
+        validators = tuple((name, model.model_validate) for name, model in model_params.items())
+
+        def hydrate(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            hydrated_kwargs = dict(kwargs)
+            for name, validate in validators:
+                arg_val = kwargs.get(name)
+                if isinstance(arg_val, dict):
+                    hydrated_kwargs[name] = validate(arg_val)
+            return hydrated_kwargs
+        return hydrate
+
+    def _finalize_result(self, func: Callable, result: Any) -> Any:
+        """Logs success and serializes Pydantic results for the LLM."""
+        logger.success("Tool '{}' executed successfully.", func.__name__)
+        # If the result is a Pydantic model, serialize it for the LLM
+        if isinstance(result, BaseModel):
+            return result.model_dump_json()
+        return result
+
+    def _execute_sync_function(self, func: Callable, /, **kwargs) -> Any:
+        """Executes a synchronous function."""
+        try:
+            hydrate = self._hydrators.get(func.__name__)
+            if hydrate:
+                kwargs = hydrate(kwargs)
+            result = func(**kwargs)
+            return self._finalize_result(func, result)
+        except Exception as e:
+            logger.error("Tool '{}' failed: {}", func.__name__, e)
+            return f"Error executing tool: {e}"
+
+    async def _execute_function(self, func: Callable, /, **kwargs) -> Any:
         """
         Executes a function, handling both sync and async functions.
         """
         try:
             # Here we need to handle Pydantic model hydration if needed
-            sig = inspect.signature(func)
-            type_hints = get_type_hints(func)
-            hydrated_kwargs = {}
-            for name, arg_val in kwargs.items():
-                param_type = type_hints.get(name)
-                if (isinstance(param_type, type) and 
-                        issubclass(param_type, BaseModel) and 
-                        isinstance(arg_val, dict)):
-                    hydrated_kwargs[name] = param_type.model_validate(arg_val)
-                else:
-                    hydrated_kwargs[name] = arg_val
-
-            if inspect.iscoroutinefunction(func):
-                result = await func(**hydrated_kwargs)
+            hydrate = self._hydrators.get(func.__name__)
+            if hydrate:
+                kwargs = hydrate(kwargs)
+
+            if func.__name__ in self._async_tools:
+                result = await func(**kwargs)
             else:
-                result = func(**hydrated_kwargs)
+                result = func(**kwargs)
             
-            logger.success(f"Tool '{func.__name__}' executed successfully.")
-            # If the result is a Pydantic model, serialize it for the LLM
-            if isinstance(result, BaseModel):
-                return result.model_dump_json()
-            return result
+            return self._finalize_result(func, result)
         except Exception as e:
-            logger.error(f"Tool '{func.__name__}' failed: {e}")
+            logger.error("Tool '{}' failed: {}", func.__name__, e)
             return f"Error executing tool: {e}"
\ No newline at end of file
@@ -1,7 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Literal, Dict, Any, Optional
 
 class AgentConfig(BaseModel):
+    # Plans are read-only once the LLM has produced them
+    model_config = ConfigDict(frozen=True)
+
     agent_type: Literal["LLMAgent", "SequentialAgent", "ParallelAgent", "LoopAgent"]
     agent_name: str
     # Common parameters for LLMAgent
@@ -17,9 +20,13 @@ class AgentConfig(BaseModel):
     exit_condition: Optional[str] = None # String representation of a callable name
 
 class WorkflowPlan(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     main_topic: str
     workflow_description: str
     root_agent: AgentConfig
 
-# Forward references for recursive models
-AgentConfig.model_rebuild()
+# Forward references for recursive models. Module code runs once per process,
+# so this is the only rebuild; skip it if Pydantic already resolved them.
+if not AgentConfig.__pydantic_complete__:
+    AgentConfig.model_rebuild()
@@ -1,7 +1,8 @@
-import uuid
+import secrets
 from loguru import logger
-from typing import Dict
-from astra_framework.core.state import SessionState
+from typing import Dict, List, Optional
+from astra_framework.core.state import SessionState, current_session
+from astra_framework.core.session_store import SessionStore
 from astra_framework.core.agent import BaseAgent
 from astra_framework.core.models import AgentResponse
 
@@ -13,9 +14,17 @@ class WorkflowManager:
     The WorkflowManager simplifies the interaction with the Astra framework by providing
     a high-level API for managing the lifecycle of agentic workflows.
     """
-    def __init__(self):
-        """Initializes the WorkflowManager with empty session and workflow dictionaries."""
+    def __init__(self, session_store: Optional[SessionStore] = None):
+        """
+        Initializes the WorkflowManager with empty session and workflow dictionaries.
+
+        Args:
+            session_store: Optional external store that sessions are loaded
+                from and saved to around each run, so they can be shared
+                between processes.
+        """
         self.sessions: Dict[str, SessionState] = {}
+        self.session_store = session_store
         # Stores all registered agent workflows by name
         self.workflows: Dict[str, BaseAgent] = {} 
         logger.debug("WorkflowManager initialized.")
@@ -30,20 +39,39 @@ class WorkflowManager:
             agent: The root agent of the workflow.
         """
         if name in self.workflows:
-            logger.warning(f"Overwriting existing workflow: {name}")
-        logger.info(f"Registering workflow: '{name}'")
+            logger.warning("Overwriting existing workflow: {}", name)
+        logger.info("Registering workflow: '{}'", name)
         self.workflows[name] = agent
 
     def create_session(self) -> str:
         """
         Creates a new session and returns the session ID.
 
+        The session is only kept in this process until its first run saves
+        it. With a shared session store, use `acreate_session` so other
+        workers can find the session straight away.
+
         Returns:
             The unique session ID for the new session.
         """
-        session_id = str(uuid.uuid4())
+        # 128 random bits, like a UUID4, without building a UUID object
+        session_id = secrets.token_hex(16)
         self.sessions[session_id] = SessionState(session_id=session_id)
-        logger.info(f"Created new session: {session_id}")
+        logger.info("Created new session: {}", session_id)
+        return session_id
+
+    async def acreate_session(self) -> str:
+        """
+        Creates a new session, saves it to the session store if one is
+        configured, and returns the session ID.
+
+        Returns:
+            The unique session ID for the new session.
+        """
+        session_id = self.create_session()
+        session_store = self.session_store
+        if session_store:
+            await session_store.save(session_id, self.sessions[session_id])
         return session_id
 
     def get_session_state(self, session_id: str) -> SessionState:
@@ -59,10 +87,31 @@ class WorkflowManager:
         Raises:
             Exception: If the session is not found.
         """
-        if session_id not in self.sessions:
-            logger.error(f"Session not found: {session_id}")
+        state = self.sessions.get(session_id)
+        if state is None:
+            logger.error("Session not found: {}", session_id)
+            raise Exception("Session not found")
+        return state
+
+    async def _load_session(self, session_id: str) -> SessionState:
+        """
+        Loads the session state, preferring the external store when one is
+        configured so that state saved by another process is picked up.
+        """
+        sessions = self.sessions
+        session_store = self.session_store
+        if session_store:
+            state = await session_store.load(session_id)
+            if state:
+                sessions[session_id] = state
+                return state
+
+        # Inlined get_session_state; this runs on every request
+        state = sessions.get(session_id)
+        if state is None:
+            logger.error("Session not found: {}", session_id)
             raise Exception("Session not found")
-        return self.sessions[session_id]
+        return state
 
     async def run(self, workflow_name: str, session_id: str, prompt: str) -> AgentResponse:
         """
@@ -76,20 +125,68 @@ class WorkflowManager:
         Returns:
             The AgentResponse from the final agent in the workflow.
         """
-        logger.info(f"--- Running workflow '{workflow_name}' for session {session_id} ---")
+        logger.info("--- Running workflow '{}' for session {} ---", workflow_name, session_id)
         
         # 1. Look up the agent (Strategy) by name
         agent = self.workflows.get(workflow_name)
         if not agent:
-            logger.error(f"Workflow not found: {workflow_name}")
+            logger.error("Workflow not found: {}", workflow_name)
             return AgentResponse(status="error", final_content=f"Workflow '{workflow_name}' not found.")
             
         # 2. Get the session state (Blackboard)
-        state = self.get_session_state(session_id)
-        state.add_message(role="user", content=prompt)
-        
+        state = await self._load_session(session_id)
+
         # 3. Delegate the execution to the root agent of the workflow
-        response = await agent.execute(state)
+        try:
+            response = await self._run_turn(agent, state, prompt)
+        finally:
+            # Keep the prompt and any partial progress even if the agent raised
+            session_store = self.session_store
+            if session_store:
+                await session_store.save(session_id, state)
         
-        logger.success(f"--- Workflow '{workflow_name}' finished for session {session_id} ---")
-        return response
\ No newline at end of file
+        logger.success("--- Workflow '{}' finished for session {} ---", workflow_name, session_id)
+        return response
+
+    async def run_many(self, workflow_name: str, session_id: str, prompts: List[str]) -> List[AgentResponse]:
+        """
+        Runs a *named* workflow once per prompt, in order, within one session.
+        The workflow and session are looked up once and the session is saved
+        once at the end, instead of on every turn as with repeated `run` calls.
+
+        Args:
+            workflow_name: The name of the workflow to run.
+            session_id: The ID of the session to use.
+            prompts: The user prompts, one per turn.
+
+        Returns:
+            The AgentResponse of each turn.
+        """
+        logger.info("--- Running workflow '{}' for session {} ({} turns) ---", workflow_name, session_id, len(prompts))
+
+        agent = self.workflows.get(workflow_name)
+        if not agent:
+            logger.error("Workflow not found: {}", workflow_name)
+            # One response per prompt, as callers pair them up with zip
+            error = f"Workflow '{workflow_name}' not found."
+            return [AgentResponse(status="error", final_content=error) for _ in prompts]
+
+        state = await self._load_session(session_id)
+        try:
+            responses = [await self._run_turn(agent, state, prompt) for prompt in prompts]
+        finally:
+            session_store = self.session_store
+            if session_store:
+                await session_store.save(session_id, state)
+
+        logger.success("--- Workflow '{}' finished for session {} ---", workflow_name, session_id)
+        return responses
+
+    async def _run_turn(self, agent: BaseAgent, state: SessionState, prompt: str) -> AgentResponse:
+        """Adds the prompt to the state and runs the agent with the session bound."""
+        state.add_message("user", prompt)
+        token = current_session.set(state)
+        try:
+            return await agent.execute(state)
+        finally:
+            current_session.reset(token)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Union
+from typing import AsyncIterator, List, Dict, Any, Union
 from astra_framework.core.state import ChatMessage
 
 class BaseLLMClient(ABC):
@@ -12,16 +12,62 @@ class BaseLLMClient(ABC):
     """
 
     @abstractmethod
-    async def generate(self, history: List[ChatMessage], tools: List[Dict[str, Any]]) -> Union[str, Dict[str, Any]]:
+    async def generate(self, history: List[ChatMessage], tools: List[Dict[str, Any]], /) -> Union[str, Dict[str, Any]]:
         """
-        Generates a response from the LLM.
+        Generates a response from the LLM. Arguments are positional-only.
 
         Args:
             history: A list of ChatMessage objects representing the conversation history.
-            tools: A list of tool definitions in JSON Schema format.
+            tools: A list of tool definitions in JSON Schema format. Agents 
+                pass their cached definitions list by reference, so clients 
+                must not mutate it.
 
         Returns:
             A string containing the text response, or a dictionary
             representing a tool call.
         """
         pass
+
+    async def generate_stream(self, history: List[ChatMessage], tools: List[Dict[str, Any]], /) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams a response from the LLM as a sequence of events:
+
+        - `{"type": "content", "content": <text delta>}`
+        - `{"type": "tool_call", "tool_call": <complete tool call>}`
+
+        The default implementation wraps `generate` and emits the whole
+        response at once. Clients with native streaming should override it
+        to emit each tool call as soon as it is complete.
+
+        Args:
+            history: A list of ChatMessage objects representing the conversation history.
+            tools: A list of tool definitions in JSON Schema format.
+        """
+        response = await self.generate(history, tools)
+        if isinstance(response, dict):
+            if response.get("content"):
+                yield {"type": "content", "content": response["content"]}
+            for tool_call in response.get("tool_calls") or []:
+                yield {"type": "tool_call", "tool_call": tool_call}
+        else:
+            yield {"type": "content", "content": response}
+
+    async def warmup(self, connections: int = 1):
+        """
+        Opens connections to the LLM backend ahead of the first request.
+
+        The default implementation does nothing.
+
+        Args:
+            connections: The number of connections to establish.
+        """
+        pass
+
+    async def aclose(self):
+        """
+        Releases any network resources held by the client.
+
+        Clients that keep a persistent connection pool should override this;
+        the default implementation does nothing.
+        """
+        pass
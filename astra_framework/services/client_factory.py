@@ -1,12 +1,38 @@
+import asyncio
+from typing import Any, Dict, Tuple, Type
+from weakref import WeakKeyDictionary
 from .base_client import BaseLLMClient
 from .gemini_client import GeminiClient
 from .ollama_client import OllamaClient
+from .vllm_client import VLLMClient
 
 class LLMClientFactory:
     """A factory for creating LLM clients."""
 
-    @staticmethod
-    def create_client(client_type: str, model: str, **kwargs) -> BaseLLMClient:
+    # Client classes by type name; extend with `register`
+    _registry: Dict[str, Type[BaseLLMClient]] = {
+        "gemini": GeminiClient,
+        "ollama": OllamaClient,
+        "vllm": VLLMClient,
+    }
+    # Clients handed out by `get_client`, per event loop and keyed by their
+    # constructor arguments. Their connection pools belong to the loop that
+    # first used them, so loops can't share clients.
+    _shared_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], BaseLLMClient]]" = WeakKeyDictionary()
+
+    @classmethod
+    def register(cls, client_type: str, client_class: Type[BaseLLMClient]):
+        """
+        Registers a client class under a type name.
+
+        Args:
+            client_type: The name used to request the client (e.g., "openai").
+            client_class: The BaseLLMClient subclass to instantiate.
+        """
+        cls._registry[client_type] = client_class
+
+    @classmethod
+    def create_client(cls, client_type: str, model: str, **kwargs) -> BaseLLMClient:
         """
         Creates an LLM client.
 
@@ -18,9 +44,42 @@ class LLMClientFactory:
         Returns:
             An instance of the specified LLM client.
         """
-        if client_type == "gemini":
-            return GeminiClient(model=model, **kwargs)
-        elif client_type == "ollama":
-            return OllamaClient(model=model, **kwargs)
-        else:
+        client_class = cls._registry.get(client_type)
+        if client_class is None:
             raise ValueError(f"Unknown client type: {client_type}")
+        return client_class(model=model, **kwargs)
+
+    @classmethod
+    def get_client(cls, client_type: str, model: str, **kwargs) -> BaseLLMClient:
+        """
+        Returns a shared LLM client, creating it on first use. Repeated
+        workflow runs with the same arguments on the same event loop reuse
+        one client and its underlying HTTP connections. Outside a running
+        loop, a new client is returned each time.
+
+        Args:
+            client_type: The type of client to create (e.g., "gemini", "ollama").
+            model: The model to use for the client.
+            **kwargs: Additional keyword arguments for the client.
+
+        Returns:
+            The shared instance of the specified LLM client.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError: # No loop to tie the client to
+            return cls.create_client(client_type, model, **kwargs)
+
+        clients = cls._shared_clients.get(loop)
+        if clients is None:
+            clients = cls._shared_clients[loop] = {}
+        try:
+            key = (client_type, model, frozenset(kwargs.items()))
+            client = clients.get(key)
+        except TypeError: # Unhashable arguments can't be shared
+            return cls.create_client(client_type, model, **kwargs)
+
+        if client is None:
+            client = cls.create_client(client_type, model, **kwargs)
+            clients[key] = client
+        return client
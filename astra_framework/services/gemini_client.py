@@ -1,18 +1,60 @@
 import os
-import json
+import itertools
+import secrets
+from collections import OrderedDict
+import orjson
 from google import genai
 from google.genai import types  
-from typing import List, Dict, Any, Union, Optional
+from typing import AsyncIterator, List, Dict, Any, Type, Union, Optional
+from pydantic import BaseModel
 from .base_client import BaseLLMClient
+from astra_framework.core.models import JSONText
 from astra_framework.core.state import ChatMessage
+from astra_framework.core.tool import unpack_tool_call
 from loguru import logger
 
+# Distinct tool sets whose converted Gemini tools are kept per client
+_TOOL_CACHE_SIZE = 64
+
+# Tool call ids are a random per-process prefix plus a counter, unique within the process
+_TOOL_CALL_PREFIX = secrets.token_hex(4)
+_tool_call_counter = itertools.count()
+
 class GeminiClient(BaseLLMClient):
     """
     A client for interacting with the Google Gemini API using the
     new 'google-genai' package.
     """
 
+    # Standard roles to Gemini roles
+    _ROLE_MAP = {
+        "user": "user",
+        "assistant": "model",
+        "agent": "model",  # Treat agent as model
+        "system": "system",
+        "tool": "user"  # Tool responses are sent as 'user' role in Gemini
+    }
+
+    # Safety settings sent with every request
+    _SAFETY_SETTINGS = [
+        types.SafetySetting(category=category, threshold="BLOCK_NONE")
+        for category in (
+            "HARM_CATEGORY_HARASSMENT",
+            "HARM_CATEGORY_HATE_SPEECH",
+            "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+            "HARM_CATEGORY_DANGEROUS_CONTENT",
+        )
+    ]
+
+    # Generation settings shared by every request; per-call keys are added to a copy
+    _BASE_CONFIG = {
+        "temperature": 0.7,
+        "max_output_tokens": 8192,  # INCREASED: Use max available tokens
+        "top_p": 0.95,
+        "top_k": 40,
+        "safety_settings": _SAFETY_SETTINGS,
+    }
+
     def __init__(self, model: str = "gemini-2.0-flash"):
         """
         Initializes the GeminiClient.
@@ -21,6 +63,10 @@ class GeminiClient(BaseLLMClient):
             model: The name of the Gemini model to use.
         """
         self.model_name = model
+        # Converted tools, keyed by the identities of the definitions (least
+        # recently used evicted first). Values keep the definitions alive, so
+        # their ids can't be reused while cached.
+        self._tool_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
         
         try:
             # New client finds GOOGLE_API_KEY from env automatically
@@ -37,7 +83,9 @@ class GeminiClient(BaseLLMClient):
         self, 
         history: List[ChatMessage], 
         tools: List[Dict[str, Any]] = None, 
-        json_response: bool = False
+        /,
+        json_response: bool = False,
+        response_schema: Optional[Type[BaseModel]] = None
     ) -> Union[str, Dict[str, Any]]:
         """
         Generates a response from the Gemini API.
@@ -46,139 +94,26 @@ class GeminiClient(BaseLLMClient):
             history: List of ChatMessage objects representing conversation history
             tools: Optional list of tool definitions in OpenAI format
             json_response: Whether to request JSON response format
+            response_schema: Optional Pydantic model the JSON response must
+                match. Gemini constrains decoding to it; implies json_response.
             
         Returns:
             Either a string response or a dict with tool_calls
         """
         
-        system_instruction = None
-        gemini_contents = []
-        
-        # 1. Convert history to Gemini format
-        for msg in history:
-            role = self._convert_role(msg.role)
-            
-            if role == "system":
-                # Extract system instruction (will be added to config)
-                system_instruction = msg.content
-                continue
-
-            if msg.tool_calls:
-                # Handle tool call requests from the model
-                parts = []
-                for tc in msg.tool_calls:
-                    # Extract function call info
-                    func_name = tc.get("function", {}).get("name")
-                    func_args_str = tc.get("function", {}).get("arguments", "{}")
-                    
-                    # Parse arguments if they're a string
-                    if isinstance(func_args_str, str):
-                        try:
-                            func_args = json.loads(func_args_str)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Failed to parse function args: {func_args_str}")
-                            func_args = {}
-                    else:
-                        func_args = func_args_str
-                    
-                    parts.append(types.Part(
-                        function_call=types.FunctionCall(
-                            name=func_name,
-                            args=func_args
-                        )
-                    ))
-                
-                gemini_contents.append(
-                    types.Content(role=role, parts=parts)
-                )
-                
-            elif msg.role == "tool":
-                # Handle tool responses
-                # Gemini expects tool responses with the function name and response
-                tool_name = getattr(msg, 'name', msg.tool_call_id or 'unknown_tool')
-                
-                part = types.Part(
-                    function_response=types.FunctionResponse(
-                        name=tool_name,
-                        response={"content": msg.content}
-                    )
-                )
-                
-                gemini_contents.append(
-                    types.Content(role="user", parts=[part])  # Tool responses go as 'user'
-                )
-                
-            else:
-                # Handle regular text content
-                if msg.content:  # Only add non-empty messages
-                    gemini_contents.append(
-                        types.Content(
-                            role=role,
-                            parts=[types.Part(text=msg.content)]
-                        )
-                    )
-
-        # 2. Configure generation settings
-        config_params = {
-            "temperature": 0.7,
-            "max_output_tokens": 8192,  # INCREASED: Use max available tokens
-            "top_p": 0.95,
-            "top_k": 40
-        }
-        
-        # Add system instruction to config (CORRECT WAY)
-        if system_instruction:
-            config_params["system_instruction"] = system_instruction
-        
-        # Add JSON response mode if requested
-        if json_response:
-            config_params["response_mime_type"] = "application/json"
-        
-        # Add safety settings to config
-        config_params["safety_settings"] = [
-            types.SafetySetting(
-                category="HARM_CATEGORY_HARASSMENT",
-                threshold="BLOCK_NONE"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_HATE_SPEECH",
-                threshold="BLOCK_NONE"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                threshold="BLOCK_NONE"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_DANGEROUS_CONTENT",
-                threshold="BLOCK_NONE"
-            ),
-        ]
-        
-        # Add tools to config if provided
-        if tools:
-            try:
-                gemini_tools = self._convert_tools_to_gemini(tools)
-                if gemini_tools:
-                    config_params["tools"] = gemini_tools
-            except Exception as e:
-                logger.error(f"Error converting tools: {e}")
-                raise
-
-        # Create the config object
-        generation_config = types.GenerateContentConfig(**config_params)
-
-        # 3. Build the API call parameters (CORRECT: only model, contents, config)
-        api_params = {
-            "model": self.model_name,
-            "contents": gemini_contents,
-            "config": generation_config,
-        }
+        json_response = json_response or response_schema is not None
+        api_params = self._build_api_params(history, tools, json_response, response_schema)
+        gemini_contents = api_params["contents"]
 
         try:
             # 4. Generate content using the async client
             logger.debug(f"Calling Gemini API with {len(gemini_contents)} content items")
             
-            response = await self.client.aio.models.generate_content(**api_params)
+            if tools:
+                response = await self.client.aio.models.generate_content(**api_params)
+            else:
+                # Text-only responses are received as a stream and assembled as chunks arrive
+                response = await self._generate_streamed(api_params)
 
             # 5. Parse the response
             if not response.candidates:
@@ -189,7 +124,7 @@ class GeminiClient(BaseLLMClient):
             
             # Check finish reason - IMPORTANT for detecting truncation
             if candidate.finish_reason != types.FinishReason.STOP:
-                logger.warning(f"Generation stopped: {candidate.finish_reason.name}")
+                logger.warning(f"Generation stopped: {getattr(candidate.finish_reason, 'name', candidate.finish_reason)}")
                 
                 if candidate.finish_reason == types.FinishReason.SAFETY:
                     safety_info = candidate.safety_ratings if hasattr(candidate, 'safety_ratings') else "Unknown"
@@ -212,41 +147,31 @@ class GeminiClient(BaseLLMClient):
                 logger.error("Gemini returned empty content")
                 return ""
 
-            # Check if response contains function calls
-            has_function_call = any(hasattr(part, 'function_call') and part.function_call for part in candidate.content.parts)
+            # Split the parts into function calls and text in a single pass
+            function_calls = []
+            text_parts = []
+            for part in candidate.content.parts:
+                if function_call := part.function_call:
+                    function_calls.append(function_call)
+                elif text := part.text:
+                    text_parts.append(text)
             
-            if has_function_call:
-                # Extract all function calls
-                tool_calls = []
-                reasoning_parts = []
-                
-                for part in candidate.content.parts:
-                    if hasattr(part, 'function_call') and part.function_call:
-                        tool_calls.append(self._parse_function_call(part.function_call))
-                    elif hasattr(part, 'text') and part.text:
-                        reasoning_parts.append(part.text)
-                
-                reasoning_text = " ".join(reasoning_parts) if reasoning_parts else None
-                
+            if function_calls:
+                # Text alongside function calls is the model's reasoning
                 return {
-                    "content": reasoning_text or "",
-                    "tool_calls": tool_calls
+                    "content": " ".join(text_parts),
+                    "tool_calls": [self._parse_function_call(fc) for fc in function_calls]
                 }
             else:
                 # Extract text response
-                text_parts = []
-                for part in candidate.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        text_parts.append(part.text)
-                
-                response_text = "".join(text_parts) if text_parts else ""
+                response_text = "".join(text_parts)
                 
                 # ADDED: Validate JSON if expected
                 if json_response and response_text:
                     try:
-                        # Try to parse the JSON to ensure it's valid
-                        json.loads(response_text)
-                    except json.JSONDecodeError as e:
+                        # Parse to ensure it's valid, and hand the result on with the text
+                        return JSONText(response_text, orjson.loads(response_text))
+                    except orjson.JSONDecodeError as e:
                         logger.error(f"Invalid JSON response: {e}")
                         logger.error(f"Response text: {response_text[:500]}...")
                         return f"Error: Invalid JSON response from model. Response may have been truncated. Error: {e}"
@@ -268,16 +193,163 @@ class GeminiClient(BaseLLMClient):
             
             return f"Error: Gemini API call failed: {str(e)}"
         
+    async def _generate_streamed(self, api_params: Dict[str, Any]) -> types.GenerateContentResponse:
+        """
+        Calls `generate_content_stream` and assembles the text chunks into a
+        single-candidate response, so it can be parsed like a non-streamed one.
+        """
+        text_parts = []
+        finish_reason = None
+        safety_ratings = None
+        received_candidate = False
+
+        stream = await self.client.aio.models.generate_content_stream(**api_params)
+        async for chunk in stream:
+            if not chunk.candidates:
+                continue
+            received_candidate = True
+            candidate = chunk.candidates[0]
+            # The finish reason and ratings arrive with the last chunk
+            finish_reason = candidate.finish_reason or finish_reason
+            safety_ratings = candidate.safety_ratings or safety_ratings
+            if candidate.content:
+                text_parts.extend(part.text for part in candidate.content.parts or () if part.text)
+
+        if not received_candidate:
+            return types.GenerateContentResponse(candidates=[])
+        if finish_reason is None:
+            # The stream ended before the final chunk, so the text may be cut off
+            logger.warning("Gemini stream ended without a finish reason; treating it as truncated")
+            finish_reason = types.FinishReason.MAX_TOKENS
+
+        content = types.Content(role="model", parts=[types.Part(text="".join(text_parts))]) if text_parts else None
+        return types.GenerateContentResponse(candidates=[
+            types.Candidate(content=content, finish_reason=finish_reason, safety_ratings=safety_ratings)
+        ])
+
+    def _build_api_params(
+        self,
+        history: List[ChatMessage],
+        tools: Optional[List[Dict[str, Any]]],
+        json_response: bool,
+        response_schema: Optional[Type[BaseModel]] = None
+    ) -> Dict[str, Any]:
+        """Converts the history and tools into `generate_content` parameters."""
+        system_instruction = None
+        gemini_contents = []
+
+        # Local aliases for the per-message loop
+        append = gemini_contents.append
+        role_map = self._ROLE_MAP
+        Content, Part = types.Content, types.Part
+        FunctionCall, FunctionResponse = types.FunctionCall, types.FunctionResponse
+        
+        # 1. Convert history to Gemini format
+        for msg in history:
+            content = msg.content
+            tool_calls = msg.tool_calls
+            msg_role = msg.role
+
+            # Reject empty turns (e.g. blank assistant messages) before any other work
+            if not (content or tool_calls or msg_role == "tool" or msg_role == "system"):
+                continue
+
+            role = role_map.get(msg_role, "user")
+            
+            if role == "system":
+                # Extract system instruction (will be added to config)
+                system_instruction = content
+                continue
+
+            if tool_calls:
+                # Handle tool call requests from the model
+                parts = []
+                for tc in tool_calls:
+                    func_name, func_args = unpack_tool_call(tc)
+                    
+                    # Parse arguments if they're a string
+                    if isinstance(func_args, str):
+                        try:
+                            func_args = orjson.loads(func_args)
+                        except orjson.JSONDecodeError:
+                            logger.warning("Failed to parse function args: {}", func_args)
+                            func_args = {}
+                    
+                    parts.append(Part(function_call=FunctionCall(name=func_name, args=func_args)))
+                
+                append(Content(role=role, parts=parts))
+                
+            elif msg_role == "tool":
+                # Handle tool responses
+                # Gemini expects tool responses with the function name and response
+                tool_name = getattr(msg, 'name', msg.tool_call_id or 'unknown_tool')
+                
+                part = Part(function_response=FunctionResponse(name=tool_name, response={"content": content}))
+                append(Content(role="user", parts=[part]))  # Tool responses go as 'user'
+                
+            else:
+                append(Content(role=role, parts=[Part(text=content)]))
+
+        # 2. Configure generation settings
+        config_params = dict(self._BASE_CONFIG)
+        
+        # Add system instruction to config (CORRECT WAY)
+        if system_instruction:
+            config_params["system_instruction"] = system_instruction
+        
+        # Add JSON response mode if requested
+        if json_response:
+            config_params["response_mime_type"] = "application/json"
+        if response_schema is not None:
+            config_params["response_schema"] = response_schema
+        
+        # Add tools to config if provided
+        if tools:
+            try:
+                gemini_tools = self._convert_tools_to_gemini(tools)
+                if gemini_tools:
+                    config_params["tools"] = gemini_tools
+            except Exception as e:
+                logger.error(f"Error converting tools: {e}")
+                raise
+
+        # Create the config object
+        generation_config = types.GenerateContentConfig(**config_params)
+
+        # 3. Build the API call parameters (CORRECT: only model, contents, config)
+        return {
+            "model": self.model_name,
+            "contents": gemini_contents,
+            "config": generation_config,
+        }
+
+    async def generate_stream(self, history: List[ChatMessage], tools: List[Dict[str, Any]], /) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams a response from the Gemini API. Gemini sends each function 
+        call as a complete part, so it is emitted as soon as its chunk 
+        arrives. See `BaseLLMClient.generate_stream`.
+        """
+        api_params = self._build_api_params(history, tools, json_response=False)
+
+        try:
+            logger.debug(f"Streaming from Gemini API with {len(api_params['contents'])} content items")
+            stream = await self.client.aio.models.generate_content_stream(**api_params)
+            async for chunk in stream:
+                if not chunk.candidates or not chunk.candidates[0].content:
+                    continue
+                for part in chunk.candidates[0].content.parts or []:
+                    if getattr(part, 'function_call', None):
+                        yield {"type": "tool_call", "tool_call": self._parse_function_call(part.function_call)}
+                    elif getattr(part, 'text', None):
+                        yield {"type": "content", "content": part.text}
+
+        except Exception as e:
+            logger.error(f"Error streaming from Gemini API: {e}")
+            yield {"type": "content", "content": f"Error: Gemini API call failed: {str(e)}"}
+
     def _convert_role(self, role: str) -> str:
         """Converts standard roles to Gemini roles."""
-        role_mapping = {
-            "user": "user",
-            "assistant": "model",
-            "agent": "model",  # Treat agent as model
-            "system": "system",
-            "tool": "user"  # Tool responses are sent as 'user' role in Gemini
-        }
-        return role_mapping.get(role, "user")
+        return self._ROLE_MAP.get(role, "user")
 
     def _convert_tools_to_gemini(self, tools: List[Dict[str, Any]]) -> List[types.Tool]:
         """
@@ -289,6 +361,23 @@ class GeminiClient(BaseLLMClient):
         Returns:
             List of Gemini Tool objects
         """
+        # Agents send the same definition objects on every call (ToolManager
+        # shares one per tool), so identity is enough to reuse the conversion
+        key = tuple(map(id, tools))
+        cache = self._tool_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached[1]
+
+        converted = self._build_gemini_tools(tools)
+        cache[key] = (list(tools), converted)
+        if len(cache) > _TOOL_CACHE_SIZE:
+            cache.popitem(last=False)
+        return converted
+
+    def _build_gemini_tools(self, tools: List[Dict[str, Any]]) -> Optional[List[types.Tool]]:
+        """Builds the Gemini Tool objects for `_convert_tools_to_gemini`."""
         gemini_declarations = []
         
         for tool in tools:
@@ -321,14 +410,13 @@ class GeminiClient(BaseLLMClient):
             OpenAI-style tool call dictionary
         """
         # Generate a unique ID for the tool call
-        import uuid
-        tool_call_id = f"call_{uuid.uuid4().hex[:24]}"
+        tool_call_id = f"call_{_TOOL_CALL_PREFIX}{next(_tool_call_counter):016x}"
         
         return {
             "id": tool_call_id,
             "type": "function",
             "function": {
                 "name": fc.name,
-                "arguments": json.dumps(dict(fc.args))
+                "arguments": orjson.dumps(dict(fc.args)).decode()
             }
         }
\ No newline at end of file
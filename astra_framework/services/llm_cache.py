@@ -0,0 +1,101 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, List, Union
+import orjson
+from loguru import logger
+from astra_framework.core.state import ChatMessage
+from .base_client import BaseLLMClient
+
+
+class CachedLLMClient(BaseLLMClient):
+    """
+    Wraps an LLM client and reuses its responses for identical requests.
+
+    A request is identical when the history, the tools and any extra keyword
+    arguments (e.g. `json_response`) match. Loops that retry the same prompt
+    then skip the LLM call. Only use this with clients configured for
+    deterministic output (temperature 0 or a fixed seed); otherwise it
+    changes the behavior of sampling models.
+    """
+
+    def __init__(self, client: BaseLLMClient, maxsize: int = 1024):
+        """
+        Initializes the CachedLLMClient.
+
+        Args:
+            client: The client whose responses are cached.
+            maxsize: The maximum number of responses kept; the least recently
+                used response is evicted first.
+        """
+        self.client = client
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[bytes, Union[str, Dict[str, Any]]]" = OrderedDict()
+        # Concurrent identical requests wait for the first instead of calling the LLM too
+        self._locks: Dict[bytes, asyncio.Lock] = {}
+
+    async def generate(self, history: List[ChatMessage], tools: List[Dict[str, Any]] = None, /, **kwargs) -> Union[str, Dict[str, Any]]:
+        """
+        Returns the cached response for this request, calling the wrapped
+        client on a miss. See `BaseLLMClient.generate`.
+        """
+        key = self._make_key(history, tools, kwargs)
+        response = self._get(key)
+        if response is not None:
+            return response
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                response = self._get(key)
+                if response is not None:
+                    return response
+
+                response = await self.client.generate(history, tools, **kwargs)
+                # Errors are reported as strings; don't pin them in the cache
+                if not (isinstance(response, str) and response.startswith("Error")):
+                    self._put(key, response)
+                return self._copy(response)
+        finally:
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+    async def warmup(self, connections: int = 1):
+        await self.client.warmup(connections)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    def clear(self):
+        """Drops all cached responses."""
+        self._cache.clear()
+
+    @staticmethod
+    def _make_key(history: List[ChatMessage], tools: List[Dict[str, Any]], kwargs: Dict[str, Any]) -> bytes:
+        """Serializes everything that affects the response into one hashable key."""
+        return orjson.dumps(
+            ([msg.to_dict() for msg in history], tools, kwargs),
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+
+    def _get(self, key: bytes):
+        response = self._cache.get(key)
+        if response is None:
+            return None
+        self._cache.move_to_end(key)
+        logger.debug("LLM cache hit ({} cached responses)", len(self._cache))
+        return self._copy(response)
+
+    def _put(self, key: bytes, response: Union[str, Dict[str, Any]]):
+        self._cache[key] = response
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _copy(response: Union[str, Dict[str, Any]]) -> Union[str, Dict[str, Any]]:
+        # Agents may update a tool call response in place, so hand out copies
+        if isinstance(response, dict):
+            response = dict(response)
+            if response.get("tool_calls"):
+                response["tool_calls"] = list(response["tool_calls"])
+        return response
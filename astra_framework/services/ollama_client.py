@@ -1,20 +1,71 @@
-from dataclasses import asdict
+import asyncio
+import os
 import httpx
-from typing import List, Dict, Any, Union
+import orjson
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
 from loguru import logger
 from ollama import AsyncClient
+from pydantic import BaseModel
 from astra_framework.core.state import ChatMessage
 from .base_client import BaseLLMClient
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _to_json(obj: Any) -> Any:
+    """orjson fallback for SDK models (e.g. tool calls from earlier SDK responses)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(exclude_none=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
 class OllamaClient(BaseLLMClient):
     """A client for interacting with the Ollama API."""
 
-    def __init__(self, model: str = "gemma:2b", host: str = "http://localhost:11434"):
+    def __init__(self, model: str = "gemma:2b", host: str = "http://localhost:11434",
+                 raw_http: Optional[bool] = None):
+        """
+        Args:
+            raw_http: Post chat requests serialized with orjson on a pooled
+                httpx client of our own, skipping the SDK's request models and
+                stdlib JSON encoding. Defaults to the ASTRA_USE_RAW_OLLAMA env var.
+        """
         self.model = model
-        self.client = AsyncClient(host=host)
+        self.raw_http = bool(os.environ.get("ASTRA_USE_RAW_OLLAMA")) if raw_http is None else raw_http
+        # A single pooled httpx client is reused for every generate() call so
+        # agent turns don't pay for a new connection each time.
+        timeout = httpx.Timeout(None, connect=10)
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=90)
+        self.client = AsyncClient(host=host, timeout=timeout, limits=limits)
+        # Raw requests get their own pool rather than the SDK's private httpx client
+        self.http_client = httpx.AsyncClient(base_url=host, timeout=timeout, limits=limits) if self.raw_http else None
+
+    async def warmup(self, connections: int = 1):
+        """
+        Fills the connection pool with cheap /api/tags requests so the first
+        generate() call does not pay for connection setup.
 
-    async def generate(self, history: List[ChatMessage], tools: List[Dict[str, Any]]) -> Union[str, Dict[str, Any]]:
+        Args:
+            connections: The number of connections to establish.
+        """
+        # Warm the pool that generate() will use
+        http_client = self.http_client
+        results = await asyncio.gather(
+            *(http_client.get("/api/tags") if http_client else self.client.list() for _ in range(connections)),
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            logger.warning(f"Ollama warmup failed for {len(failures)}/{connections} connections: {failures[0]}")
+        else:
+            logger.debug(f"Warmed up {connections} Ollama connection(s).")
+
+    async def aclose(self):
+        """Closes the underlying HTTP connection pools."""
+        await self.client.close()
+        if self.http_client:
+            await self.http_client.aclose()
+
+    async def generate(self, history: List[ChatMessage], tools: List[Dict[str, Any]], /) -> Union[str, Dict[str, Any]]:
         """
         Generates a response from the Ollama API.
 
@@ -28,28 +79,72 @@ class OllamaClient(BaseLLMClient):
         """
         logger.debug(f"Generating response with model: {self.model}")
 
-        messages = [asdict(msg) for msg in history]
+        messages = [msg.to_dict() for msg in history]
 
-        logger.debug(f"Sending to LLM: messages={messages}, tools={tools}")
+        logger.debug("Sending to LLM: messages={}, tools={}", messages, tools)
 
         try:
-            response = await self.client.chat(
+            if self.raw_http:
+                response = await self._chat_raw(messages, tools)
+            else:
+                response = await self.client.chat(
+                    model=self.model,
+                    messages=messages,
+                    tools=tools if tools else None,
+                )
+            return self._handle_ollama_response(response)
+
+        except httpx.ConnectError as e:
+            logger.error(f"Connection to Ollama failed: {e}")
+            return "Error: Could not connect to Ollama. Please ensure Ollama is running."
+        except Exception as e:
+            logger.error(f"An unexpected error occurred: {e}")
+            return f"An unexpected error occurred: {e}"
+
+    async def generate_stream(self, history: List[ChatMessage], tools: List[Dict[str, Any]], /) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams a response from the Ollama API, emitting each tool call as 
+        soon as Ollama returns it. See `BaseLLMClient.generate_stream`.
+        """
+        logger.debug(f"Streaming response with model: {self.model}")
+
+        messages = [msg.to_dict() for msg in history]
+
+        try:
+            stream = await self.client.chat(
                 model=self.model,
                 messages=messages,
                 tools=tools if tools else None,
+                stream=True,
             )
-            return self._handle_ollama_response(response)
+            async for chunk in stream:
+                message = chunk.get("message", {})
+                if message.get("content"):
+                    yield {"type": "content", "content": message["content"]}
+                for tool_call in message.get("tool_calls") or []:
+                    yield {"type": "tool_call", "tool_call": tool_call}
 
         except httpx.ConnectError as e:
             logger.error(f"Connection to Ollama failed: {e}")
-            return "Error: Could not connect to Ollama. Please ensure Ollama is running."
+            yield {"type": "content", "content": "Error: Could not connect to Ollama. Please ensure Ollama is running."}
         except Exception as e:
             logger.error(f"An unexpected error occurred: {e}")
-            return f"An unexpected error occurred: {e}"
+            yield {"type": "content", "content": f"An unexpected error occurred: {e}"}
+
+    async def _chat_raw(self, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Posts a non-streaming /api/chat request with an orjson body and parses the reply with orjson."""
+        body = {"model": self.model, "messages": messages, "stream": False}
+        if tools:
+            body["tools"] = tools
+        response = await self.http_client.post(
+            "/api/chat", content=orjson.dumps(body, default=_to_json), headers=_JSON_HEADERS
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     def _handle_ollama_response(self, response: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
         """Handles the response from the Ollama API."""
-        logger.debug(f"Received from LLM: {response}")
+        logger.debug("Received from LLM: {}", response)
 
         message = response.get("message", {})
         tool_calls = message.get("tool_calls")
@@ -0,0 +1,69 @@
+import sys
+from typing import Any, Optional
+import msgpack
+from loguru import logger
+from pydantic import BaseModel
+from redis import asyncio as aioredis
+from astra_framework.core.session_store import SessionStore
+from astra_framework.core.state import SessionState, ChatMessage
+
+def _to_serializable(value: Any) -> Any:
+    """Converts values msgpack can't encode natively (e.g. Pydantic models)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+def _to_message(fields: dict) -> ChatMessage:
+    """Rebuilds a ChatMessage, sharing one interned string per role."""
+    fields["role"] = sys.intern(fields["role"])
+    return ChatMessage(**fields)
+
+class RedisSessionStore(SessionStore):
+    """
+    Stores sessions in Redis so they can be shared between worker processes.
+
+    Sessions are serialized with msgpack. Pydantic models kept in
+    `SessionState.data` are stored in their JSON-compatible dict form and
+    come back as plain dicts when the session is loaded; rebuild them with
+    `Model.model_validate` where the model type is needed. Other values
+    msgpack can't encode come back as strings.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", key_prefix: str = "astra:session:", ttl_seconds: Optional[int] = None):
+        """
+        Initializes the RedisSessionStore.
+
+        Args:
+            url: The Redis connection URL.
+            key_prefix: Prefix for the Redis keys holding sessions.
+            ttl_seconds: Optional expiry for stored sessions.
+        """
+        self.client = aioredis.from_url(url)
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        logger.debug(f"RedisSessionStore initialized for {url}.")
+
+    async def load(self, session_id: str) -> Optional[SessionState]:
+        raw = await self.client.get(self.key_prefix + session_id)
+        if raw is None:
+            return None
+        payload = msgpack.unpackb(raw)
+        return SessionState(
+            session_id=session_id,
+            history=[_to_message(msg) for msg in payload["history"]],
+            data=payload["data"],
+            static_prefix=[_to_message(msg) for msg in payload.get("static_prefix", [])],
+        )
+
+    async def save(self, session_id: str, state: SessionState) -> None:
+        payload = {
+            "history": [msg.to_dict() for msg in state.history],
+            "data": state.data,
+            "static_prefix": [msg.to_dict() for msg in state.static_prefix],
+        }
+        raw = msgpack.packb(payload, default=_to_serializable)
+        await self.client.set(self.key_prefix + session_id, raw, ex=self.ttl_seconds)
+
+    async def aclose(self):
+        """Closes the Redis connection pool."""
+        await self.client.aclose()
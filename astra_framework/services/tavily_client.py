@@ -1,5 +1,7 @@
 import os
-from tavily import TavilyClient as Tavily
+import asyncio
+from typing import List
+from tavily import AsyncTavilyClient as AsyncTavily, TavilyClient as Tavily
 from loguru import logger
 
 class TavilyClient:
@@ -24,7 +26,11 @@ class TavilyClient:
         api_key = api_key or os.environ.get("TAVILY_API_KEY")
         if not api_key:
             raise ValueError("Tavily API key not provided. Set the TAVILY_API_KEY environment variable.")
+        self.api_key = api_key
+        # The SDK client keeps a requests.Session, so sync searches reuse connections
         self.client = Tavily(api_key=api_key)
+        # Created on the first `asearch` so sync-only users don't open an httpx pool
+        self._async_client = None
 
     def search(self, query: str, max_results: int = 5) -> list:
         """
@@ -44,3 +50,45 @@ class TavilyClient:
         except Exception as e:
             logger.error(f"Tavily search failed: {e}")
             return []
+
+    async def asearch(self, query: str, max_results: int = 5) -> list:
+        """
+        Performs a search using the Tavily API without blocking the event loop.
+        Every call shares one pooled HTTP client, so async tools running in
+        parallel reuse open connections.
+
+        Args:
+            query: The search query.
+            max_results: The maximum number of results to return.
+
+        Returns:
+            A list of search results, or an empty list if the search fails.
+        """
+        logger.debug("Performing async Tavily search for: '{}'", query)
+        if self._async_client is None:
+            self._async_client = AsyncTavily(api_key=self.api_key)
+        try:
+            response = await self._async_client.search(query=query, search_depth="advanced", max_results=max_results)
+            return response['results']
+        except Exception as e:
+            logger.error(f"Tavily search failed: {e}")
+            return []
+
+    async def search_many(self, queries: List[str], max_results: int = 5) -> List[list]:
+        """
+        Performs several searches concurrently.
+
+        Args:
+            queries: The search queries.
+            max_results: The maximum number of results to return per query.
+
+        Returns:
+            The results of each query, in order. Failed searches yield an empty list.
+        """
+        return await asyncio.gather(*(self.asearch(query, max_results) for query in queries))
+
+    async def aclose(self):
+        """Closes the HTTP connection pool used by `asearch`."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
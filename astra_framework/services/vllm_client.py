@@ -0,0 +1,127 @@
+import httpx
+import orjson
+from typing import List, Dict, Any, Optional, Union
+from loguru import logger
+from astra_framework.core.state import ChatMessage
+from astra_framework.core.tool import unpack_tool_call
+from .base_client import BaseLLMClient
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class VLLMClient(BaseLLMClient):
+    """
+    A client for a vLLM server's OpenAI-compatible chat API.
+
+    vLLM batches concurrent requests continuously on the server, so agents
+    running in parallel (e.g. under a ParallelAgent) share GPU forward passes
+    instead of queuing behind each other. Start the server with tool calling
+    enabled, e.g. `vllm serve <model> --enable-auto-tool-choice --tool-call-parser <parser>`.
+    """
+
+    def __init__(self, model: str, host: str = "http://localhost:8000", api_key: Optional[str] = None,
+                 temperature: Optional[float] = None):
+        """
+        Initializes the VLLMClient.
+
+        Args:
+            model: The name of the model served by vLLM.
+            host: The base URL of the vLLM server.
+            api_key: The key passed to `vllm serve --api-key`, if any.
+            temperature: The sampling temperature. Uses the server default if None.
+        """
+        self.model = model
+        self.temperature = temperature
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        # One pooled client for all requests, like OllamaClient
+        self.client = httpx.AsyncClient(
+            base_url=host,
+            headers=headers,
+            timeout=httpx.Timeout(None, connect=10),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=90),
+        )
+
+    async def aclose(self):
+        """Closes the underlying HTTP connection pool."""
+        await self.client.aclose()
+
+    async def generate(self, history: List[ChatMessage], tools: List[Dict[str, Any]], /) -> Union[str, Dict[str, Any]]:
+        """
+        Generates a response from the vLLM server.
+
+        Args:
+            history: A list of ChatMessage objects representing the conversation history.
+            tools: A list of tool definitions in JSON Schema format.
+
+        Returns:
+            A string containing the text response, or a dictionary
+            representing a tool call.
+        """
+        body = {"model": self.model, "messages": [self._to_openai_message(msg) for msg in history]}
+        if tools:
+            body["tools"] = tools
+        if self.temperature is not None:
+            body["temperature"] = self.temperature
+
+        try:
+            response = await self.client.post("/v1/chat/completions", content=orjson.dumps(body), headers=_JSON_HEADERS)
+            response.raise_for_status()
+            return self._handle_response(orjson.loads(response.content))
+
+        except httpx.ConnectError as e:
+            logger.error(f"Connection to vLLM failed: {e}")
+            return "Error: Could not connect to vLLM. Please ensure the vLLM server is running."
+        except Exception as e:
+            logger.error(f"An unexpected error occurred: {e}")
+            return f"An unexpected error occurred: {e}"
+
+    @staticmethod
+    def _to_openai_message(msg: ChatMessage) -> Dict[str, Any]:
+        """Converts a ChatMessage to the OpenAI message format."""
+        message = {"role": "assistant" if msg.role == "agent" else msg.role, "content": msg.content}
+        if msg.tool_calls:
+            message["tool_calls"] = [
+                VLLMClient._to_openai_tool_call(tool_call, i) for i, tool_call in enumerate(msg.tool_calls)
+            ]
+        if msg.tool_call_id:
+            message["tool_call_id"] = msg.tool_call_id
+        if msg.name:
+            message["name"] = msg.name
+        return message
+
+    @staticmethod
+    def _to_openai_tool_call(tool_call: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Converts a tool call from the history to the OpenAI format."""
+        name, arguments = unpack_tool_call(tool_call)
+        if not isinstance(arguments, str):
+            # The OpenAI format carries arguments as a JSON string
+            arguments = orjson.dumps(arguments).decode()
+        return {
+            "id": tool_call.get("id") or f"call_{index}",
+            "type": "function",
+            "function": {"name": name, "arguments": arguments},
+        }
+
+    @staticmethod
+    def _handle_response(response: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        """Handles a chat completion from the vLLM server."""
+        logger.debug("Received from LLM: {}", response)
+
+        message = response["choices"][0]["message"]
+        tool_calls = message.get("tool_calls")
+
+        if tool_calls:
+            logger.info("Received tool calls from vLLM.")
+            # Decode the arguments, so tools receive a dict as with Ollama
+            for tool_call in tool_calls:
+                function = tool_call["function"]
+                if isinstance(function.get("arguments"), str):
+                    try:
+                        function["arguments"] = orjson.loads(function["arguments"])
+                    except orjson.JSONDecodeError:
+                        logger.warning("Failed to parse function args: {}", function["arguments"])
+                        function["arguments"] = {}
+            return {"content": message.get("content") or "", "tool_calls": tool_calls}
+
+        logger.info("Received text response from vLLM.")
+        return message.get("content") or ""
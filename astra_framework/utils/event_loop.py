@@ -0,0 +1,27 @@
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError: # uvloop doesn't support Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs a workflow entrypoint coroutine, like `asyncio.run`, on a uvloop
+    event loop when uvloop is installed. uvloop schedules the many
+    concurrent LLM and tool calls of parallel workflows with less overhead
+    than the default loop.
+
+    Args:
+        main: The coroutine to run, e.g. `main()`.
+
+    Returns:
+        The result of the coroutine.
+    """
+    if uvloop is None:
+        return asyncio.run(main)
+    return asyncio.run(main, loop_factory=uvloop.new_event_loop)
@@ -1,8 +1,40 @@
+import string
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError: # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+_FORMATTER = string.Formatter()
+
+# A parsed template: (literal_text, field_name, format_spec, conversion) tuples
+TemplateSegments = List[Tuple[str, Optional[str], Optional[str], Optional[str]]]
+
+
+# Per prompts file path: (mtime, parsed YAML, parsed templates by prompt key).
+# Only the latest version of each file is kept, and rendered prompts are
+# never cached, so large substituted prompts don't outlive their use.
+_FILE_CACHE: Dict[str, Tuple[float, Dict[str, Any], Dict[str, TemplateSegments]]] = {}
+
+
+def _load_file(path: str, mtime: float) -> Tuple[Dict[str, Any], Dict[str, TemplateSegments]]:
+    """
+    Returns the parsed prompts file and its template cache. Loaders created
+    for the same unchanged file share both; a changed file is parsed again.
+    """
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    with open(path) as f:
+        data = yaml.load(f, Loader=_Loader)
+    segments: Dict[str, TemplateSegments] = {}
+    _FILE_CACHE[path] = (mtime, data, segments)
+    return data, segments
+
 
 class PromptLoader:
     """Loads and manages prompts from YAML configuration files"""
@@ -16,10 +48,11 @@ class PromptLoader:
         if not self.prompts_file.exists():
             raise FileNotFoundError(f"Prompts file not found: {self.prompts_file}")
         
-        with open(self.prompts_file) as f:
-            data = yaml.safe_load(f)
+        # Parsed templates by prompt key, shared with loaders of the same file
+        # so each template is parsed only once
+        data, self._parsed = _load_file(str(self.prompts_file), self.prompts_file.stat().st_mtime)
         
-        logger.info(f"✅ Loaded prompts from: {self.prompts_file}")
+        logger.info("✅ Loaded prompts from: {}", self.prompts_file)
         return data
     
     def get_prompt(self, prompt_key: str, **kwargs) -> str:
@@ -34,25 +67,48 @@ class PromptLoader:
         Returns:
             Formatted prompt string or raw template
         """
-        if prompt_key not in self.prompts_data["prompts"]:
+        prompt_config = self.prompts_data["prompts"].get(prompt_key)
+        if prompt_config is None:
             raise KeyError(f"Prompt '{prompt_key}' not found in {self.prompts_file}")
         
-        prompt_config = self.prompts_data["prompts"][prompt_key]
         template = prompt_config["template"]
         
         # If no kwargs, return the raw template
         if not kwargs:
             return template
             
+        segments = self._parsed.get(prompt_key)
+        if segments is None:
+            segments = self._parsed[prompt_key] = list(_FORMATTER.parse(template))
+
         try:
-            formatted = template.format(**kwargs)
-            logger.debug(f"📝 Loaded prompt: {prompt_config['name']}")
+            formatted = self._render(segments, kwargs)
+            logger.debug("📝 Loaded prompt: {}", prompt_config['name'])
             return formatted.strip()
         except KeyError as e:
             raise ValueError(
                 f"Missing required variable for prompt '{prompt_key}': {e}"
             )
     
+    @staticmethod
+    def _render(segments: TemplateSegments, kwargs: Dict[str, Any]) -> str:
+        """Renders a parsed template, equivalent to template.format(**kwargs)."""
+        parts = []
+        for literal, field, spec, conversion in segments:
+            parts.append(literal)
+            if field is None:
+                continue
+            if not spec and not conversion and field in kwargs:
+                # Plain "{name}" fields, the common case in prompt templates
+                parts.append(str(kwargs[field]))
+                continue
+            value, _ = _FORMATTER.get_field(field, (), kwargs)
+            value = _FORMATTER.convert_field(value, conversion)
+            if spec and "{" in spec:
+                spec = _FORMATTER.vformat(spec, (), kwargs)
+            parts.append(format(value, spec))
+        return "".join(parts)
+
     def list_prompts(self) -> Dict[str, str]:
         """List all available prompts"""
         return {
@@ -1,20 +1,24 @@
+import os
 import sys
 import asyncio
 import re
+from functools import lru_cache
 from loguru import logger
 from typing import List, Callable, Dict, Any, Optional
 
 # --- Web Server Imports ---
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request, Response
+import msgspec
 import uvicorn
 
 # --- Observability Imports ---
-import phoenix as px
+# (Phoenix itself is imported and launched in a startup hook)
 from openinference.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+import grpc
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 # --- Astra Framework Imports ---
 from astra_framework.manager import WorkflowManager
@@ -27,13 +31,27 @@ from astra_framework.core.state import ChatMessage
 # ==============================================================================
 # 1. CONFIGURE PHOENIX OBSERVABILITY
 # ==============================================================================
-# Launch Phoenix in the background
-px.launch_app()
+# Set ASTRA_TRACING=0 to skip Phoenix and OpenTelemetry entirely (e.g. for benchmarks)
+TRACING_ENABLED = os.environ.get("ASTRA_TRACING", "1") != "0"
+# Uvicorn worker processes to start when run as a script; see section 7
+WORKERS = int(os.environ.get("A2A_WORKERS", "1"))
+tracer_provider = None
 
-# Set up an OTLP endpoint and a tracer provider
-endpoint = "http://127.0.0.1:6006/v1/traces"
-tracer_provider = TracerProvider()
-tracer_provider.add_span_processor(SimpleSpanProcessor(OTLPSpanExporter(endpoint)))
+if TRACING_ENABLED:
+    # Set up an OTLP endpoint and a tracer provider. Spans are sent over Phoenix's
+    # gRPC OTLP listener with gzip compression.
+    endpoint = "127.0.0.1:4317"
+    tracer_provider = TracerProvider()
+    # Export spans from a background thread in batches so the OTLP POST is not in
+    # the /invoke request path. Explicit kwargs take precedence over the SDK's own
+    # OTEL_BSP_* handling, so the env vars are read here to keep them as overrides.
+    tracer_provider.add_span_processor(BatchSpanProcessor(
+        OTLPSpanExporter(endpoint=endpoint, insecure=True, compression=grpc.Compression.Gzip),
+        max_queue_size=int(os.environ.get("OTEL_BSP_MAX_QUEUE_SIZE", 10000)),
+        max_export_batch_size=int(os.environ.get("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 512)),
+        schedule_delay_millis=int(os.environ.get("OTEL_BSP_SCHEDULE_DELAY", 2000))
+    ))
+    trace.set_tracer_provider(tracer_provider)
 
 # ==============================================================================
 # 2. CONFIGURE LOGGER
@@ -49,26 +67,42 @@ logger.add(
 # ==============================================================================
 # 3. DEFINE A2A PROTOCOL MODELS (for FastAPI)
 # ==============================================================================
-# Pydantic models define the expected JSON request and response shapes
-class A2AInvokeRequest(BaseModel):
+# msgspec Structs define the expected JSON request and response shapes. They
+# are decoded/encoded in C, which is cheaper than Pydantic on the hot path.
+class A2AInvokeRequest(msgspec.Struct):
     workflow_name: str
-    session_id: Optional[str] = None  # Session is optional; we create one if not provided
     prompt: str
+    session_id: Optional[str] = None  # Session is optional; we create one if not provided
 
-class A2AInvokeResponse(BaseModel):
+class A2AInvokeResponse(msgspec.Struct):
     session_id: str
     content: str
     status: str
 
+# JSON schemas for the OpenAPI docs, since FastAPI can't derive them from Structs
+_, _A2A_SCHEMAS = msgspec.json.schema_components(
+    [A2AInvokeRequest, A2AInvokeResponse],
+    ref_template="#/components/schemas/{name}"
+)
+_invoke_request_decoder = msgspec.json.Decoder(A2AInvokeRequest)
+_invoke_response_encoder = msgspec.json.Encoder()
+
 # ==============================================================================
 # 4. SET UP THE MOCK LLM AND TOOLS (Copied from run_workflow.py)
 # ==============================================================================
 # This server needs its own LLM client and tools
 # In a real app, this would be imported, not re-defined.
 
+# Compiled once; used to pull the numbers out of the user's prompt
+_DIGIT_RE = re.compile(r"\d+")
+
 class MockLLMClient(BaseLLMClient):
     """A mock LLM that returns the 'dict' structure for tool calls."""
     def __init__(self):
+        # Keyword in the agent instruction -> handler, checked in order
+        self._handlers = (("add", self._handle_add), ("multiply", self._handle_multiply))
+        # Instructions are fixed per agent, so the handler lookup is memoized
+        self._dispatch: Dict[str, Callable] = {}
         logger.debug("MockLLMClient initialized.")
 
     async def generate(self, history: List[ChatMessage], tools: list) -> str | dict:
@@ -79,30 +113,46 @@ class MockLLMClient(BaseLLMClient):
         if last_message.role == "tool":
             return f"Operation complete. The result is {last_message.content}."
 
-        if "add" in instruction:
-            user_prompt = history[1].content
-            nums = re.findall(r"(\d+)", user_prompt)
-            a, b = int(nums[0]), int(nums[1])
-            return {"tool_calls": [{"function": {"name": "add", "arguments": {"a": a, "b": b}}}]}
-
-        if "multiply" in instruction:
-            last_tool_result = None
-            for msg in reversed(history):
-                if msg.role == "tool":
-                    last_tool_result = int(msg.content)
-                    break
-            if not last_tool_result:
-                return "Error: I am the multiplier, but no previous tool result was found."
-            user_prompt = history[1].content
-            c = int(re.findall(r"(\d+)", user_prompt)[-1])
-            return {"tool_calls": [{"function": {"name": "multiply", "arguments": {"a": last_tool_result, "b": c}}}]}
-        
+        handler = self._dispatch.get(instruction)
+        if handler is None:
+            handler = self._resolve_handler(instruction)
+            self._dispatch[instruction] = handler
+        return handler(history)
+
+    def _resolve_handler(self, instruction: str) -> Callable:
+        for keyword, handler in self._handlers:
+            if keyword in instruction:
+                return handler
+        return self._handle_unknown
+
+    def _handle_add(self, history: List[ChatMessage]) -> dict:
+        user_prompt = history[1].content
+        nums = _DIGIT_RE.findall(user_prompt)
+        a, b = int(nums[0]), int(nums[1])
+        return {"tool_calls": [{"function": {"name": "add", "arguments": {"a": a, "b": b}}}]}
+
+    def _handle_multiply(self, history: List[ChatMessage]) -> str | dict:
+        last_tool_result = None
+        for msg in reversed(history):
+            if msg.role == "tool":
+                last_tool_result = int(msg.content)
+                break
+        if last_tool_result is None:
+            return "Error: I am the multiplier, but no previous tool result was found."
+        user_prompt = history[1].content
+        c = int(_DIGIT_RE.findall(user_prompt)[-1])
+        return {"tool_calls": [{"function": {"name": "multiply", "arguments": {"a": last_tool_result, "b": c}}}]}
+
+    def _handle_unknown(self, history: List[ChatMessage]) -> str:
         return "I am not sure what to do."
 
+# The tools are pure, so repeated calls with the same numbers are memoized
+@lru_cache(maxsize=1024)
 def add(a: int, b: int) -> int:
     """Adds two integers."""
     return a + b
 
+@lru_cache(maxsize=1024)
 def multiply(a: int, b: int) -> int:
     """Multiplies two integers."""
     return a * b
@@ -113,7 +163,12 @@ def multiply(a: int, b: int) -> int:
 logger.info("Initializing Astra Framework for A2A Server...")
 
 # --- Create the Facade ---
-manager = WorkflowManager()
+# Set A2A_REDIS_URL to share sessions between workers through Redis
+session_store = None
+if os.environ.get("A2A_REDIS_URL"):
+    from astra_framework.services.redis_session_store import RedisSessionStore
+    session_store = RedisSessionStore(os.environ["A2A_REDIS_URL"])
+manager = WorkflowManager(session_store=session_store)
 
 # --- Create the LLM service ---
 mock_llm = MockLLMClient()
@@ -151,7 +206,47 @@ app = FastAPI(
 )
 
 # Instrument the FastAPI app
-FastAPIInstrumentor().instrument_app(app, tracer_provider=tracer_provider)
+if TRACING_ENABLED:
+    FastAPIInstrumentor().instrument_app(app, tracer_provider=tracer_provider)
+
+@app.on_event("startup")
+async def launch_phoenix():
+    """
+    Launches Phoenix in the background once the server is starting. With
+    several workers, the parent process launches it instead, so the workers
+    don't compete for its port.
+    """
+    if TRACING_ENABLED and WORKERS == 1:
+        import phoenix as px
+        px.launch_app()
+
+@app.on_event("startup")
+async def prewarm_connections():
+    """
+    Opens the LLM and trace exporter connections before serving traffic so
+    the first /invoke doesn't pay for connection setup.
+    """
+    logger.info("Pre-warming LLM and OTLP connections...")
+    await mock_llm.warmup(connections=4)
+    if TRACING_ENABLED:
+        with tracer_provider.get_tracer(__name__).start_as_current_span("server-startup"):
+            pass
+        # force_flush blocks until the export finishes, so keep it off the loop
+        await asyncio.to_thread(tracer_provider.force_flush, 5000)
+
+@app.on_event("shutdown")
+async def flush_traces():
+    """Flushes any spans still buffered in the batch processor."""
+    if TRACING_ENABLED:
+        logger.info("Shutting down tracer provider and flushing spans...")
+        tracer_provider.shutdown()
+
+@app.on_event("shutdown")
+async def close_llm_client():
+    """Closes the LLM client's pooled connections."""
+    await mock_llm.aclose()
+    if session_store:
+        await session_store.aclose()
 
 # ==============================================================================
 # 6. DEFINE THE A2A SERVER ENDPOINTS
@@ -174,13 +269,31 @@ async def get_agent_card():
         ]
     }
 
-@app.post("/invoke", summary="Invoke an Agent Workflow", response_model=A2AInvokeResponse)
-async def handle_a2a_invoke(request: A2AInvokeRequest):
+@app.post(
+    "/invoke",
+    summary="Invoke an Agent Workflow",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _A2A_SCHEMAS["A2AInvokeRequest"]}}
+        }
+    },
+    responses={
+        200: {"content": {"application/json": {"schema": _A2A_SCHEMAS["A2AInvokeResponse"]}}}
+    }
+)
+async def handle_a2a_invoke(http_request: Request) -> Response:
     """
     This is the main A2A endpoint. It receives a request,
     translates it for the WorkflowManager, runs the agent,
     and translates the response back to JSON.
     """
+    try:
+        request = _invoke_request_decoder.decode(await http_request.body())
+    except msgspec.DecodeError as e:
+        # msgspec.ValidationError is a DecodeError, so this covers both
+        raise HTTPException(status_code=422, detail=str(e))
+
     logger.info(f"POST /invoke requested for workflow: {request.workflow_name}")
     logger.debug(f"Request: {request}")
     
@@ -206,7 +319,10 @@ async def handle_a2a_invoke(request: A2AInvokeRequest):
             status=response.status
         )
         logger.debug(f"Response: {invoke_response}")
-        return invoke_response
+        return Response(
+            content=_invoke_response_encoder.encode(invoke_response),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Unhandled error in /invoke: {e}")
@@ -216,5 +332,23 @@ async def handle_a2a_invoke(request: A2AInvokeRequest):
 # 7. RUN THE SERVER
 # ==============================================================================
 if __name__ == "__main__":
+    # Without a session store, sessions live in this process's WorkflowManager
+    # and extra workers will not see each other's sessions.
+    workers = WORKERS
+    if workers > 1 and not session_store:
+        logger.warning(f"Starting {workers} workers: sessions are not shared between workers.")
+    if workers > 1 and TRACING_ENABLED:
+        # One Phoenix for all workers, started before they are forked
+        import phoenix as px
+        px.launch_app()
     logger.info("Starting Uvicorn server on http://127.0.0.1:8000")
-    uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
+    uvicorn.run(
+        # Multiple workers need an import string so each process can load the app
+        "a2a_server:app" if workers > 1 else app,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="127.0.0.1",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=workers
+    )
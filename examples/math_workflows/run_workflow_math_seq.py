@@ -1,4 +1,3 @@
-import asyncio
 import sys
 from loguru import logger
 from pydantic import BaseModel
@@ -9,6 +8,7 @@ from astra_framework.manager import WorkflowManager
 from astra_framework.agents.llm_agent import LLMAgent
 from astra_framework.agents.sequential_agent import SequentialAgent
 from astra_framework.services.client_factory import LLMClientFactory
+from astra_framework.utils.event_loop import run_async
 
 # ==============================================================================
 # 1. CONFIGURE LOGGER
@@ -102,4 +102,4 @@ async def main():
         print(f"- {msg.role.upper()}: {msg.content}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_async(main())
\ No newline at end of file
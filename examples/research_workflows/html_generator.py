@@ -1,13 +1,21 @@
-from typing import List
+from collections import defaultdict
+from typing import Dict, List
+from loguru import logger
 from astra_framework.core.agent import BaseAgent
 from astra_framework.core.state import SessionState
-from models import Article, FinalReport, Editorial, Newsletter
+from models import FinalReport, Editorial, Newsletter
+
+# Topic names become anchor ids: spaces to dashes, then lower-cased
+_SLUG_TABLE = str.maketrans({" ": "-"})
 
 class HtmlGenerator(BaseAgent):
 
     def __init__(self, agent_name: str, html_template_path: str):
         super().__init__(agent_name=agent_name)
         self.html_template_path = html_template_path
+        # Read once; every execute() renders the same template
+        with open(html_template_path, 'r') as f:
+            self._template_str = f.read()
 
     async def execute(self, state: SessionState) -> SessionState:
         editorial: Editorial = state.data.get("editorial")
@@ -15,43 +23,43 @@ class HtmlGenerator(BaseAgent):
         if not editorial:
             raise ValueError("Editorial data not found in session state.")
 
-        with open(self.html_template_path, 'r') as f:
-            html_template = f.read()
+        html_template = self._template_str
 
-        reports_html = ""
-        toc_items = ""
+        # Collected as fragments and joined once, instead of repeated string +=
+        reports_parts = []
+        toc_parts = []
+        append_report = reports_parts.append
         
         # Group reports by topic name
-        reports_by_topic = {}
+        reports_by_topic: Dict[str, List[FinalReport]] = defaultdict(list)
         for report in editorial.final_report:
-            if report.topic_name not in reports_by_topic:
-                reports_by_topic[report.topic_name] = []
             reports_by_topic[report.topic_name].append(report)
 
         for topic_name, reports in reports_by_topic.items():
-            topic_id = topic_name.replace(" ", "-").lower()
-            toc_items += f'<li><a href="#{topic_id}">{topic_name}</a></li>'
-            reports_html += f'''<div class="topic-section" id="{topic_id}">
+            topic_id = topic_name.translate(_SLUG_TABLE).lower()
+            toc_parts.append(f'<li><a href="#{topic_id}">{topic_name}</a></li>')
+            append_report(f'''<div class="topic-section" id="{topic_id}">
 <h2>{topic_name}</h2>
-'''
+''')
 
             for i, report in enumerate(reports):
                 report_id = f"report-{topic_id}-{i}"
                 
-                articles_html = ""
-                for article in report.articles:
-                    articles_html += f"""
+                articles_html = "".join(
+                    f"""
                     <div class="article">
                         <h3><a href="{article.url}" target="_blank">{article.title}</a></h3>
-                        <p><strong>Published:</strong> {article.published_date if article.published_date else 'N/A'}</p>
-                        <p>{article.summary if article.summary else article.content}</p>
+                        <p><strong>Published:</strong> {article.published_date or 'N/A'}</p>
+                        <p>{article.summary or article.content}</p>
                     </div>
                     """
+                    for article in report.articles
+                )
                 
                 status_class = "approved" if report.approved else "feedback"
                 status_text = "Approved" if report.approved else f"Feedback: {report.feedback}"
 
-                reports_html += f"""
+                append_report(f"""
                 <div class="report" id="{report_id}">
                     <h3>{report.editorial}</h3>
                     <p><strong>Status:</strong> <span class="{status_class}">{status_text}</span></p>
@@ -60,17 +68,16 @@ class HtmlGenerator(BaseAgent):
                         {articles_html}
                     </div>
                 </div>
-                """
-            reports_html += '</div>\n' # Close topic-section
+                """)
+            append_report('</div>\n') # Close topic-section
 
-        print("--- DEBUG: reports_html ---")
-        print(reports_html)
-        print("--- END DEBUG: reports_html ---")
+        reports_html = "".join(reports_parts)
+        logger.opt(lazy=True).debug("[{}] Built reports_html ({} chars)", lambda: self.agent_name, lambda: len(reports_html))
 
         full_html = html_template.format(
             main_title=editorial.main_title,
             editorial_content=editorial.editorial_content,
-            toc_items=toc_items,
+            toc_items="".join(toc_parts),
             reports_html=reports_html
         )
 
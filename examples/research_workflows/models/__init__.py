@@ -0,0 +1,3 @@
+from .newsletter import SourceArticle, ArticleList, FinalReport, Editorial, Newsletter
+
+__all__ = ["SourceArticle", "ArticleList", "FinalReport", "Editorial", "Newsletter"]
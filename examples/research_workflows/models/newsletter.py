@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class SourceArticle(BaseModel):
+    url: str
+    title: str
+    content: str
+    published_date: Optional[str] = None
+    summary: Optional[str] = None
+
+
+class ArticleList(BaseModel):
+    articles: List[SourceArticle]
+
+
+class FinalReport(BaseModel):
+    editorial: str
+    articles: List[SourceArticle]
+    approved: bool
+    feedback: str = ""
+    topic_name: str
+
+
+class Editorial(BaseModel):
+    main_title: str
+    editorial_content: str
+    final_report: List[FinalReport]
+
+
+class Newsletter(BaseModel):
+    html_content: str
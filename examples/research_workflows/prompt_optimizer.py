@@ -8,12 +8,14 @@
 # =============================================================================
 
 import asyncio
+import difflib
 import json
 import uuid
 import sys
 from pathlib import Path
 from loguru import logger
 from typing import Dict, Any, List
+from pydantic import ValidationError
 import yaml
 
 # Add the current directory to sys.path to allow absolute imports from within the script's directory
@@ -21,8 +23,10 @@ sys.path.append(str(Path(__file__).parent))
 
 from astra_framework.services.client_factory import LLMClientFactory
 from astra_framework.core.state import SessionState, ChatMessage
+from astra_framework.core.models import JSONText
 from astra_framework.services.base_client import BaseLLMClient
 from astra_framework.utils.prompt_loader import PromptLoader
+from astra_framework.utils.event_loop import run_async
 
 from models.models import PromptOptimizationResult
 
@@ -73,10 +77,17 @@ class Config:
     
     # The model used for the *simulation* (the agent we are testing)
     SIMULATION_LLM_MODEL = "qwen3:latest" 
+    # "vllm" serves concurrent simulations (see `optimize_many`) with continuous
+    # batching; set SIMULATION_LLM_MODEL to the model name the vLLM server uses
+    SIMULATION_CLIENT_TYPE = "ollama"
     
     # We might need fewer iterations as each refinement step is much more powerful
     MAX_OPTIMIZATION_ITERATIONS = 3
+    # Stop early once a refinement is at least this similar to the prompt it refined
+    CONVERGENCE_SIMILARITY = 0.98
     SIMULATION_DEPTH = 5 # How many steps to simulate the agent for
+    # Each simulation step feeds the previous response back, so steps run in
+    # order; `optimize_many` overlaps whole prompt versions instead.
 
 
 # ==============================================================================
@@ -134,7 +145,9 @@ class PromptOptimizer:
         logger.info("🚀 Initializing Prompt Optimizer...")
         
         # --- MODIFIED ---
-        # Create the powerful LLM client for optimization
+        # Create the powerful LLM client for optimization. The optimizer owns its
+        # clients, keeping their connection pools open across every simulation
+        # and refinement call until `aclose`.
         self.optimizer_llm_client = LLMClientFactory.create_client(
             client_type="gemini", # Assuming a 'google' client type for Gemini
             model=Config.OPTIMIZER_LLM_MODEL
@@ -142,7 +155,7 @@ class PromptOptimizer:
         
         # Create the LLM client for simulation
         self.simulation_llm_client = LLMClientFactory.create_client(
-            client_type="ollama",
+            client_type=Config.SIMULATION_CLIENT_TYPE,
             model=Config.SIMULATION_LLM_MODEL
         )
         
@@ -158,6 +171,12 @@ class PromptOptimizer:
         
         logger.success("✅ Initialization complete")
 
+    async def aclose(self):
+        """Releases the LLM clients' connection pools."""
+        for client in (self.optimizer_llm_client, self.simulation_llm_client):
+            if client:
+                await client.aclose()
+
     async def _simulate_react_agent_thinking(
         self,
         instruction_to_simulate: str,
@@ -194,7 +213,7 @@ class PromptOptimizer:
             # Use the *simulation* client
             llm_response = await self.simulation_llm_client.generate(
                 execution_history,
-                tools=self.tool_definitions
+                self.tool_definitions
             )
             
             # (Rest of the simulation logic is identical to your original code)
@@ -267,23 +286,23 @@ class PromptOptimizer:
         # Call the Optimizer FM (e.g., Gemini)
         response_str = await self.optimizer_llm_client.generate(
             messages,
-            json_response=True # Request JSON output if the client supports it
+            # Constrain the output to the result schema, so it is always valid JSON of the right shape
+            response_schema=PromptOptimizationResult
         )
         
         try:
-            # Parse the JSON response
-            response_data = json.loads(str(response_str))
-            result = PromptOptimizationResult(
-                feedback=response_data.get("feedback", "No feedback provided."),
-                optimized_prompt=response_data.get("optimized_prompt", original_prompt)
-            )
+            # Validate the JSON the client already parsed, or parse it directly
+            if isinstance(response_str, JSONText):
+                result = PromptOptimizationResult.model_validate(response_str.parsed)
+            else:
+                result = PromptOptimizationResult.model_validate_json(str(response_str))
             
             if result.optimized_prompt == original_prompt:
                 logger.warning("Optimizer did not provide a new prompt.")
 
             return result
         
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
             logger.error(f"Failed to decode JSON from optimizer: {e}")
             logger.error(f"Raw response: {response_str}")
             # Return the original prompt to avoid crashing
@@ -373,6 +392,11 @@ class PromptOptimizer:
             )
             
             # 3. ITERATE
+            # A failed refinement returns the original prompt too, but is worth retrying
+            converged = (
+                not refinement_result.feedback.startswith("Error:")
+                and self._has_converged(current_prompt_template, refinement_result.optimized_prompt)
+            )
             # The new optimized prompt becomes the template for the next iteration
             current_prompt_template = refinement_result.optimized_prompt
             all_feedback.append(f"**Iteration {i + 1} Feedback:**\n{refinement_result.feedback}")
@@ -380,6 +404,11 @@ class PromptOptimizer:
             logger.success(f"Iteration {i + 1} refinement complete.")
             final_result = refinement_result # Store the latest result
 
+            if converged:
+                # Another cycle would simulate and refine (nearly) the same prompt again
+                logger.info(f"Prompt converged after {i + 1} iteration(s). Stopping early.")
+                break
+
         logger.success("✨ Optimization complete!")
         
         # Combine all feedback for the final report
@@ -388,6 +417,28 @@ class PromptOptimizer:
         
         return final_result
 
+    @staticmethod
+    def _has_converged(previous_prompt: str, optimized_prompt: str) -> bool:
+        """Returns whether a refinement left the prompt (almost) unchanged."""
+        if optimized_prompt == previous_prompt:
+            return True
+        matcher = difflib.SequenceMatcher(None, previous_prompt, optimized_prompt)
+        # The quick upper bounds rule out most real rewrites without the full diff
+        return (
+            matcher.real_quick_ratio() >= Config.CONVERGENCE_SIMILARITY
+            and matcher.quick_ratio() >= Config.CONVERGENCE_SIMILARITY
+            and matcher.ratio() >= Config.CONVERGENCE_SIMILARITY
+        )
+
+    async def optimize_many(self, prompt_versions: List[str]) -> List[PromptOptimizationResult]:
+        """
+        Optimizes several prompt versions concurrently. Each version's
+        simulate/refine loop is independent, so their LLM calls overlap.
+        Ollama serves as many simulation requests at once as the server's
+        OLLAMA_NUM_PARALLEL setting allows; the rest queue server-side.
+        """
+        return await asyncio.gather(*(self.optimize(version) for version in prompt_versions))
+
 
 # ==============================================================================
 # ENTRY POINT
@@ -398,9 +449,9 @@ async def main():
     logger.info("PROMPT OPTIMIZATION WORKFLOW (Refactored)")
     logger.info("=" * 60)
     
+    optimizer = PromptOptimizer()
     try:
         # Create and initialize optimizer
-        optimizer = PromptOptimizer()
         await optimizer.initialize()
         
         # Run optimization
@@ -432,6 +483,8 @@ async def main():
     except Exception as e:
         logger.exception(f"❌ Optimization failed: {e}")
         raise
+    finally:
+        await optimizer.aclose()
 
 
 if __name__ == "__main__":
@@ -442,4 +495,4 @@ if __name__ == "__main__":
     #   feedback: str
     #   optimized_prompt: str
     
-    asyncio.run(main())
+    run_async(main())
@@ -1,4 +1,3 @@
-import asyncio
 from loguru import logger
 from pydantic import BaseModel
 from typing import List, Callable, Optional
@@ -11,6 +10,7 @@ from astra_framework.agents.sequential_agent import SequentialAgent
 from astra_framework.services.client_factory import LLMClientFactory
 from astra_framework.services.tavily_client import TavilyClient
 from astra_framework.core.state import SessionState
+from astra_framework.utils.event_loop import run_async
 
 # ==============================================================================
 # 1. CONFIGURE LOGGER
@@ -177,4 +177,4 @@ async def main():
 
 if __name__ == "__main__":
     # Note: You need to have the TAVILY_API_KEY environment variable set for this to work.
-    asyncio.run(main())
\ No newline at end of file
+    run_async(main())
\ No newline at end of file
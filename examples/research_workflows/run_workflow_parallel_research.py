@@ -1,6 +1,5 @@
 import sys
 import os
-import asyncio
 import json
 from loguru import logger
 from typing import List, Callable, Optional
@@ -17,9 +16,10 @@ from astra_framework.core.state import SessionState
 from astra_framework.services.base_client import BaseLLMClient
 from html_generator import HtmlGenerator
 from astra_framework.core.tool import ToolManager
+from astra_framework.utils.event_loop import run_async
 
 # --- Import Pydantic models ---
-from models import Article, ArticleList, FinalReport, Editorial, Newsletter
+from models import ArticleList, FinalReport, Editorial, Newsletter
 
 # ==============================================================================
 # 1. CONFIGURE LOGGER
@@ -202,4 +202,4 @@ async def main():
                                                                                                                                                                                                       
 if __name__ == "__main__":
     # Note: You need to have the TAVILY_API_KEY environment variable set for this to work.
-    asyncio.run(main())
+    run_async(main())
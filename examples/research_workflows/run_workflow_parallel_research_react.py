@@ -1,6 +1,5 @@
 import sys
 import os
-import asyncio
 import json
 from loguru import logger
 from typing import List
@@ -14,6 +13,7 @@ from astra_framework.builders.workflow_builder import WorkflowBuilder # New Buil
 from astra_framework.services.client_factory import LLMClientFactory
 from astra_framework.services.tavily_client import TavilyClient
 from astra_framework.core.tool import ToolManager
+from astra_framework.utils.event_loop import run_async
 
 # ==============================================================================
 # 1. CONFIGURE LOGGER
@@ -51,14 +51,14 @@ tool_manager = ToolManager()
 tavily_client = TavilyClient()
 
 @tool_manager.register
-def search_the_web(query: str) -> str:
+async def search_the_web(query: str) -> str:
     """
     Searches the web for a given query using the Tavily API.
     :param query: The search query.
     """
     logger.info(f"TOOL: Searching the web for '{query}'")
     # The ReAct agent will observe this string output
-    return json.dumps(tavily_client.search(query))
+    return json.dumps(await tavily_client.asearch(query))
 
 @tool_manager.register
 def generate_html_newsletter(payload: NewsletterPayload) -> str:
@@ -168,4 +168,4 @@ async def main():
                     f"Content={final_response.final_content}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -1,4 +1,3 @@
-import asyncio
 import json
 from loguru import logger
 from pydantic import BaseModel
@@ -15,6 +14,7 @@ from astra_framework.services.client_factory import LLMClientFactory
 from astra_framework.services.tavily_client import TavilyClient
 from astra_framework.core.state import SessionState
 from astra_framework.core.workflow_models import WorkflowPlan, AgentConfig
+from astra_framework.utils.event_loop import run_async
 
 # ==============================================================================
 # 1. CONFIGURE LOGGER
@@ -130,4 +130,4 @@ async def main():
 
 if __name__ == "__main__":
     # Note: You need to have the TAVILY_API_KEY environment variable set for this to work.
-    asyncio.run(main())
+    run_async(main())
@@ -1,5 +1,4 @@
 import sys
-import asyncio
 from loguru import logger
 from pydantic import BaseModel
 from typing import List, Callable
@@ -11,6 +10,7 @@ from astra_framework.agents.loop_agent import LoopAgent
 from astra_framework.agents.sequential_agent import SequentialAgent
 from astra_framework.services.client_factory import LLMClientFactory
 from astra_framework.core.state import SessionState
+from astra_framework.utils.event_loop import run_async
 
 # ==============================================================================
 # 1. CONFIGURE LOGGER
@@ -119,4 +119,4 @@ async def main():
         print(f"--- Final Answer ---\n{final_response.final_content}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -1,6 +1,7 @@
 import pytest
+from pydantic import BaseModel
 from astra_framework.core.agent import BaseAgent
-from astra_framework.core.state import SessionState
+from astra_framework.core.state import SessionState, ChatMessage
 from astra_framework.core.models import AgentResponse
 
 class DummyAgent(BaseAgent):
@@ -11,3 +12,24 @@ def test_base_agent_creation():
     agent = DummyAgent(agent_name="dummy")
     assert agent.agent_name == "dummy"
     assert not agent.keep_alive_state
+
+@pytest.mark.asyncio
+async def test_get_summary_uses_last_five_messages():
+    agent = DummyAgent(agent_name="dummy")
+    history = [ChatMessage(role="user", content=f"m{i}") for i in range(6)]
+    history.append(ChatMessage(role="critic", content="done"))
+
+    summary = await agent._get_summary(history)
+
+    assert summary == "Summary of last 5 messages:\nUSER: m2\nUSER: m3\nUSER: m4\nUSER: m5\nCRITIC: done"
+
+class Verdict(BaseModel):
+    approved: bool
+    score: int = 0
+
+def test_validate_structured_output_normalizes_content():
+    agent = DummyAgent(agent_name="dummy", output_structure=Verdict)
+
+    assert agent._validate_structured_output('{"approved": true, "extra": 1}') == '{"approved":true,"score":0}'
+    with pytest.raises(ValueError):
+        agent._validate_structured_output('{"score": 1}')
@@ -0,0 +1,45 @@
+import asyncio
+import pytest
+from weakref import WeakKeyDictionary
+from astra_framework.services.base_client import BaseLLMClient
+from astra_framework.services.client_factory import LLMClientFactory
+from astra_framework.services.ollama_client import OllamaClient
+
+class EchoClient(BaseLLMClient):
+    def __init__(self, model: str):
+        self.model = model
+
+    async def generate(self, history, tools):
+        return history[-1].content
+
+def test_create_client():
+    client = LLMClientFactory.create_client(client_type="ollama", model="test_model")
+    assert isinstance(client, OllamaClient)
+    assert client.model == "test_model"
+
+def test_create_unknown_client():
+    with pytest.raises(ValueError):
+        LLMClientFactory.create_client(client_type="unknown", model="test_model")
+
+def test_register_client(monkeypatch):
+    monkeypatch.setattr(LLMClientFactory, "_registry", dict(LLMClientFactory._registry))
+    LLMClientFactory.register("echo", EchoClient)
+    assert isinstance(LLMClientFactory.create_client(client_type="echo", model="m"), EchoClient)
+
+@pytest.mark.asyncio
+async def test_get_client_is_shared(monkeypatch):
+    monkeypatch.setattr(LLMClientFactory, "_shared_clients", WeakKeyDictionary())
+    first = LLMClientFactory.get_client(client_type="ollama", model="test_model")
+    assert LLMClientFactory.get_client(client_type="ollama", model="test_model") is first
+    assert LLMClientFactory.get_client(client_type="ollama", model="other_model") is not first
+
+def test_get_client_is_not_shared_between_loops(monkeypatch):
+    monkeypatch.setattr(LLMClientFactory, "_shared_clients", WeakKeyDictionary())
+
+    async def get():
+        return LLMClientFactory.get_client(client_type="ollama", model="test_model")
+
+    assert asyncio.run(get()) is not asyncio.run(get())
+    # Outside a loop, each call gets its own client
+    assert LLMClientFactory.get_client(client_type="ollama", model="test_model") is not \
+        LLMClientFactory.get_client(client_type="ollama", model="test_model")
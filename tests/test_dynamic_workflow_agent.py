@@ -4,6 +4,7 @@ from astra_framework.agents.dynamic_workflow_agent import DynamicWorkflowAgent
 from astra_framework.core.state import SessionState, ChatMessage
 from astra_framework.core.models import AgentResponse
 from astra_framework.core.workflow_models import WorkflowPlan, AgentConfig
+from pydantic import ValidationError
 from astra_framework.agents.llm_agent import LLMAgent
 from astra_framework.agents.sequential_agent import SequentialAgent
 from astra_framework.agents.parallel_agent import ParallelAgent
@@ -168,3 +169,13 @@ async def test_dynamic_workflow_agent_invalid_plan(dynamic_workflow_agent):
     assert response.status == "error"
     assert "Failed to build or execute dynamic workflow" in response.final_content
     assert "Unknown agent type: UnknownAgent" in response.final_content
+
+def test_workflow_plan_is_frozen():
+    plan = WorkflowPlan(
+        main_topic="topic",
+        workflow_description="description",
+        root_agent=AgentConfig(agent_type="SequentialAgent", agent_name="root",
+                               children=[AgentConfig(agent_type="LLMAgent", agent_name="child")]),
+    )
+    with pytest.raises(ValidationError):
+        plan.root_agent.agent_name = "renamed"
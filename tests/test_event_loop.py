@@ -0,0 +1,9 @@
+import asyncio
+from astra_framework.utils.event_loop import run_async
+
+def test_run_async_returns_result():
+    async def main():
+        await asyncio.sleep(0)
+        return 42
+
+    assert run_async(main()) == 42
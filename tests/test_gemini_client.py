@@ -1,18 +1,125 @@
+import orjson
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from google.genai import types
+from pydantic import BaseModel
+from astra_framework.core.models import JSONText
 from astra_framework.services.gemini_client import GeminiClient
 from astra_framework.core.state import ChatMessage
-from typing import List, Dict, Any, Union
+
+class Answer(BaseModel):
+    value: int
+
+def make_chunk(text=None, finish_reason=None):
+    content = types.Content(role="model", parts=[types.Part(text=text)]) if text else None
+    return types.GenerateContentResponse(candidates=[
+        types.Candidate(content=content, finish_reason=finish_reason)
+    ])
+
+def stream_of(*chunks):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+    return AsyncMock(return_value=stream())
 
 @pytest.fixture
 def gemini_client():
-    return GeminiClient(model="test_model")
+    with patch("astra_framework.services.gemini_client.genai.Client", MagicMock()):
+        return GeminiClient(model="test_model")
 
 def test_gemini_client_instantiation(gemini_client):
-    assert gemini_client.model == "test_model"
+    assert gemini_client.model_name == "test_model"
+
+@pytest.mark.asyncio
+async def test_gemini_client_generate_streams_text(gemini_client):
+    models = gemini_client.client.aio.models
+    models.generate_content_stream = stream_of(
+        make_chunk("Hello, "), make_chunk("world."), make_chunk(finish_reason=types.FinishReason.STOP)
+    )
+
+    response = await gemini_client.generate([ChatMessage(role="user", content="hello")])
+
+    assert response == "Hello, world."
+    models.generate_content.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_gemini_client_generate(gemini_client):
-    history = [ChatMessage(role="user", content="hello")]
-    tools = []
-    response = await gemini_client.generate(history, tools)
-    assert response == "This is a placeholder response from GeminiClient."
+async def test_gemini_client_stream_without_finish_reason_is_truncated(gemini_client):
+    gemini_client.client.aio.models.generate_content_stream = stream_of(make_chunk('{"value": '))
+
+    response = await gemini_client.generate([ChatMessage(role="user", content="hello")], json_response=True)
+
+    assert response.startswith("Error: Response truncated")
+
+@pytest.mark.asyncio
+async def test_gemini_client_json_response(gemini_client):
+    models = gemini_client.client.aio.models
+    models.generate_content_stream = stream_of(make_chunk('{"value": 4}', finish_reason=types.FinishReason.STOP))
+
+    response = await gemini_client.generate([ChatMessage(role="user", content="2 + 2?")], response_schema=Answer)
+
+    assert isinstance(response, JSONText)
+    assert response == '{"value": 4}'
+    assert response.parsed == {"value": 4}
+    config = models.generate_content_stream.call_args.kwargs["config"]
+    assert config.response_mime_type == "application/json"
+    assert config.response_schema is Answer
+
+@pytest.mark.asyncio
+async def test_gemini_client_generate_tool_call(gemini_client):
+    models = gemini_client.client.aio.models
+    function_call = types.FunctionCall(name="add", args={"a": 2, "b": 2})
+    models.generate_content = AsyncMock(return_value=types.GenerateContentResponse(candidates=[
+        types.Candidate(
+            content=types.Content(role="model", parts=[types.Part(text="Adding."), types.Part(function_call=function_call)]),
+            finish_reason=types.FinishReason.STOP,
+        )
+    ]))
+    tools = [{"type": "function", "function": {"name": "add", "description": "Adds.", "parameters": {"type": "object"}}}]
+
+    response = await gemini_client.generate([ChatMessage(role="user", content="2 + 2?")], tools)
+
+    assert response["content"] == "Adding."
+    [tool_call] = response["tool_calls"]
+    assert tool_call["function"]["name"] == "add"
+    assert orjson.loads(tool_call["function"]["arguments"]) == {"a": 2, "b": 2}
+    models.generate_content_stream.assert_not_called()
+
+def test_gemini_client_converts_history(gemini_client):
+    history = [
+        ChatMessage(role="system", content="Be brief."),
+        ChatMessage(role="user", content="2 + 2?"),
+        ChatMessage(role="agent", content="", tool_calls=[{"function": {"name": "add", "arguments": '{"a": 2, "b": 2}'}}]),
+        ChatMessage(role="tool", content="4", tool_call_id="call_0", name="add"),
+        ChatMessage(role="agent", content=""),
+    ]
+
+    params = gemini_client._build_api_params(history, None, json_response=False)
+
+    assert params["config"].system_instruction == "Be brief."
+    user, call, result = params["contents"]
+    assert (user.role, user.parts[0].text) == ("user", "2 + 2?")
+    assert call.role == "model"
+    assert (call.parts[0].function_call.name, call.parts[0].function_call.args) == ("add", {"a": 2, "b": 2})
+    assert result.role == "user"
+    assert result.parts[0].function_response.name == "add"
+    assert result.parts[0].function_response.response == {"content": "4"}
+
+def test_gemini_client_reuses_converted_tools(gemini_client):
+    add = {"type": "function", "function": {"name": "add", "description": "Adds.", "parameters": {"type": "object"}}}
+    sub = {"type": "function", "function": {"name": "sub", "description": "Subtracts.", "parameters": {"type": "object"}}}
+
+    converted = gemini_client._convert_tools_to_gemini([add])
+    assert gemini_client._convert_tools_to_gemini([add]) is converted
+    # A different definition object is converted again
+    assert gemini_client._convert_tools_to_gemini([add, sub]) is not converted
+    [tool] = gemini_client._convert_tools_to_gemini([sub])
+    assert [declaration.name for declaration in tool.function_declarations] == ["sub"]
+
+def test_gemini_client_tool_cache_is_bounded(gemini_client, monkeypatch):
+    from astra_framework.services import gemini_client as module
+    monkeypatch.setattr(module, "_TOOL_CACHE_SIZE", 2)
+
+    for name in ("a", "b", "c"):
+        gemini_client._convert_tools_to_gemini([{"type": "function", "function": {"name": name}}])
+
+    assert len(gemini_client._tool_cache) == 2
@@ -79,7 +79,7 @@ async def test_llm_agent_execute_tool_call(llm_agent):
     state = SessionState(session_id="test_session")
     response = await llm_agent.execute(state)
 
-    llm_agent.tool_manager.execute_tool.assert_called_once_with("test_tool", arg1="value1")
+    llm_agent.tool_manager.execute_tool.assert_called_once_with("test_tool", {"arg1": "value1"})
     assert response.status == "success"
     assert response.final_content == "final text response"
     assert len(state.history) == 3 # Agent (tool call), tool, agent (final response)
@@ -105,3 +105,149 @@ async def test_llm_agent_execute_invalid_response(llm_agent):
 
     assert response.status == "error"
     assert "Invalid LLM response." in response.final_content
+
+@pytest.mark.asyncio
+async def test_llm_agent_reuses_cached_tool_definitions(llm_agent):
+    llm_agent.llm.generate.return_value = "simple text response"
+    llm_agent._get_tool_definitions = MagicMock()
+
+    await llm_agent.execute(SessionState(session_id="s1"))
+    await llm_agent.execute(SessionState(session_id="s2"))
+
+    llm_agent._get_tool_definitions.assert_not_called()
+    first_tools = llm_agent.llm.generate.call_args_list[0].args[1]
+    second_tools = llm_agent.llm.generate.call_args_list[1].args[1]
+    assert first_tools is second_tools
+    assert first_tools[-1]["function"]["name"] == "structured_output"
+
+@pytest.mark.asyncio
+async def test_llm_agent_tool_loop_extends_llm_history(llm_agent):
+    seen_history_lengths = []
+
+    async def generate(history, tools):
+        seen_history_lengths.append(len(history))
+        if len(seen_history_lengths) < 3:
+            return {"tool_calls": [{"function": {"name": "test_tool", "arguments": {}}}]}
+        return "done"
+
+    llm_agent.llm.generate.side_effect = generate
+    state = SessionState(session_id="test_session")
+    response = await llm_agent.execute(state)
+
+    assert response.final_content == "done"
+    # System prompt, then two messages (call + result) per tool round
+    assert seen_history_lengths == [1, 3, 5]
+
+@pytest.mark.asyncio
+async def test_llm_agent_reuses_frozen_system_message(llm_agent):
+    llm_agent.llm.generate.return_value = "simple text response"
+
+    await llm_agent.execute(SessionState(session_id="s1"))
+    await llm_agent.execute(SessionState(session_id="s2"))
+
+    first_system = llm_agent.llm.generate.call_args_list[0].args[0][0]
+    second_system = llm_agent.llm.generate.call_args_list[1].args[0][0]
+    assert first_system is second_system
+    assert first_system.content.startswith("Test instruction")
+    assert "structured_output" in first_system.content
+    assert llm_agent.instruction == "Test instruction"
+
+def test_tool_definitions_shared_between_agents():
+    def shared_tool(a: int) -> int:
+        """A tool used by two agents."""
+        return a
+
+    first = LLMAgent("First", MockOllamaClient(), [shared_tool], "first")
+    second = LLMAgent("Second", MockOllamaClient(), [shared_tool], "second")
+
+    assert first._tool_definitions[0] is second._tool_definitions[0]
+    assert first._tool_definitions[0]["function"]["description"] == "A tool used by two agents."
+
+@pytest.mark.asyncio
+async def test_llm_agent_reuses_cacheable_tool_results():
+    from astra_framework.core.tool import cacheable
+
+    calls = []
+
+    @cacheable
+    def square(x: int) -> int:
+        """Squares a number."""
+        calls.append(x)
+        return x * x
+
+    agent = LLMAgent("CacheAgent", MockOllamaClient(), [square], "Use square.")
+    tool_call = {"tool_calls": [{"function": {"name": "square", "arguments": {"x": 3}}}]}
+    agent.llm.generate.side_effect = [tool_call, tool_call, "done"]
+
+    state = SessionState(session_id="test_session")
+    response = await agent.execute(state)
+
+    assert response.final_content == "done"
+    assert calls == [3]
+    assert [msg.content for msg in state.history if msg.role == "tool"] == ["9", "9"]
+
+@pytest.mark.asyncio
+async def test_llm_agent_cached_tool_with_name_parameter():
+    from astra_framework.core.tool import cacheable
+
+    calls = []
+
+    @cacheable
+    def greet(name: str) -> str:
+        """Greets someone."""
+        calls.append(name)
+        return f"Hello, {name}!"
+
+    agent = LLMAgent("CacheAgent", MockOllamaClient(), [greet], "Use greet.")
+    tool_call = {"tool_calls": [{"function": {"name": "greet", "arguments": {"name": "Ada"}}}]}
+    agent.llm.generate.side_effect = [tool_call, tool_call, "done"]
+
+    state = SessionState(session_id="test_session")
+    await agent.execute(state)
+
+    assert calls == ["Ada"]
+    assert [msg.content for msg in state.history if msg.role == "tool"] == ["Hello, Ada!", "Hello, Ada!"]
+
+@pytest.mark.asyncio
+async def test_llm_agent_cached_tool_results_expire(monkeypatch):
+    from astra_framework.agents import llm_agent
+    from astra_framework.core.tool import cacheable
+
+    calls = []
+    now = [100.0]
+    monkeypatch.setattr(llm_agent.time, "monotonic", lambda: now[0])
+
+    @cacheable
+    def square(x: int) -> int:
+        """Squares a number."""
+        calls.append(x)
+        return x * x
+
+    agent = LLMAgent("CacheAgent", MockOllamaClient(), [square], "Use square.", tool_cache_ttl=10)
+    state = SessionState(session_id="test_session")
+
+    await agent._run_tool(state, "square", {"x": 3})
+    now[0] += 5
+    await agent._run_tool(state, "square", {"x": 3})
+    assert calls == [3]
+
+    now[0] += 10
+    await agent._run_tool(state, "square", {"x": 3})
+    assert calls == [3, 3]
+
+@pytest.mark.asyncio
+async def test_llm_agent_does_not_cache_regular_tools():
+    calls = []
+
+    def square(x: int) -> int:
+        """Squares a number."""
+        calls.append(x)
+        return x * x
+
+    agent = LLMAgent("NoCacheAgent", MockOllamaClient(), [square], "Use square.")
+    tool_call = {"tool_calls": [{"function": {"name": "square", "arguments": {"x": 3}}}]}
+    agent.llm.generate.side_effect = [tool_call, tool_call, "done"]
+
+    await agent.execute(SessionState(session_id="test_session"))
+
+    assert calls == [3, 3]
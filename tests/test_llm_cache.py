@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from astra_framework.core.state import ChatMessage
+from astra_framework.services.base_client import BaseLLMClient
+from astra_framework.services.llm_cache import CachedLLMClient
+
+class CountingLLMClient(BaseLLMClient):
+    def __init__(self, response="cached response"):
+        self.response = response
+        self.calls = 0
+
+    async def generate(self, history, tools=None, /, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.response
+
+@pytest.mark.asyncio
+async def test_identical_requests_hit_cache():
+    inner = CountingLLMClient()
+    client = CachedLLMClient(inner)
+    history = [ChatMessage(role="user", content="hello")]
+
+    assert await client.generate(history, []) == "cached response"
+    assert await client.generate([ChatMessage(role="user", content="hello")], []) == "cached response"
+    assert inner.calls == 1
+
+    await client.generate([ChatMessage(role="user", content="bye")], [])
+    await client.generate(history, [], json_response=True)
+    assert inner.calls == 3
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_call_once():
+    inner = CountingLLMClient()
+    client = CachedLLMClient(inner)
+    history = [ChatMessage(role="user", content="hello")]
+
+    await asyncio.gather(*(client.generate(history, []) for _ in range(5)))
+    assert inner.calls == 1
+
+@pytest.mark.asyncio
+async def test_errors_and_evicted_entries_are_not_reused():
+    inner = CountingLLMClient(response="Error: boom")
+    client = CachedLLMClient(inner, maxsize=1)
+    history = [ChatMessage(role="user", content="hello")]
+
+    await client.generate(history, [])
+    await client.generate(history, [])
+    assert inner.calls == 2
+
+    inner.response = "ok"
+    await client.generate(history, [])
+    await client.generate([ChatMessage(role="user", content="other")], [])
+    await client.generate(history, [])
+    assert inner.calls == 5
+
+@pytest.mark.asyncio
+async def test_tool_call_responses_are_copied():
+    inner = CountingLLMClient(response={"content": "", "tool_calls": [{"function": {"name": "add"}}]})
+    client = CachedLLMClient(inner)
+    history = [ChatMessage(role="user", content="hello")]
+
+    first = await client.generate(history, [])
+    first["tool_calls"].clear()
+    second = await client.generate(history, [])
+    assert len(second["tool_calls"]) == 1
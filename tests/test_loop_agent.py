@@ -101,3 +101,43 @@ async def test_loop_agent_max_loops_reached(session_state):
     assert response.final_content.approved == False
     assert child_agent._call_count == 2 # Should run max_loops times
     assert len(session_state.history) == 4 # Initial prompt + 2 critiques + 2 feedback messages
+
+@pytest.mark.asyncio
+async def test_loop_agent_exits_when_output_unchanged(session_state):
+    child_responses = [
+        MockCritiqueResult(approved=False, feedback="Same feedback."),
+        MockCritiqueResult(approved=False, feedback="Same feedback."),
+        MockCritiqueResult(approved=False, feedback="Never reached."),
+    ]
+    child_agent = MockChildAgent("ChildAgent", child_responses)
+
+    loop_agent = LoopAgent(
+        agent_name="TestLoopAgent",
+        child=child_agent,
+        max_loops=3,
+        keep_alive_state=True
+    )
+
+    response = await loop_agent.execute(session_state)
+
+    assert response.final_content.feedback == "Same feedback."
+    assert child_agent._call_count == 2
+
+@pytest.mark.asyncio
+async def test_loop_agent_exits_on_child_error(session_state):
+    class ErrorChildAgent(BaseAgent):
+        def __init__(self):
+            super().__init__("ErrorChild")
+            self.call_count = 0
+
+        async def execute(self, state: SessionState) -> AgentResponse:
+            self.call_count += 1
+            return AgentResponse(status="error", final_content="boom")
+
+    child_agent = ErrorChildAgent()
+    loop_agent = LoopAgent(agent_name="TestLoopAgent", child=child_agent, max_loops=3)
+
+    response = await loop_agent.execute(session_state)
+
+    assert response.status == "error"
+    assert child_agent.call_count == 1
@@ -1,7 +1,7 @@
 import pytest
 from astra_framework.manager import WorkflowManager
 from astra_framework.core.agent import BaseAgent
-from astra_framework.core.state import SessionState
+from astra_framework.core.state import SessionState, current_session
 from astra_framework.core.models import AgentResponse
 
 class DummyAgent(BaseAgent):
@@ -22,6 +22,8 @@ def test_create_session(manager):
     session_id = manager.create_session()
     assert session_id in manager.sessions
     assert isinstance(manager.sessions[session_id], SessionState)
+    assert len(session_id) == 32
+    assert manager.create_session() != session_id
 
 @pytest.mark.asyncio
 async def test_run_workflow(manager):
@@ -38,3 +40,44 @@ async def test_run_unknown_workflow(manager):
     response = await manager.run("unknown_workflow", session_id, "test prompt")
     assert response.status == "error"
     assert "Workflow 'unknown_workflow' not found." in response.final_content
+
+@pytest.mark.asyncio
+async def test_run_unknown_session(manager):
+    manager.register_workflow("test_workflow", DummyAgent(agent_name="dummy"))
+    with pytest.raises(Exception, match="Session not found"):
+        await manager.run("test_workflow", "missing", "test prompt")
+
+@pytest.mark.asyncio
+async def test_run_binds_current_session(manager):
+    seen = []
+
+    class SessionAwareAgent(BaseAgent):
+        async def execute(self, state: SessionState) -> AgentResponse:
+            seen.append(current_session.get())
+            return AgentResponse(status="success", final_content="ok")
+
+    manager.register_workflow("test_workflow", SessionAwareAgent(agent_name="aware"))
+    session_id = manager.create_session()
+    await manager.run("test_workflow", session_id, "test prompt")
+
+    assert seen == [manager.sessions[session_id]]
+    assert current_session.get() is None
+
+@pytest.mark.asyncio
+async def test_run_many(manager):
+    manager.register_workflow("test_workflow", DummyAgent(agent_name="dummy"))
+    session_id = manager.create_session()
+
+    responses = await manager.run_many("test_workflow", session_id, ["first", "second"])
+
+    assert [response.final_content for response in responses] == ["dummy response", "dummy response"]
+    assert [msg.content for msg in manager.sessions[session_id].history] == ["first", "second"]
+
+@pytest.mark.asyncio
+async def test_run_many_unknown_workflow(manager):
+    session_id = manager.create_session()
+
+    responses = await manager.run_many("unknown_workflow", session_id, ["first", "second"])
+
+    assert [response.status for response in responses] == ["error", "error"]
+    assert all("Workflow 'unknown_workflow' not found." in response.final_content for response in responses)
@@ -1,4 +1,8 @@
-from astra_framework.core.models import AgentResponse, ToolCall
+import copy
+import pickle
+import pytest
+from dataclasses import FrozenInstanceError
+from astra_framework.core.models import AgentResponse, JSONText, ToolCall
 
 def test_agent_response_creation():
     response = AgentResponse(status="success", final_content="test content")
@@ -9,3 +13,21 @@ def test_tool_call_creation():
     tool_call = ToolCall(name="test_tool", args={"arg1": "value1"})
     assert tool_call.name == "test_tool"
     assert tool_call.args == {"arg1": "value1"}
+
+def test_tool_call_is_frozen():
+    tool_call = ToolCall(name="test_tool", args={})
+    with pytest.raises(FrozenInstanceError):
+        tool_call.name = "other_tool"
+
+def test_json_text_is_the_raw_string():
+    text = JSONText('{"a": 1}', {"a": 1})
+    assert text == '{"a": 1}'
+    assert isinstance(text, str)
+    assert text.parsed == {"a": 1}
+
+def test_json_text_copies_and_pickles():
+    text = JSONText('{"a": 1}', {"a": 1})
+    for clone in (copy.copy(text), copy.deepcopy(text), pickle.loads(pickle.dumps(text))):
+        assert isinstance(clone, JSONText)
+        assert clone == '{"a": 1}'
+        assert clone.parsed == {"a": 1}
@@ -4,6 +4,7 @@ from astra_framework.services.ollama_client import OllamaClient
 from astra_framework.core.state import ChatMessage
 from typing import List, Dict, Any, Union
 import httpx # Import httpx for ConnectError
+import orjson
 
 @pytest.fixture
 def ollama_client():
@@ -52,3 +53,69 @@ async def test_ollama_client_generate_unexpected_error(ollama_client):
     tools = []
     response = await ollama_client.generate(history, tools)
     assert "An unexpected error occurred: Something went wrong" in response
+
+@pytest.mark.asyncio
+async def test_ollama_client_aclose(ollama_client):
+    await ollama_client.aclose()
+    ollama_client.client.close.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_ollama_client_warmup(ollama_client):
+    await ollama_client.warmup(connections=3)
+    assert ollama_client.client.list.await_count == 3
+
+@pytest.mark.asyncio
+async def test_ollama_client_warmup_failure_is_not_raised(ollama_client):
+    ollama_client.client.list.side_effect = httpx.ConnectError("Connection refused")
+    await ollama_client.warmup()
+
+@pytest.mark.asyncio
+async def test_ollama_client_generate_stream(ollama_client):
+    async def chunks():
+        yield {"message": {"content": "Thinking..."}}
+        yield {"message": {"tool_calls": [{"function": {"name": "test_tool", "arguments": {}}}]}}
+
+    ollama_client.client.chat.return_value = chunks()
+    history = [ChatMessage(role="user", content="use tool")]
+
+    events = [event async for event in ollama_client.generate_stream(history, [])]
+
+    assert events == [
+        {"type": "content", "content": "Thinking..."},
+        {"type": "tool_call", "tool_call": {"function": {"name": "test_tool", "arguments": {}}}},
+    ]
+    assert ollama_client.client.chat.call_args.kwargs["stream"] is True
+
+@pytest.mark.asyncio
+async def test_ollama_client_generate_raw_http():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"message": {"role": "assistant", "content": "raw reply"}})
+
+    client = OllamaClient(model="test_model", raw_http=True)
+    client.http_client = httpx.AsyncClient(base_url="http://ollama.test", transport=httpx.MockTransport(handler))
+
+    response = await client.generate([ChatMessage(role="user", content="hi")], [])
+
+    assert response == "raw reply"
+    assert requests[0].url.path == "/api/chat"
+    body = orjson.loads(requests[0].content)
+    assert body["model"] == "test_model"
+    assert body["stream"] is False
+    assert "tools" not in body
+    assert body["messages"][0]["content"] == "hi"
+
+@pytest.mark.asyncio
+async def test_ollama_client_raw_http_owns_its_pool():
+    assert OllamaClient(model="test_model").http_client is None
+
+    client = OllamaClient(model="test_model", raw_http=True)
+    client.client = AsyncMock()
+    http_client = client.http_client
+    assert isinstance(http_client, httpx.AsyncClient)
+
+    await client.aclose()
+    client.client.close.assert_awaited_once()
+    assert http_client.is_closed
@@ -62,3 +62,27 @@ async def test_parallel_agent_with_failing_child(session_state):
     assert response.final_content[0] == "result1"
     assert response.final_content[1] is None # Failing child's result should be None
     assert response.final_content[2] == "result3"
+
+@pytest.mark.asyncio
+async def test_parallel_agent_max_concurrency(session_state):
+    import asyncio
+
+    running = 0
+    peak = 0
+
+    class SlowChildAgent(BaseAgent):
+        async def execute(self, state: SessionState) -> AgentResponse:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return AgentResponse(status="success", final_content=self.agent_name)
+
+    children = [SlowChildAgent(f"Child{i}") for i in range(5)]
+    agent = ParallelAgent(agent_name="TestParallelAgent", children=children, max_concurrency=2)
+
+    response = await agent.execute(session_state)
+
+    assert response.final_content == [f"Child{i}" for i in range(5)]
+    assert peak == 2
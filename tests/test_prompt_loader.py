@@ -0,0 +1,54 @@
+import os
+import pytest
+from astra_framework.utils.prompt_loader import PromptLoader
+
+PROMPTS_YAML = """
+prompts:
+  greeting:
+    name: Greeting
+    description: Greets a user
+    template: |
+      Hello {name}, you have {count:>3} new {kind!r} messages. {{literal}}
+"""
+
+@pytest.fixture
+def loader(tmp_path):
+    prompts_file = tmp_path / "prompts.yaml"
+    prompts_file.write_text(PROMPTS_YAML)
+    return PromptLoader(prompts_file)
+
+def test_get_prompt_matches_str_format(loader):
+    template = loader.get_prompt("greeting")
+    kwargs = {"name": "Ada", "count": 7, "kind": "unread"}
+
+    assert loader.get_prompt("greeting", **kwargs) == template.format(**kwargs).strip()
+    # The parsed template is reused on later calls
+    assert loader.get_prompt("greeting", **kwargs) == template.format(**kwargs).strip()
+    assert list(loader._parsed) == ["greeting"]
+
+def test_get_prompt_missing_variable(loader):
+    with pytest.raises(ValueError, match="Missing required variable"):
+        loader.get_prompt("greeting", name="Ada")
+
+def test_loaders_share_parsed_file(loader):
+    other = PromptLoader(loader.prompts_file)
+    assert other.prompts_data is loader.prompts_data
+
+def test_changed_file_is_reloaded(loader):
+    stat = loader.prompts_file.stat()
+    loader.prompts_file.write_text(PROMPTS_YAML.replace("Greets a user", "Says hi"))
+    os.utime(loader.prompts_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert PromptLoader(loader.prompts_file).list_prompts() == {"greeting": "Says hi"}
+
+def test_parsed_templates_are_shared_until_the_file_changes(loader):
+    loader.get_prompt("greeting", name="Ada", count=1, kind="new")
+    assert PromptLoader(loader.prompts_file)._parsed is loader._parsed
+
+    stat = loader.prompts_file.stat()
+    loader.prompts_file.write_text(PROMPTS_YAML.replace("Hello", "Hi"))
+    os.utime(loader.prompts_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = PromptLoader(loader.prompts_file)
+    assert reloaded._parsed == {}
+    assert reloaded.get_prompt("greeting", name="Ada", count=1, kind="new").startswith("Hi Ada")
@@ -0,0 +1,254 @@
+import json
+import math
+import pytest
+from unittest.mock import AsyncMock
+from astra_framework.agents.react_agent import ReActAgent
+from astra_framework.core.state import SessionState, ChatMessage
+from astra_framework.services.base_client import BaseLLMClient
+
+class MockLLMClient(BaseLLMClient):
+    def __init__(self):
+        self.generate = AsyncMock()
+
+    async def generate(self, history, tools):
+        pass
+
+def add(a: int, b: int) -> int:
+    """Adds two integers."""
+    return a + b
+
+@pytest.fixture
+def react_agent():
+    return ReActAgent(
+        agent_name="TestReActAgent",
+        llm_client=MockLLMClient(),
+        tools=[add],
+        instruction="Test instruction"
+    )
+
+def test_extract_thinking(react_agent):
+    thinking, content = react_agent._extract_thinking(
+        "<THINK>first</THINK>Answer <think>second</think> text"
+    )
+    assert thinking == "first\nsecond"
+    assert content == "Answer  text"
+
+def test_extract_thinking_uses_first_matching_tag(react_agent):
+    thinking, content = react_agent._extract_thinking(
+        "<reasoning>why</reasoning><internal>hidden</internal>Answer"
+    )
+    assert thinking == "why"
+    assert content == "<internal>hidden</internal>Answer"
+
+def test_extract_thinking_without_tags(react_agent):
+    assert react_agent._extract_thinking("  plain answer ") == (None, "plain answer")
+
+@pytest.mark.asyncio
+async def test_react_agent_executes_tool_then_answers(react_agent):
+    react_agent.llm.generate.side_effect = [
+        {"content": "", "tool_calls": [{"id": "call_1", "function": {"name": "add", "arguments": {"a": 1, "b": 2}}}]},
+        "<think>done</think>Here is the final answer: the sum is 3."
+    ]
+    state = SessionState(session_id="test_session")
+    state.add_message(role="user", content="What is 1 + 2?")
+
+    response = await react_agent.execute(state)
+
+    assert response.status == "success"
+    assert response.final_content == "Here is the final answer: the sum is 3."
+    assert response.metadata == {"thinking": "done"}
+    tool_messages = [msg for msg in state.history if msg.role == "tool"]
+    assert len(tool_messages) == 1
+    assert tool_messages[0].content == "3"
+    assert tool_messages[0].tool_call_id == "call_1"
+    first_tools, second_tools = [call.args[1] for call in react_agent.llm.generate.call_args_list]
+    assert first_tools is second_tools
+    # Only the new turns are synced back, after the original user message
+    assert [msg.role for msg in state.history] == ["user", "assistant", "tool", "assistant"]
+
+def test_is_final_answer(react_agent):
+    assert react_agent._is_final_answer("In Conclusion, the answer is 3.")
+    assert not react_agent._is_final_answer("I NEED TO look this up. Here is the plan.")
+    assert not react_agent._is_final_answer("too short")
+    assert react_agent._is_final_answer("x" * 51)
+    assert not react_agent._is_final_answer("x" * 40)
+
+@pytest.mark.asyncio
+async def test_react_agent_runs_tool_calls_concurrently():
+    import asyncio
+
+    running = 0
+    peak = 0
+
+    async def slow_echo(value: str) -> str:
+        """Echoes a value slowly."""
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value
+
+    agent = ReActAgent("ParallelReAct", MockLLMClient(), [slow_echo], "Test instruction")
+    agent.llm.generate.side_effect = [
+        {"content": "", "tool_calls": [
+            {"id": "call_1", "function": {"name": "slow_echo", "arguments": {"value": "first"}}},
+            {"id": "call_2", "function": {"name": "slow_echo", "arguments": {"value": "second"}}},
+        ]},
+        "Here is the final answer: first and second."
+    ]
+    state = SessionState(session_id="test_session")
+    state.add_message(role="user", content="Echo twice")
+
+    await agent.execute(state)
+
+    assert peak == 2
+    tool_messages = [msg for msg in state.history if msg.role == "tool"]
+    assert [msg.tool_call_id for msg in tool_messages] == ["call_1", "call_2"]
+    assert [msg.content for msg in tool_messages] == ["first", "second"]
+
+def test_has_async_tool(react_agent):
+    async def fetch(url: str) -> str:
+        """Fetches a URL."""
+        return url
+
+    react_agent.tool_manager.register(fetch)
+    add_call = {"function": {"name": "add", "arguments": {"a": 1, "b": 2}}}
+    fetch_call = {"function": {"name": "fetch", "arguments": {"url": "x"}}}
+
+    assert not react_agent._has_async_tool([add_call, add_call])
+    assert react_agent._has_async_tool([add_call, fetch_call])
+
+@pytest.mark.asyncio
+async def test_react_agent_speculative_tools_start_during_stream():
+    import asyncio
+
+    started = asyncio.Event()
+
+    async def lookup(key: str) -> str:
+        """Looks up a key."""
+        started.set()
+        return f"value-{key}"
+
+    class StreamingLLMClient(BaseLLMClient):
+        def __init__(self):
+            self.turn = 0
+
+        async def generate(self, history, tools):
+            raise AssertionError("speculative mode should stream")
+
+        async def generate_stream(self, history, tools):
+            self.turn += 1
+            if self.turn == 1:
+                yield {"type": "tool_call", "tool_call": {"id": "call_1", "function": {"name": "lookup", "arguments": {"key": "a"}}}}
+                # The tool is already running before the stream finishes
+                await asyncio.wait_for(started.wait(), timeout=1)
+                yield {"type": "content", "content": "Looking it up."}
+            else:
+                yield {"type": "content", "content": "Here is the final answer: "}
+                yield {"type": "content", "content": "value-a."}
+
+    agent = ReActAgent("SpeculativeReAct", StreamingLLMClient(), [lookup], "Test instruction",
+                       speculative_tools=True)
+    state = SessionState(session_id="test_session")
+    state.add_message(role="user", content="Look up a")
+
+    response = await agent.execute(state)
+
+    assert response.final_content == "Here is the final answer: value-a."
+    tool_messages = [msg for msg in state.history if msg.role == "tool"]
+    assert [msg.content for msg in tool_messages] == ["value-a"]
+
+@pytest.mark.asyncio
+async def test_react_agent_speculative_tools_run_in_order_without_parallel_tools():
+    import asyncio
+
+    events = []
+
+    async def record(key: str) -> str:
+        """Records a key."""
+        events.append(f"start-{key}")
+        await asyncio.sleep(0.01)
+        events.append(f"end-{key}")
+        return key
+
+    class StreamingLLMClient(BaseLLMClient):
+        def __init__(self):
+            self.turn = 0
+
+        async def generate(self, history, tools):
+            raise AssertionError("speculative mode should stream")
+
+        async def generate_stream(self, history, tools):
+            self.turn += 1
+            if self.turn == 1:
+                for key in ("a", "b", "c"):
+                    yield {"type": "tool_call", "tool_call": {"id": f"call_{key}", "function": {"name": "record", "arguments": {"key": key}}}}
+            else:
+                yield {"type": "content", "content": "Here is the final answer: recorded all keys."}
+
+    agent = ReActAgent("SerialSpeculativeReAct", StreamingLLMClient(), [record], "Test instruction",
+                       parallel_tools=False, speculative_tools=True)
+    state = SessionState(session_id="test_session")
+    state.add_message(role="user", content="Record a, b and c")
+
+    await agent.execute(state)
+
+    assert events == ["start-a", "end-a", "start-b", "end-b", "start-c", "end-c"]
+    assert [msg.content for msg in state.history if msg.role == "tool"] == ["a", "b", "c"]
+
+@pytest.mark.asyncio
+async def test_react_agent_speculative_tools_with_non_streaming_client(react_agent):
+    react_agent.speculative_tools = True
+    react_agent.llm.generate.side_effect = [
+        {"content": "", "tool_calls": [{"id": "call_1", "function": {"name": "add", "arguments": {"a": 1, "b": 2}}}]},
+        "Here is the final answer: the sum is 3."
+    ]
+    state = SessionState(session_id="test_session")
+    state.add_message(role="user", content="What is 1 + 2?")
+
+    response = await react_agent.execute(state)
+
+    assert response.final_content == "Here is the final answer: the sum is 3."
+    assert [msg.content for msg in state.history if msg.role == "tool"] == ["3"]
+
+@pytest.mark.asyncio
+async def test_react_agent_sends_static_prefix_first(react_agent):
+    react_agent.llm.generate.return_value = "Here is the final answer: done."
+    state = SessionState(session_id="test_session")
+    state.static_prefix.append(ChatMessage(role="system", content="shared context"))
+    state.add_message(role="user", content="Hi")
+
+    await react_agent.execute(state)
+
+    sent = react_agent.llm.generate.call_args.args[0]
+    assert [msg.content for msg in sent] == ["shared context", "Test instruction", "Hi"]
+    assert [msg.content for msg in state.history] == ["Hi", "Here is the final answer: done."]
+
+@pytest.mark.asyncio
+async def test_execute_single_tool_serializes_non_string_results():
+    def stats(values: list) -> dict:
+        """Returns stats for the values."""
+        return {"count": len(values), 1: "int key"}
+
+    agent = ReActAgent("StatsReAct", MockLLMClient(), [stats], "Test instruction")
+
+    message = await agent._execute_single_tool(
+        {"id": "call_1", "function": {"name": "stats", "arguments": {"values": [1, 2]}}}
+    )
+
+    assert message.content == '{"count":2,"1":"int key"}'
+
+@pytest.mark.asyncio
+async def test_execute_single_tool_serializes_big_int_results():
+    def factorials(n: int) -> list:
+        """Returns n and n! for large n."""
+        return [n, math.factorial(n)]
+
+    agent = ReActAgent("BigIntReAct", MockLLMClient(), [factorials], "Test instruction")
+
+    message = await agent._execute_single_tool(
+        {"id": "call_1", "function": {"name": "factorials", "arguments": {"n": 25}}}
+    )
+
+    assert message.content == json.dumps([25, math.factorial(25)])
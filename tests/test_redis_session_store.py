@@ -0,0 +1,69 @@
+import pytest
+from pydantic import BaseModel
+from astra_framework.core.state import ChatMessage, SessionState
+
+# Needs the optional "redis" extra
+pytest.importorskip("msgpack")
+pytest.importorskip("redis")
+
+from astra_framework.services.redis_session_store import RedisSessionStore
+
+class FakeRedis:
+    """Keeps values in a dict, with the parts of the redis.asyncio API the store uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.expiry = {}
+        self.closed = False
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.expiry[key] = ex
+
+    async def aclose(self):
+        self.closed = True
+
+class Summary(BaseModel):
+    title: str
+    words: int
+
+@pytest.fixture
+def store():
+    store = RedisSessionStore(ttl_seconds=60)
+    store.client = FakeRedis()
+    return store
+
+@pytest.mark.asyncio
+async def test_redis_store_round_trips_session(store):
+    state = SessionState(session_id="s1")
+    state.static_prefix.append(ChatMessage(role="system", content="Be brief."))
+    state.add_message(role="user", content="What is 2 + 2?")
+    tool_call = {"function": {"name": "add", "arguments": {"a": 2, "b": 2}}, "id": "call_0"}
+    state.add_message(role="agent", content="", tool_calls=[tool_call])
+    state.add_message(role="tool", content="4", tool_call_id="call_0", name="add")
+    state.data["count"] = 3
+    state.data["summary"] = Summary(title="Sums", words=2)
+
+    await store.save("s1", state)
+    loaded = await store.load("s1")
+
+    assert loaded.session_id == "s1"
+    assert [msg.to_dict() for msg in loaded.history] == [msg.to_dict() for msg in state.history]
+    assert loaded.history[1].tool_calls == [tool_call]
+    assert [msg.content for msg in loaded.static_prefix] == ["Be brief."]
+    assert loaded.data["count"] == 3
+    # Pydantic models come back in their dict form
+    assert loaded.data["summary"] == {"title": "Sums", "words": 2}
+    assert store.client.expiry["astra:session:s1"] == 60
+
+@pytest.mark.asyncio
+async def test_redis_store_load_missing_session(store):
+    assert await store.load("missing") is None
+
+@pytest.mark.asyncio
+async def test_redis_store_aclose(store):
+    await store.aclose()
+    assert store.client.closed
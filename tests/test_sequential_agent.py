@@ -47,6 +47,18 @@ async def test_sequential_agent_no_keep_alive_state(session_state):
     assert len(session_state.history) == 1 # Only the last child's output remains
     assert session_state.history[0].content == "output2" # String output from child2
 
+@pytest.mark.asyncio
+async def test_sequential_agent_pruning_keeps_static_prefix(session_state):
+    prefix = ChatMessage(role="system", content="shared context")
+    session_state.static_prefix.append(prefix)
+    agent = SequentialAgent(agent_name="TestSequentialAgent",
+                            children=[MockChildAgent("Child1", "output1"), MockChildAgent("Child2", "output2")])
+
+    await agent.execute(session_state)
+
+    assert session_state.static_prefix == [prefix]
+    assert [msg.content for msg in session_state.history] == ["output2"]
+
 @pytest.mark.asyncio
 async def test_sequential_agent_keep_alive_state(session_state):
     # Child 1 returns structured output, history should NOT be cleared
@@ -68,3 +80,31 @@ async def test_sequential_agent_keep_alive_state(session_state):
     assert session_state.history[0].content == "initial prompt"
     assert json.loads(session_state.history[1].content) == {"value": "output1"}
     assert session_state.history[2].content == 'output2'
+
+@pytest.mark.asyncio
+async def test_sequential_agent_concurrent_children(session_state):
+    import asyncio
+
+    class SlowChildAgent(BaseAgent):
+        def __init__(self, agent_name: str):
+            super().__init__(agent_name)
+            self.seen_history = None
+
+        async def execute(self, state: SessionState) -> AgentResponse:
+            self.seen_history = [msg.content for msg in state.history]
+            await asyncio.sleep(0.01)
+            return AgentResponse(status="success", final_content=self.agent_name)
+
+    child1 = SlowChildAgent("Child1")
+    child2 = SlowChildAgent("Child2")
+    agent = SequentialAgent(agent_name="TestSequentialAgent", children=[child1, child2],
+                            keep_alive_state=True, concurrent=True)
+    session_state.add_message(role="user", content="initial prompt")
+
+    response = await agent.execute(session_state)
+
+    assert response.final_content == "Child2"
+    # Both children saw only the initial prompt, since they ran concurrently
+    assert child1.seen_history == ["initial prompt"]
+    assert child2.seen_history == ["initial prompt"]
+    assert [msg.content for msg in session_state.history] == ["initial prompt", "Child1", "Child2"]
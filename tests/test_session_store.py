@@ -0,0 +1,78 @@
+import pytest
+from astra_framework.core.agent import BaseAgent
+from astra_framework.core.models import AgentResponse
+from astra_framework.core.session_store import InMemorySessionStore
+from astra_framework.core.state import SessionState
+from astra_framework.manager import WorkflowManager
+
+class EchoAgent(BaseAgent):
+    async def execute(self, state: SessionState) -> AgentResponse:
+        state.add_message(role="agent", content="echo")
+        return AgentResponse(status="success", final_content="echo")
+
+@pytest.mark.asyncio
+async def test_in_memory_store_load_and_save():
+    store = InMemorySessionStore()
+    state = SessionState(session_id="s1")
+
+    assert await store.load("s1") is None
+    await store.save("s1", state)
+    assert await store.load("s1") is state
+
+@pytest.mark.asyncio
+async def test_manager_saves_session_to_store():
+    store = InMemorySessionStore()
+    manager = WorkflowManager(session_store=store)
+    manager.register_workflow("echo", EchoAgent(agent_name="echo"))
+    session_id = manager.create_session()
+
+    await manager.run("echo", session_id, "hello")
+
+    stored = await store.load(session_id)
+    assert [msg.content for msg in stored.history] == ["hello", "echo"]
+
+@pytest.mark.asyncio
+async def test_manager_loads_session_from_store():
+    store = InMemorySessionStore()
+    existing = SessionState(session_id="shared")
+    existing.add_message(role="user", content="earlier")
+    await store.save("shared", existing)
+
+    # A second manager (e.g. another worker) has never seen this session
+    manager = WorkflowManager(session_store=store)
+    manager.register_workflow("echo", EchoAgent(agent_name="echo"))
+    await manager.run("echo", "shared", "hello")
+
+    stored = await store.load("shared")
+    assert [msg.content for msg in stored.history] == ["earlier", "hello", "echo"]
+
+@pytest.mark.asyncio
+async def test_acreate_session_saves_to_store():
+    store = InMemorySessionStore()
+    manager = WorkflowManager(session_store=store)
+    session_id = await manager.acreate_session()
+
+    # Another worker sharing the store can run the session right away
+    other = WorkflowManager(session_store=store)
+    other.register_workflow("echo", EchoAgent(agent_name="echo"))
+    await other.run("echo", session_id, "hello")
+
+    stored = await store.load(session_id)
+    assert [msg.content for msg in stored.history] == ["hello", "echo"]
+
+@pytest.mark.asyncio
+async def test_manager_saves_session_when_agent_raises():
+    class FailingAgent(BaseAgent):
+        async def execute(self, state: SessionState) -> AgentResponse:
+            raise RuntimeError("boom")
+
+    store = InMemorySessionStore()
+    manager = WorkflowManager(session_store=store)
+    manager.register_workflow("fail", FailingAgent(agent_name="fail"))
+    session_id = manager.create_session()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await manager.run("fail", session_id, "hello")
+
+    stored = await store.load(session_id)
+    assert [msg.content for msg in stored.history] == ["hello"]
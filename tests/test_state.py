@@ -1,3 +1,5 @@
+import asyncio
+import pytest
 from astra_framework.core.state import SessionState, ChatMessage
 
 def test_chat_message_creation():
@@ -17,3 +19,97 @@ def test_add_message():
     assert len(state.history) == 1
     assert state.history[0].role == "user"
     assert state.history[0].content == "hello"
+
+def test_clone_isolates_history_and_data():
+    state = SessionState(session_id="test_session")
+    state.add_message(role="user", content="hello")
+    state.update_data("key", "value")
+
+    clone = state.clone()
+    clone.add_message(role="agent", content="hi")
+    clone.history[0].content = "changed"
+    clone.update_data("other", 1)
+
+    assert clone.session_id == "test_session"
+    assert len(state.history) == 1
+    assert state.history[0].content == "hello"
+    assert state.data == {"key": "value"}
+
+def test_observers_are_notified():
+    state = SessionState(session_id="test_session")
+    seen = []
+    state.subscribe(lambda s: seen.append(len(s.history)))
+
+    state.add_message(role="user", content="hello")
+
+    assert seen == [1]
+
+@pytest.mark.asyncio
+async def test_async_observers_are_scheduled():
+    state = SessionState(session_id="test_session")
+    seen = []
+
+    async def observer(s):
+        seen.append(s.session_id)
+
+    state.subscribe(observer)
+    state.update_data("key", "value")
+    assert seen == []
+
+    await asyncio.sleep(0)
+    assert seen == ["test_session"]
+
+def test_subscribe_classifies_async_observers():
+    state = SessionState(session_id="test_session")
+
+    async def async_observer(s):
+        pass
+
+    def sync_observer(s):
+        pass
+
+    state.subscribe(async_observer)
+    state.subscribe(sync_observer)
+    assert state._async_observers == {async_observer}
+    assert state.clone()._async_observers == {async_observer}
+
+    state.unsubscribe(async_observer)
+    assert state._async_observers == set()
+
+def test_extend_messages_notifies_once():
+    state = SessionState(session_id="test_session")
+    seen = []
+    state.subscribe(lambda s: seen.append(len(s.history)))
+    messages = [ChatMessage(role="user", content="hello"), ChatMessage(role="tool", content="3", tool_call_id="call_1")]
+
+    state.extend_messages(messages)
+
+    assert state.history == messages
+    assert seen == [2]
+
+def test_add_message_interns_role():
+    state = SessionState(session_id="test_session")
+    role = "".join(["critic"])
+    state.add_message(role=role, content="a")
+    state.add_message(role="".join(["critic"]), content="b")
+    assert state.history[0].role is state.history[1].role
+
+def test_chat_message_to_dict_shares_tool_calls():
+    tool_calls = [{"function": {"name": "add", "arguments": {"a": 1}}}]
+    msg = ChatMessage(role="assistant", content="", tool_calls=tool_calls)
+
+    assert msg.to_dict() == {"role": "assistant", "content": "", "tool_calls": tool_calls, "tool_call_id": None, "name": None}
+    assert msg.to_dict()["tool_calls"] is tool_calls
+
+def test_async_observers_skipped_without_running_loop():
+    state = SessionState(session_id="test_session")
+    seen = []
+
+    async def async_observer(s):
+        seen.append("async")
+
+    state.subscribe(async_observer)
+    state.subscribe(lambda s: seen.append("sync"))
+    state.add_message(role="user", content="hello")
+
+    assert seen == ["sync"]
@@ -62,3 +62,31 @@ def test_tavily_client_search_success(tavily_client):
 def test_tavily_client_search_failure(tavily_client):
     results = tavily_client.search(query="error query")
     assert results == []
+
+class MockAsyncTavilyClient:
+    def __init__(self, api_key: str):
+        self.closed = False
+    async def search(self, query: str, search_depth: str, max_results: int):
+        if "error" in query:
+            raise Exception("Tavily API error")
+        return {"results": [{"title": "Async Result", "url": "http://test.com"}]}
+    async def close(self):
+        self.closed = True
+
+@pytest.mark.asyncio
+async def test_tavily_client_asearch_reuses_client(tavily_client):
+    with patch('astra_framework.services.tavily_client.AsyncTavily', side_effect=MockAsyncTavilyClient) as mock_async_constructor:
+        results = await tavily_client.asearch(query="test query")
+        assert results[0]["title"] == "Async Result"
+        assert await tavily_client.asearch(query="error query") == []
+        assert mock_async_constructor.call_count == 1
+
+        async_client = tavily_client._async_client
+        await tavily_client.aclose()
+        assert async_client.closed
+
+@pytest.mark.asyncio
+async def test_tavily_client_search_many(tavily_client):
+    with patch('astra_framework.services.tavily_client.AsyncTavily', side_effect=MockAsyncTavilyClient):
+        results = await tavily_client.search_many(["first", "error query", "third"])
+    assert [len(result) for result in results] == [1, 0, 1]
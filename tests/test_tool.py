@@ -1,5 +1,6 @@
 import pytest
-from astra_framework.core.tool import ToolManager
+from pydantic import BaseModel
+from astra_framework.core.tool import ToolManager, _cached_type_hints, unpack_tool_call
 
 def add(a: int, b: int) -> int:
     return a + b
@@ -32,3 +33,141 @@ async def test_execute_async_tool(tool_manager):
 async def test_execute_unknown_tool(tool_manager):
     result = await tool_manager.execute_tool("unknown", a=1, b=2)
     assert "Error: Tool 'unknown' not found." in result
+
+def test_is_async_tool(tool_manager):
+    tool_manager.register(add)
+    tool_manager.register(async_add)
+    assert not tool_manager.is_async_tool("add")
+    assert tool_manager.is_async_tool("async_add")
+
+@pytest.mark.asyncio
+async def test_execute_tool_with_args_dict(tool_manager):
+    tool_manager.register(add)
+    result = await tool_manager.execute_tool("add", {"a": 1, "b": 2})
+    assert result == 3
+
+def test_execute_tool_sync(tool_manager):
+    tool_manager.register(add)
+    assert tool_manager.execute_tool_sync("add", a=1, b=2) == 3
+
+def test_execute_tool_sync_rejects_async_tool(tool_manager):
+    tool_manager.register(async_add)
+    with pytest.raises(TypeError):
+        tool_manager.execute_tool_sync("async_add", a=1, b=2)
+
+def label(name: str, args: str, func: str) -> str:
+    return f"{name}|{args}|{func}"
+
+async def async_label(name: str, args: str, func: str) -> str:
+    return f"{name}|{args}|{func}"
+
+@pytest.mark.asyncio
+async def test_execute_tool_with_framework_parameter_names(tool_manager):
+    tool_manager.register(label)
+    tool_manager.register(async_label)
+    expected = "Ada|x|f"
+    assert await tool_manager.execute_tool("label", name="Ada", args="x", func="f") == expected
+    assert await tool_manager.execute_tool("label", {"name": "Ada", "args": "x", "func": "f"}) == expected
+    assert await tool_manager.execute_tool("async_label", name="Ada", args="x", func="f") == expected
+    assert tool_manager.execute_tool_sync("label", name="Ada", args="x", func="f") == expected
+
+def test_get_tool_definitions_is_built_at_register(tool_manager):
+    tool_manager.register(add)
+    definitions = tool_manager.get_tool_definitions()
+    assert tool_manager.get_tool_definitions() is definitions
+
+    tool_manager.register(async_add)
+    assert [d["function"]["name"] for d in definitions] == ["add", "async_add"]
+
+def test_register_replaces_definition_in_place(tool_manager):
+    tool_manager.register(add)
+    tool_manager.register(async_add)
+
+    def replacement(a: int) -> int:
+        """Replacement add."""
+        return a
+    replacement.__name__ = "add"
+
+    tool_manager.register(replacement)
+    definitions = tool_manager.get_tool_definitions()
+    assert [d["function"]["name"] for d in definitions] == ["add", "async_add"]
+    assert definitions[0]["function"]["description"] == "Replacement add."
+
+def test_unpack_tool_call():
+    assert unpack_tool_call({"function": {"name": "add", "arguments": {"a": 1}}}) == ("add", {"a": 1})
+    assert unpack_tool_call({"function": {"name": "noop", "arguments": None}}) == ("noop", {})
+    assert unpack_tool_call({}) == (None, {})
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+def norm(point: Point, scale: int = 1) -> int:
+    return (abs(point.x) + abs(point.y)) * scale
+
+@pytest.mark.asyncio
+async def test_execute_tool_hydrates_pydantic_args(tool_manager):
+    tool_manager.register(norm)
+    assert await tool_manager.execute_tool("norm", {"point": {"x": 1, "y": -2}, "scale": 2}) == 6
+
+def test_tool_definition_reads_param_descriptions(tool_manager):
+    def scale(value: float, factor: int = 2) -> float:
+        """Scales a value.
+
+        :param value: The value to scale.
+        :param factor:   How much to scale by.  
+        """
+        return value * factor
+
+    tool_manager.register(scale)
+    function = tool_manager.get_tool_definitions()[0]["function"]
+
+    assert function["description"] == "Scales a value."
+    assert function["parameters"]["properties"] == {
+        "value": {"type": "number", "description": "The value to scale."},
+        "factor": {"type": "integer", "description": "How much to scale by."},
+    }
+    assert function["parameters"]["required"] == ["value"]
+
+def test_primitive_tools_skip_hydration(tool_manager):
+    tool_manager.register(add)
+    tool_manager.register(norm)
+    assert "add" not in tool_manager._hydrators
+    assert "norm" in tool_manager._hydrators
+
+def test_get_tool_definitions_without_tools_does_not_allocate(tool_manager):
+    definitions = tool_manager.get_tool_definitions()
+    assert definitions == []
+    assert tool_manager.get_tool_definitions() is definitions
+
+def test_get_parameters_matches_signature():
+    def plain(a: int, b: str) -> str:
+        return b * a
+
+    def with_defaults(a: int, *, b: str = "x") -> str:
+        return b * a
+
+    assert ToolManager._get_parameters(plain) == [("a", True), ("b", True)]
+    assert ToolManager._get_parameters(with_defaults) == [("a", True), ("b", False)]
+
+def test_tool_definitions_are_shared_between_managers():
+    first = ToolManager([add]).get_tool_definitions()[0]
+    second = ToolManager([add]).get_tool_definitions()[0]
+    assert first is second
+
+def segment_length(start: Point, end: Point) -> int:
+    return abs(end.x - start.x) + abs(end.y - start.y)
+
+@pytest.mark.asyncio
+async def test_execute_tool_hydrates_multiple_pydantic_args(tool_manager):
+    tool_manager.register(segment_length)
+    args = {"start": {"x": 0, "y": 0}, "end": Point(x=2, y=3)}
+    assert await tool_manager.execute_tool("segment_length", args) == 5
+
+def test_type_hints_resolved_once_per_function():
+    def lookup(key: str) -> str:
+        return key
+
+    hints = _cached_type_hints(lookup)
+    assert hints == {"key": str, "return": str}
+    assert _cached_type_hints(lookup) is hints
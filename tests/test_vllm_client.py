@@ -0,0 +1,54 @@
+import httpx
+import orjson
+import pytest
+from astra_framework.core.state import ChatMessage
+from astra_framework.services.vllm_client import VLLMClient
+
+def make_client(handler) -> VLLMClient:
+    client = VLLMClient(model="test_model")
+    client.client = httpx.AsyncClient(base_url="http://vllm.test", transport=httpx.MockTransport(handler))
+    return client
+
+@pytest.mark.asyncio
+async def test_vllm_client_generate_text_response():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(orjson.loads(request.content))
+        return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": "Hello from vLLM!"}}]})
+
+    client = make_client(handler)
+    history = [
+        ChatMessage(role="user", content="add 1 and 2"),
+        ChatMessage(role="agent", content="", tool_calls=[{"function": {"name": "add", "arguments": {"a": 1, "b": 2}}}]),
+        ChatMessage(role="tool", content="3", tool_call_id="call_0"),
+    ]
+
+    assert await client.generate(history, []) == "Hello from vLLM!"
+
+    messages = requests[0]["messages"]
+    assert "tools" not in requests[0]
+    assert messages[1]["role"] == "assistant"
+    assert messages[1]["tool_calls"][0]["function"]["arguments"] == '{"a":1,"b":2}'
+    assert messages[2]["tool_call_id"] == "call_0"
+
+@pytest.mark.asyncio
+async def test_vllm_client_generate_tool_call():
+    def handler(request: httpx.Request) -> httpx.Response:
+        tool_call = {"id": "call_1", "type": "function", "function": {"name": "add", "arguments": '{"a": 1}'}}
+        return httpx.Response(200, json={"choices": [{"message": {"content": None, "tool_calls": [tool_call]}}]})
+
+    client = make_client(handler)
+    response = await client.generate([ChatMessage(role="user", content="use tool")], [{"name": "add"}])
+
+    assert response["content"] == ""
+    assert response["tool_calls"][0]["function"]["arguments"] == {"a": 1}
+
+@pytest.mark.asyncio
+async def test_vllm_client_generate_connection_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused")
+
+    client = make_client(handler)
+    response = await client.generate([ChatMessage(role="user", content="hi")], [])
+    assert "Error: Could not connect to vLLM." in response
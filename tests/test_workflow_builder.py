@@ -0,0 +1,20 @@
+import pytest
+from astra_framework.builders.workflow_builder import WorkflowBuilder
+from astra_framework.core.agent import BaseAgent, CompositeAgent
+from astra_framework.core.state import SessionState
+from astra_framework.core.models import AgentResponse
+
+class DummyAgent(BaseAgent):
+    async def execute(self, state: SessionState) -> AgentResponse:
+        return AgentResponse(status="success", final_content="dummy response")
+
+def test_add_agent_appends_to_sequential_root():
+    child = DummyAgent(agent_name="child")
+    workflow = WorkflowBuilder("test").start_with_sequential("root").add_agent(child).build()
+
+    assert isinstance(workflow, CompositeAgent)
+    assert workflow.children == [child]
+
+def test_add_agent_without_composite_raises():
+    with pytest.raises(ValueError):
+        WorkflowBuilder("test").add_agent(DummyAgent(agent_name="child"))